@@ -1,8 +1,9 @@
 __all__ = ["PredictionIntervals", "TransferConformal", "estimate_density_ratio"]
 
+import hashlib
 import warnings
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Union
 
 import narwhals as nw
 import numpy as np
@@ -12,7 +13,21 @@ from utilsforecast.compat import DFType
 
 
 class PredictionIntervals:
-    """Class for storing prediction intervals metadata information."""
+    """Class for storing prediction intervals metadata information.
+
+    Args:
+        n_windows (int): Number of cross-validation windows used to compute the
+            conformity scores. Defaults to 2.
+        h (int): Forecast horizon of the cross-validation windows. Defaults to 1.
+        method (str): Conformal method used to build the intervals.
+            Defaults to 'conformal_distribution'.
+        scale_estimator (str, optional): Per-series scale ('mad' or 'std') used to
+            normalize the conformity scores for transfer learning. Defaults to None.
+        levels (list of int or float, optional): Levels whose interval widths are
+            precomputed at fit time. It only speeds up the levels in this list:
+            any other level requested at predict time falls back to computing
+            the quantiles from the conformity scores. Defaults to None.
+    """
 
     def __init__(
         self,
@@ -20,6 +35,7 @@ class PredictionIntervals:
         h: int = 1,
         method: str = "conformal_distribution",
         scale_estimator: Optional[Literal["mad", "std"]] = None,
+        levels: Optional[List[Union[int, float]]] = None,
     ):
         if n_windows < 2:
             raise ValueError(
@@ -37,15 +53,23 @@ class PredictionIntervals:
             raise ValueError(
                 f"scale_estimator must be 'mad', 'std', or None, got '{scale_estimator}'"
             )
+        if levels is not None:
+            if not levels or any(not 0 < lv < 100 for lv in levels):
+                raise ValueError("levels must be a non-empty list of values in (0, 100)")
+            # the intervals of these levels are precomputed at fit time, any
+            # other level is computed from the conformity scores at predict time
+            levels = sorted(set(levels))
         self.n_windows = n_windows
         self.h = h
         self.method = method
         self.scale_estimator = scale_estimator
+        self.levels = levels
 
     def __repr__(self):
         return (
             f"PredictionIntervals(n_windows={self.n_windows}, h={self.h}, "
-            f"method='{self.method}', scale_estimator={self.scale_estimator!r})"
+            f"method='{self.method}', scale_estimator={self.scale_estimator!r}, "
+            f"levels={self.levels!r})"
         )
 
 
@@ -197,17 +221,21 @@ def _compute_series_scales(
 
 
 def _apply_scale_alignment(
-    cs_df: DFType,
+    cs_df: Union[DFType, "_ScoreStore"],
     model_names: List[str],
     id_col: str,
     source_scales: Dict,
-) -> DFType:
+) -> Union[DFType, "_ScoreStore"]:
     """Normalize source residuals by per-series source scale.
 
     For each source row: normalized_residual = residual / σ̂_src(uid).
     The per-target-series σ̂_tgt multiplication is applied post-hoc in
     ``predict()`` after the quantile step.  Returns a copy; does not mutate.
     """
+    if isinstance(cs_df, _ScoreStore):
+        uids = nw.from_native(cs_df.uids, series_only=True).to_list()
+        norm = np.array([1.0 / source_scales[uid] for uid in uids], dtype=float)
+        return cs_df.with_scores(cs_df.scores * norm[:, np.newaxis])
     cs_df = ufp.copy_if_pandas(cs_df, deep=False)
     uid_arr = cs_df[id_col].to_numpy()
     # hash-based factorization: avoids np.unique's O(n log n) sort on string ids
@@ -244,6 +272,245 @@ def _rescale_interval_columns(
     return fcst_df
 
 
+@dataclass
+class _ScoreStore:
+    """Conformity scores of the calibration windows stored as a single array.
+
+    ``scores`` has shape ``(n_models, n_windows, n_series, h)`` and is kept as
+    float32, which halves the memory of the scores and drops the ids and times
+    that the scores frame repeats on every row. ``uids`` holds the series ids in
+    the order of the scores.
+
+    The weighted methods also keep the model features of every score row in
+    ``features``, a float32 array with one column per name in ``feature_names``
+    and the rows in the order of the flattened scores of a model."""
+
+    scores: np.ndarray
+    model_names: List[str]
+    uids: Any
+    id_col: str
+    features: Optional[np.ndarray] = None
+    feature_names: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_frame(
+        cls,
+        cs_df: DFType,
+        model_names: List[str],
+        id_col: str,
+        n_windows: int,
+        h: int,
+        feature_cols: Optional[List[str]] = None,
+    ) -> "_ScoreStore":
+        n_series = len(cs_df) // (n_windows * h)
+        scores = np.empty((len(model_names), n_windows, n_series, h), dtype=np.float32)
+        for i, model in enumerate(model_names):
+            scores[i] = cs_df[model].to_numpy().reshape(n_windows, n_series, h)
+        uids = nw.from_native(cs_df, eager_only=True)[id_col][np.arange(n_series) * h]
+        features = None
+        if feature_cols:
+            features = np.empty((len(cs_df), len(feature_cols)), dtype=np.float32)
+            for i, col in enumerate(feature_cols):
+                values = cs_df[col].to_numpy()
+                try:
+                    features[:, i] = values
+                except (TypeError, ValueError):
+                    # features that aren't numbers, e.g. string statics, by code
+                    codes = pd.factorize(values)[0]
+                    features[:, i] = np.where(codes >= 0, codes, np.nan)
+        return cls(
+            scores=scores,
+            model_names=list(model_names),
+            uids=nw.to_native(uids),
+            id_col=id_col,
+            features=features,
+            feature_names=list(feature_cols or []),
+        )
+
+    def __len__(self) -> int:
+        return self.scores[0].size
+
+    @property
+    def n_series(self) -> int:
+        return self.scores.shape[2]
+
+    def model_scores(self, model: str) -> np.ndarray:
+        """Scores of `model` with shape ``(n_windows, n_series, h)``."""
+        return self.scores[self.model_names.index(model)]
+
+    def flat_scores(self, model: str) -> np.ndarray:
+        """Scores of `model` in the order of the rows of the scores frame."""
+        return self.model_scores(model).ravel().astype(np.float64)
+
+    def with_scores(self, scores: np.ndarray) -> "_ScoreStore":
+        """Store with the same series and features and other `scores`."""
+        return replace(self, scores=scores)
+
+    def take(self, ids: List[str]) -> "_ScoreStore":
+        """Scores of the series in `ids`, in the order of the store."""
+        mask = np.asarray(ufp.is_in(self.uids, ids))
+        features = self.features
+        if features is not None:
+            _, n_windows, _, h = self.scores.shape
+            features = features[np.tile(np.repeat(mask, h), n_windows)]
+        return _ScoreStore(
+            scores=self.scores[:, :, mask],
+            model_names=self.model_names,
+            uids=ufp.filter_with_mask(self.uids, mask),
+            id_col=self.id_col,
+            features=features,
+            feature_names=self.feature_names,
+        )
+
+    def to_frame(self) -> DFType:
+        """Frame with the id and model columns in the order of the scores."""
+        _, n_windows, n_series, h = self.scores.shape
+        uids = nw.from_native(self.uids, series_only=True)
+        backend = nw.get_native_namespace(uids)
+        rows = np.tile(np.repeat(np.arange(n_series), h), n_windows)
+        frame = uids[rows].to_frame()
+        for model, scores in zip(self.model_names, self.scores):
+            frame = frame.with_columns(
+                nw.new_series(model, scores.ravel(), backend=backend)
+            )
+        for i, name in enumerate(self.feature_names):
+            frame = frame.with_columns(
+                nw.new_series(name, self.features[:, i], backend=backend)
+            )
+        return ufp.drop_index_if_pandas(nw.to_native(frame))
+
+
+def _score_array(
+    cs_df: Union[DFType, _ScoreStore],
+    model: str,
+    n_windows: int,
+    n_series: int,
+    h: int,
+) -> np.ndarray:
+    """Scores of `model` in `cs_df` with shape ``(n_windows, n_series, h)``."""
+    if isinstance(cs_df, _ScoreStore):
+        return cs_df.model_scores(model).astype(np.float64)
+    return cs_df[model].to_numpy().reshape(n_windows, n_series, h)
+
+
+def _score_features(
+    cs_df: Union[DFType, _ScoreStore], non_feature_cols: Set[str]
+) -> Tuple[List[str], Optional[np.ndarray]]:
+    """Names of the feature columns stored with the scores and their values."""
+    if isinstance(cs_df, _ScoreStore):
+        return cs_df.feature_names, cs_df.features
+    feature_cols = [c for c in cs_df.columns if c not in non_feature_cols]
+    if not feature_cols:
+        return feature_cols, None
+    return feature_cols, np.column_stack([cs_df[c].to_numpy() for c in feature_cols])
+
+
+@dataclass
+class _QuantileTable:
+    """Interval half-widths computed at fit time for a grid of levels.
+
+    ``widths[model]`` has shape ``(n_levels, n_series, h)``: the level's
+    interval of a series at a step is its forecast plus/minus the width. Both
+    conformal methods produce symmetric intervals, so a single table covers
+    the lower and upper bounds."""
+
+    levels: np.ndarray
+    widths: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_scores(
+        cls,
+        cs_df: DFType,
+        model_names: List[str],
+        levels: List[Union[int, float]],
+        method: str,
+        n_windows: int,
+        h: int,
+    ) -> "_QuantileTable":
+        levels_arr = np.asarray(sorted(levels), dtype=float)
+        if method.endswith("conformal_error"):
+            cuts = levels_arr / 100
+        else:
+            # the quantiles of the paths mean +/- scores are the mean plus
+            # the quantiles of the symmetric scores
+            cuts = 1 - (100 - levels_arr) / 200
+        n_series = len(cs_df) // (n_windows * h)
+        widths = {}
+        for model in model_names:
+            scores = _score_array(cs_df, model, n_windows, n_series, h)
+            if method.endswith("conformal_error"):
+                widths[model] = np.quantile(scores, cuts, axis=0)
+            else:
+                widths[model] = _symmetric_quantiles(scores, cuts)
+        return cls(levels=levels_arr, widths=widths)
+
+    def covers(self, level: List[Union[int, float]]) -> bool:
+        """Whether every level in `level` is in the grid."""
+        return bool(np.isin(np.asarray(level, dtype=float), self.levels).all())
+
+    def interval_widths(
+        self, model: str, level: List[Union[int, float]], horizon: int
+    ) -> np.ndarray:
+        """Widths of ``level`` for the first ``horizon`` steps.
+
+        Returns an array with shape ``(n_levels, n_series * horizon)``. Every
+        level should be in the grid (see `covers`)."""
+        table = self.widths[model][:, :, :horizon]
+        table = table.reshape(table.shape[0], -1)
+        idxs = np.searchsorted(self.levels, np.asarray(level, dtype=float))
+        return table[idxs]
+
+
+def _add_table_intervals(
+    fcst_df: DFType,
+    table: _QuantileTable,
+    model_names: List[str],
+    level: List[Union[int, float]],
+    horizon: int,
+) -> DFType:
+    """Adds conformal intervals to a `fcst_df` from the widths in `table`.
+
+    `level` should be already sorted and every level should be in the table."""
+    fcst_df = ufp.copy_if_pandas(fcst_df, deep=False)
+    for model in model_names:
+        mean = fcst_df[model].to_numpy().ravel()
+        widths = table.interval_widths(model, level, horizon)
+        lo_cols = [f"{model}-lo-{lv}" for lv in reversed(level)]
+        hi_cols = [f"{model}-hi-{lv}" for lv in level]
+        intervals = np.vstack([mean - widths[::-1], mean + widths]).T
+        fcst_df = ufp.assign_columns(fcst_df, lo_cols + hi_cols, intervals)
+    return fcst_df
+
+
+def _symmetric_quantiles(scores: np.ndarray, cuts: List[float]) -> np.ndarray:
+    """Quantiles over the first axis of the scores together with their negatives.
+
+    Equivalent to ``np.quantile(np.concatenate([-scores, scores]), cuts, axis=0)``
+    but only partitions the scores around the order statistics that the cuts
+    need instead of building and sorting the symmetric set."""
+    if np.isnan(scores).any():
+        return np.quantile(np.concatenate([-scores, scores]), cuts, axis=0)
+    # {-s, s} is the same set as {-|s|, |s|}
+    scores = np.abs(scores)
+    n = scores.shape[0]
+    # linear interpolation between the order statistics of the 2n values
+    pos = np.asarray(cuts, dtype=float) * (2 * n - 1)
+    lower = np.floor(pos).astype(np.intp)
+    upper = np.minimum(lower + 1, 2 * n - 1)
+    frac = (pos - lower).reshape(-1, *(1,) * (scores.ndim - 1))
+    # with the scores sorted, the k-th smallest symmetric value is
+    # -scores[n - 1 - k] if k < n else scores[k - n]
+    lower_src = np.where(lower < n, n - 1 - lower, lower - n)
+    upper_src = np.where(upper < n, n - 1 - upper, upper - n)
+    part = np.partition(scores, np.union1d(lower_src, upper_src), axis=0)
+    sign_shape = (-1, *(1,) * (scores.ndim - 1))
+    a = np.where(lower < n, -1.0, 1.0).reshape(sign_shape) * part[lower_src]
+    b = np.where(upper < n, -1.0, 1.0).reshape(sign_shape) * part[upper_src]
+    diff = b - a
+    # same interpolation as np.quantile's default method
+    return np.where(frac >= 0.5, b - diff * (1 - frac), a + diff * frac)
+
+
 def _add_conformal_distribution_intervals(
     fcst_df: DFType,
     cs_df: DFType,
@@ -266,7 +533,7 @@ def _add_conformal_distribution_intervals(
     cuts = [alpha / 200 for alpha in reversed(alphas)]
     cuts.extend(1 - alpha / 200 for alpha in alphas)
     for model in model_names:
-        scores = cs_df[model].to_numpy().reshape(cs_n_windows, n_series, cs_h)
+        scores = _score_array(cs_df, model, cs_n_windows, n_series, cs_h)
         # restrict scores to horizon
         scores = scores[:, :, :horizon]
         mean_flat = fcst_df[model].to_numpy().ravel()
@@ -275,8 +542,7 @@ def _add_conformal_distribution_intervals(
             # Transfer scenario: pool all source calibration points globally.
             # quantile(mean_t + {-s_i, +s_i}) = mean_t + quantile({-s_i, +s_i})
             scores_pooled = scores.reshape(cs_n_windows * n_series, horizon)
-            sym_scores = np.vstack([-scores_pooled, scores_pooled])
-            global_q = np.quantile(sym_scores, cuts, axis=0)  # (n_cuts, horizon)
+            global_q = _symmetric_quantiles(scores_pooled, cuts)  # (n_cuts, horizon)
             mean_2d = mean_flat.reshape(n_target, horizon)
             quantiles = (
                 (global_q[:, np.newaxis, :] + mean_2d[np.newaxis, :, :])
@@ -284,10 +550,9 @@ def _add_conformal_distribution_intervals(
                 .T
             )  # (n_target * horizon, n_cuts)
         else:
-            mean = mean_flat.reshape(1, n_series, -1)
-            paths = np.vstack([mean - scores, mean + scores])
-            quantiles = np.quantile(paths, cuts, axis=0)
-            quantiles = quantiles.reshape(len(cuts), -1).T
+            # quantile(mean +/- scores) = mean + quantile(+/- scores)
+            quantiles = _symmetric_quantiles(scores, cuts).reshape(len(cuts), -1)
+            quantiles = (quantiles + mean_flat).T
         lo_cols = [f"{model}-lo-{lv}" for lv in reversed(level)]
         hi_cols = [f"{model}-hi-{lv}" for lv in level]
         out_cols = lo_cols + hi_cols
@@ -316,7 +581,7 @@ def _add_conformal_error_intervals(
     cuts = [lv / 100 for lv in level]
     for model in model_names:
         mean = fcst_df[model].to_numpy().ravel()
-        scores = cs_df[model].to_numpy().reshape(cs_n_windows, n_series, cs_h)
+        scores = _score_array(cs_df, model, cs_n_windows, n_series, cs_h)
         # restrict scores to horizon
         scores = scores[:, :, :horizon]
         n_target = len(mean) // horizon
@@ -447,16 +712,52 @@ def _weighted_quantiles(
     ``searchsorted`` — preserving the scalar version's ``side='left'``
     tie-breaking exactly. Returns an array aligned with ``alphas``.
     """
-    total = weights.sum() + w_test
-    sort_idx = np.argsort(values)
-    sorted_vals = np.append(values[sort_idx], np.inf)
-    sorted_w = np.append(weights[sort_idx] / total, w_test / total)
-    cum_w = np.cumsum(sorted_w)
+    return _batched_weighted_quantiles(
+        values[np.newaxis], weights[np.newaxis], alphas, w_test
+    )[:, 0]
+
+
+def _batched_weighted_quantiles(
+    values: np.ndarray,
+    weights: np.ndarray,
+    alphas: np.ndarray,
+    w_test: float = 1.0,
+) -> np.ndarray:
+    """:func:`_weighted_quantiles` of every row of the 2D ``values`` and ``weights``.
+
+    Sorts and cumsums all the rows at once. Returns an array with shape
+    ``(n_alphas, n_rows)``.
+    """
+    values = np.ascontiguousarray(values, dtype=float)
+    weights = np.ascontiguousarray(weights, dtype=float)
+    n_rows = values.shape[0]
+    total = weights.sum(axis=1, keepdims=True) + w_test
+    sort_idx = np.argsort(values, axis=1)
+    sorted_vals = np.hstack(
+        [np.take_along_axis(values, sort_idx, axis=1), np.full((n_rows, 1), np.inf)]
+    )
+    sorted_w = np.hstack(
+        [np.take_along_axis(weights, sort_idx, axis=1) / total, w_test / total]
+    )
+    cum_w = np.cumsum(sorted_w, axis=1)
     # NOTE: callers pass alphas (= 1 - cuts), not cuts; the 1.0 - alphas
     # round-trip reproduces the reference's exact float rounding, which is
     # load-bearing for tie-boundary index selection. Don't "simplify" it.
-    idx = np.searchsorted(cum_w, 1.0 - np.asarray(alphas, dtype=float), side="left")
-    return sorted_vals[idx]
+    targets = 1.0 - np.asarray(alphas, dtype=float)
+    # searchsorted with side='left' on every row at once: bisect all the
+    # (row, alpha) pairs together until each finds the first cumulative
+    # weight that isn't below its target
+    lo = np.zeros((n_rows, targets.size), dtype=np.intp)
+    hi = np.full_like(lo, cum_w.shape[1])
+    while True:
+        active = lo < hi
+        if not active.any():
+            break
+        mid = (lo + hi) // 2
+        below = np.take_along_axis(cum_w, np.minimum(mid, hi - 1), axis=1) < targets
+        lo = np.where(active & below, mid + 1, lo)
+        hi = np.where(active & ~below, mid, hi)
+    return np.take_along_axis(sorted_vals, lo, axis=1).T
 
 
 def _weighted_quantile(
@@ -493,7 +794,7 @@ def _add_weighted_conformal_error_intervals(
     cuts = [lv / 100 for lv in level]
     for model in model_names:
         mean = fcst_df[model].to_numpy().ravel()
-        scores = cs_df[model].to_numpy().reshape(cs_n_windows, n_series, cs_h)
+        scores = _score_array(cs_df, model, cs_n_windows, n_series, cs_h)
         scores = scores[:, :, :horizon]
         n_target = len(mean) // horizon
         if is_transfer:
@@ -514,12 +815,10 @@ def _add_weighted_conformal_error_intervals(
                     else float(w_pooled.mean())
                 )
                 alphas = 1.0 - np.asarray(cuts)
-                quantiles = np.empty((len(cuts), n_target * horizon))
-                for h_i in range(horizon):
-                    q = _weighted_quantiles(
-                        scores_pooled[:, h_i], w_pooled[:, h_i], alphas, w_test
-                    )
-                    quantiles[:, h_i::horizon] = q[:, np.newaxis]
+                q = _batched_weighted_quantiles(
+                    scores_pooled.T, w_pooled.T, alphas, w_test
+                )  # (n_levels, horizon)
+                quantiles = np.tile(q, (1, n_target))
         elif weights is None:
             quantiles = np.quantile(scores, cuts, axis=0)
             quantiles = quantiles.reshape(len(cuts), -1)
@@ -527,12 +826,10 @@ def _add_weighted_conformal_error_intervals(
             w = weights.reshape(cs_n_windows, n_series, cs_h)[:, :, :horizon]
             w_test = float(w.mean())
             alphas = 1.0 - np.asarray(cuts)
-            quantiles = np.empty((len(cuts), n_series * horizon))
-            for h_i in range(horizon):
-                q = _weighted_quantiles(
-                    scores[:, :, h_i].ravel(), w[:, :, h_i].ravel(), alphas, w_test
-                )
-                quantiles[:, h_i::horizon] = q[:, np.newaxis]
+            q = _batched_weighted_quantiles(
+                scores.reshape(-1, horizon).T, w.reshape(-1, horizon).T, alphas, w_test
+            )  # (n_levels, horizon)
+            quantiles = np.tile(q, (1, n_series))
         lo_cols = [f"{model}-lo-{lv}" for lv in reversed(level)]
         hi_cols = [f"{model}-hi-{lv}" for lv in level]
         quantiles_out = np.vstack([mean - quantiles[::-1], mean + quantiles]).T
@@ -563,7 +860,7 @@ def _add_weighted_conformal_distribution_intervals(
     cuts = [alpha / 200 for alpha in reversed(alphas)]
     cuts.extend(1 - alpha / 200 for alpha in alphas)
     for model in model_names:
-        scores = cs_df[model].to_numpy().reshape(cs_n_windows, n_series, cs_h)
+        scores = _score_array(cs_df, model, cs_n_windows, n_series, cs_h)
         scores = scores[:, :, :horizon]
         mean_flat = fcst_df[model].to_numpy().ravel()
         n_target = len(mean_flat) // horizon
@@ -573,8 +870,7 @@ def _add_weighted_conformal_distribution_intervals(
             scores_pooled = scores.reshape(cs_n_windows * n_series, horizon)
             mean_2d = mean_flat.reshape(n_target, horizon)
             if weights is None:
-                sym_scores = np.vstack([-scores_pooled, scores_pooled])
-                global_q = np.quantile(sym_scores, cuts, axis=0)  # (n_cuts, horizon)
+                global_q = _symmetric_quantiles(scores_pooled, cuts)  # (n_cuts, horizon)
                 quantiles = (
                     (global_q[:, np.newaxis, :] + mean_2d[np.newaxis, :, :])
                     .reshape(len(cuts), -1)
@@ -591,14 +887,14 @@ def _add_weighted_conformal_distribution_intervals(
                 # Offsets: {-s_i, +s_i} for each horizon step
                 sym_scores = np.vstack([-scores_pooled, scores_pooled])
                 cut_alphas = 1.0 - np.asarray(cuts)
-                quantiles = np.empty((n_target * horizon, len(cuts)))
-                for h_i in range(horizon):
-                    q_offsets = _weighted_quantiles(
-                        sym_scores[:, h_i], w_double[:, h_i], cut_alphas, w_test
-                    )
-                    quantiles[h_i::horizon, :] = (
-                        mean_2d[:, h_i][:, np.newaxis] + q_offsets[np.newaxis, :]
-                    )
+                q_offsets = _batched_weighted_quantiles(
+                    sym_scores.T, w_double.T, cut_alphas, w_test
+                )  # (n_cuts, horizon)
+                quantiles = (
+                    (q_offsets[:, np.newaxis, :] + mean_2d[np.newaxis, :, :])
+                    .reshape(len(cuts), -1)
+                    .T
+                )  # (n_target * horizon, n_cuts)
         else:
             mean = mean_flat.reshape(1, n_series, -1)
             paths = np.vstack(
@@ -612,15 +908,13 @@ def _add_weighted_conformal_distribution_intervals(
                 w_double = np.vstack([w, w])  # replicate for both path directions
                 w_test = float(w.mean())
                 cut_alphas = 1.0 - np.asarray(cuts)
-                quantiles = np.empty((n_series * horizon, len(cuts)))
-                for h_i in range(horizon):
-                    q = _weighted_quantiles(
-                        paths[:, :, h_i].ravel(),
-                        w_double[:, :, h_i].ravel(),
-                        cut_alphas,
-                        w_test,
-                    )
-                    quantiles[h_i::horizon, :] = q[np.newaxis, :]
+                q = _batched_weighted_quantiles(
+                    paths.reshape(-1, horizon).T,
+                    w_double.reshape(-1, horizon).T,
+                    cut_alphas,
+                    w_test,
+                )  # (n_cuts, horizon)
+                quantiles = np.tile(q, (1, n_series)).T
         lo_cols = [f"{model}-lo-{lv}" for lv in reversed(level)]
         hi_cols = [f"{model}-hi-{lv}" for lv in level]
         fcst_df = ufp.assign_columns(fcst_df, lo_cols + hi_cols, quantiles)
@@ -738,6 +1032,57 @@ def estimate_density_ratio(
     return source_weights
 
 
+@dataclass
+class _DensityRatioCache:
+    """Density ratio weights of recent transfer targets, keyed by a fingerprint.
+
+    The fingerprint covers the source and target features and the settings of
+    the estimator, so a repeated prediction against the same target reuses the
+    weights instead of refitting the classifiers. Only the last ``maxsize``
+    targets are kept."""
+
+    maxsize: int = 4
+    entries: Dict[str, Tuple[np.ndarray, np.ndarray]] = field(default_factory=dict)
+
+    @staticmethod
+    def fingerprint(
+        source_features: np.ndarray,
+        target_features: np.ndarray,
+        tc: "TransferConformal",
+    ) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        for arr in (source_features, target_features):
+            arr = np.ascontiguousarray(arr, dtype=float)
+            digest.update(repr(arr.shape).encode())
+            digest.update(arr.tobytes())
+        digest.update(repr((tc.dre_estimator, tc.cv, tc.clip_quantile)).encode())
+        return digest.hexdigest()
+
+    def weights(
+        self,
+        source_features: np.ndarray,
+        target_features: np.ndarray,
+        tc: "TransferConformal",
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Source and target weights, estimated only if the key isn't cached."""
+        key = self.fingerprint(source_features, target_features, tc)
+        if key not in self.entries:
+            if len(self.entries) >= self.maxsize:
+                self.entries.pop(next(iter(self.entries)))
+            self.entries[key] = estimate_density_ratio(
+                source_features,
+                target_features,
+                estimator=tc.dre_estimator,
+                cv=tc.cv,
+                clip_quantile=tc.clip_quantile,
+                return_target_weights=True,
+            )
+        return self.entries[key]
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
 _INTERVAL_METHODS: Dict[str, Callable[..., Any]] = {
     "conformal_distribution": _add_conformal_distribution_intervals,
     "conformal_error": _add_conformal_error_intervals,
@@ -794,6 +1139,7 @@ class _TransferMethodSpec:
     needs_preprocess: bool = False
     needs_source_cs: bool = False
     runs_target_cv: bool = False
+    uses_dre: bool = False
 
 
 @dataclass
@@ -805,7 +1151,7 @@ class TransferResult:
     local variable — no instance state, no ``finally`` reset needed.
     """
 
-    cs_df: DFType
+    cs_df: Union[DFType, _ScoreStore]
     weights: Optional[np.ndarray] = None
     target_scales: Optional[Dict[str, float]] = None  # uid -> sigma_tgt
     target_weights: Optional[np.ndarray] = None
@@ -849,7 +1195,7 @@ def _recalibrate_transfer(
     id_col: str = "unique_id",  # noqa: ARG001
     time_col: str = "ds",  # noqa: ARG001
     preprocess_fn: Optional[Callable] = None,  # noqa: ARG001
-    source_cs_df: Optional[DFType] = None,  # noqa: ARG001
+    source_cs_df: Optional[Union[DFType, _ScoreStore]] = None,  # noqa: ARG001
     source_scales: Optional[Dict] = None,  # noqa: ARG001
 ) -> TransferResult:
     """Recompute conformity scores from frozen-model backtest on new_df.
@@ -883,8 +1229,9 @@ def _weighted_conformal_transfer(
     id_col: str = "unique_id",
     time_col: str = "ds",
     preprocess_fn: Optional[Callable] = None,
-    source_cs_df: Optional[DFType] = None,
+    source_cs_df: Optional[Union[DFType, _ScoreStore]] = None,
     source_scales: Optional[Dict] = None,  # noqa: ARG001
+    dre_cache: Optional[_DensityRatioCache] = None,
 ) -> TransferResult:
     """Compute DRE weights for source conformity scores under covariate shift.
 
@@ -896,7 +1243,8 @@ def _weighted_conformal_transfer(
     using source residuals with weighted quantiles.
 
     Requires ``preprocess_fn`` (``MLForecast.preprocess``) and
-    ``source_cs_df`` (the existing ``_cs_df``) to be provided.
+    ``source_cs_df`` (the existing ``_cs_df``) to be provided. When
+    ``dre_cache`` is given the weights of a previously seen target are reused.
     """
     if preprocess_fn is None or source_cs_df is None:
         raise ValueError(
@@ -906,7 +1254,7 @@ def _weighted_conformal_transfer(
         )
 
     non_feature_cols = set(list(model_names) + [id_col, time_col, "cutoff"])
-    feature_cols = [c for c in source_cs_df.columns if c not in non_feature_cols]
+    feature_cols, src_features = _score_features(source_cs_df, non_feature_cols)
 
     if not feature_cols:
         raise ValueError(
@@ -927,21 +1275,16 @@ def _weighted_conformal_transfer(
             stacklevel=2,
         )
 
-    src_np = np.column_stack(
-        [source_cs_df[c].to_numpy() for c in tgt_feature_cols]
-    ).astype(float)
+    src_np = src_features[
+        :, [feature_cols.index(c) for c in tgt_feature_cols]
+    ].astype(float)
     tgt_np = np.column_stack(
         [tgt_preprocessed[c].to_numpy() for c in tgt_feature_cols]
     ).astype(float)
 
-    weights, target_weights = estimate_density_ratio(
-        src_np,
-        tgt_np,
-        estimator=tc.dre_estimator,
-        cv=tc.cv,
-        clip_quantile=tc.clip_quantile,
-        return_target_weights=True,
-    )
+    if dre_cache is None:
+        dre_cache = _DensityRatioCache(maxsize=1)
+    weights, target_weights = dre_cache.weights(src_np, tgt_np, tc)
     return TransferResult(
         cs_df=source_cs_df, weights=weights, target_weights=target_weights
     )
@@ -957,7 +1300,7 @@ def _scale_aligned_transfer(
     id_col: str = "unique_id",
     time_col: str = "ds",
     preprocess_fn: Optional[Callable] = None,  # noqa: ARG001
-    source_cs_df: Optional[DFType] = None,
+    source_cs_df: Optional[Union[DFType, _ScoreStore]] = None,
     source_scales: Optional[Dict] = None,
 ) -> TransferResult:
     """Zero-shot scale alignment: compute σ̂_target per series from new_df y history.
@@ -996,8 +1339,9 @@ def _scale_aligned_weighted_transfer(
     id_col: str = "unique_id",
     time_col: str = "ds",
     preprocess_fn: Optional[Callable] = None,
-    source_cs_df: Optional[DFType] = None,
+    source_cs_df: Optional[Union[DFType, _ScoreStore]] = None,
     source_scales: Optional[Dict] = None,
+    dre_cache: Optional[_DensityRatioCache] = None,
 ) -> TransferResult:
     """Compose scale alignment with DRE weighting.
 
@@ -1020,6 +1364,7 @@ def _scale_aligned_weighted_transfer(
         preprocess_fn=preprocess_fn,
         source_cs_df=source_cs_df,
         source_scales=source_scales,
+        dre_cache=dre_cache,
     )
     sa_result = _scale_aligned_transfer(
         new_df=new_df,
@@ -1050,7 +1395,7 @@ def _error_scaled_transfer(
     id_col: str = "unique_id",  # noqa: ARG001
     time_col: str = "ds",  # noqa: ARG001
     preprocess_fn: Optional[Callable] = None,  # noqa: ARG001
-    source_cs_df: Optional[DFType] = None,
+    source_cs_df: Optional[Union[DFType, _ScoreStore]] = None,
     source_scales: Optional[Dict] = None,  # noqa: ARG001
 ) -> TransferResult:
     """Scale source conformity scores by a single global IQR ratio (target / source).
@@ -1067,6 +1412,15 @@ def _error_scaled_transfer(
         )
     target_cs_df = compute_conformity_scores(backtest_results, model_names, target_col)
 
+    if isinstance(source_cs_df, _ScoreStore):
+        scaled_scores = np.empty(source_cs_df.scores.shape)
+        for i, model in enumerate(source_cs_df.model_names):
+            src = source_cs_df.flat_scores(model)
+            tgt = target_cs_df[model].to_numpy().astype(float)
+            scale = _robust_scale_ratio(src, tgt)
+            scaled_scores[i] = (src * scale).reshape(scaled_scores.shape[1:])
+        return TransferResult(cs_df=source_cs_df.with_scores(scaled_scores))
+
     scaled = ufp.copy_if_pandas(source_cs_df, deep=False)
     for model in model_names:
         src = source_cs_df[model].to_numpy().astype(float)
@@ -1086,6 +1440,7 @@ _TRANSFER_METHODS: Dict[str, _TransferMethodSpec] = {
         fn=_weighted_conformal_transfer,
         needs_preprocess=True,
         needs_source_cs=True,
+        uses_dre=True,
     ),
     "scale_aligned": _TransferMethodSpec(
         fn=_scale_aligned_transfer,
@@ -1095,6 +1450,7 @@ _TRANSFER_METHODS: Dict[str, _TransferMethodSpec] = {
         fn=_scale_aligned_weighted_transfer,
         needs_preprocess=True,
         needs_source_cs=True,
+        uses_dre=True,
     ),
     "error_scaled": _TransferMethodSpec(
         fn=_error_scaled_transfer,
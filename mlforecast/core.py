@@ -1,8 +1,10 @@
 __all__ = ["TimeSeries"]
 
 
+import concurrent.futures
 import copy
 import inspect
+import pickle
 import reprlib
 import warnings
 from collections import Counter, OrderedDict
@@ -28,6 +30,7 @@ import narwhals as nw
 import numpy as np
 import pandas as pd
 import utilsforecast.processing as ufp
+from fsspec.implementations.local import LocalFileSystem
 from sklearn.base import BaseEstimator
 from sklearn.pipeline import Pipeline
 from utilsforecast.compat import (
@@ -47,9 +50,10 @@ from mlforecast.target_transforms import (
 from .compat import CatBoostRegressor
 from .data_validation import _index_to_series
 from .grouped_array import GroupedArray
-from .lag_transforms import Lag, _BaseLagTransform
+from .lag_transforms import Lag, _BaseLagTransform, _pooled_executor
 from .pooled import (
     PooledState,
+    _gather_bucket_values,
     _order_preserving_left_join,
     compute_pooled_features,
 )
@@ -249,6 +253,68 @@ def _to_native_index(values, *, df):
     return pl_Series(values)
 
 
+def _predict_step(model: BaseEstimator, new_x) -> np.ndarray:
+    """Predict a single step with `model`, converting its input if required."""
+    # sklearn models consume pandas/numpy; native conversion at the model boundary
+    if isinstance(model, CatBoostRegressor) and isinstance(new_x, pl_DataFrame):
+        new_x = new_x.to_pandas()
+    return model.predict(new_x)
+
+
+# arrays at least this big are stored in separate files when saving to a directory
+_MMAP_MIN_BYTES = 2**16
+
+
+class _ArraySplittingPickler(cloudpickle.CloudPickler):
+    """Pickler that writes the large numeric arrays to `.npy` files in `arrays_dir`."""
+
+    def __init__(self, file, arrays_dir: str):
+        super().__init__(file)
+        self.arrays_dir = arrays_dir
+        # arrays referenced more than once are written once and stay shared.
+        # the arrays are kept alive so that their ids aren't reused
+        self._saved: Dict[int, Tuple[str, np.ndarray]] = {}
+
+    def persistent_id(self, obj):
+        if (
+            not isinstance(obj, np.ndarray)
+            or obj.dtype.hasobject
+            or obj.nbytes < _MMAP_MIN_BYTES
+        ):
+            return None
+        if id(obj) not in self._saved:
+            fname = f"{len(self._saved)}.npy"
+            with fsspec.open(f"{self.arrays_dir}/{fname}", "wb") as f:
+                np.save(f, obj, allow_pickle=False)
+            self._saved[id(obj)] = (fname, obj)
+        return self._saved[id(obj)][0]
+
+
+class _ArrayLoadingUnpickler(pickle.Unpickler):
+    """Unpickler that reads the arrays written by `_ArraySplittingPickler`.
+
+    Local files are memory-mapped copy-on-write, so the pages are read lazily
+    and shared between processes until they're modified."""
+
+    def __init__(self, file, arrays_dir: str, protocol: Optional[str] = None):
+        super().__init__(file)
+        self.arrays_dir = arrays_dir
+        self.protocol = protocol
+        self._loaded: Dict[str, np.ndarray] = {}
+
+    def persistent_load(self, pid):
+        if pid in self._loaded:
+            return self._loaded[pid]
+        file = fsspec.open(f"{self.arrays_dir}/{pid}", "rb", protocol=self.protocol)
+        if isinstance(file.fs, LocalFileSystem):
+            arr = np.asarray(np.load(file.path, mmap_mode="c", allow_pickle=False))
+        else:
+            with file as f:
+                arr = np.load(f, allow_pickle=False)
+        self._loaded[pid] = arr
+        return arr
+
+
 class TimeSeries:
     """Utility class for storing and transforming time series data."""
 
@@ -258,6 +324,8 @@ class TimeSeries:
     # path stays off if the feature computation runs without a prior
     # ``_predict_setup`` (the non-broadcast path is always correct).
     _uniform_dates: bool = False
+    # thread pool shared by the pooled features (see ``_pooled_threads``)
+    _pooled_pool: Optional[concurrent.futures.Executor] = None
     _feature_null_cols: List[str]
     _xdf_null_cols: Optional[List[str]]
     # Fit-time state (set in ``_fit``/``_apply_keep_last_n``). Declared here
@@ -778,6 +846,82 @@ class TimeSeries:
             )
         return out
 
+    @contextmanager
+    def _pooled_threads(self) -> Iterator[Optional[concurrent.futures.Executor]]:
+        """Thread pool for the pooled features, shared by everything computed
+        inside this context (e.g. every step of a predict call)."""
+        if self._pooled_pool is not None or self.num_threads == 1:
+            yield self._pooled_pool
+            return
+        with concurrent.futures.ThreadPoolExecutor(self.num_threads) as executor:
+            self._pooled_pool = executor
+            try:
+                yield executor
+            finally:
+                self._pooled_pool = None
+
+    def _map_pooled_keys(self, fn: Callable) -> List[Any]:
+        """``fn(state, tfms, num_threads)`` for every pooled key.
+
+        The states of the keys are independent, so if `self.num_threads > 1` the
+        keys are computed using multithreading. A single key gets all the
+        threads instead, to split its transforms and the ranges of its
+        queries."""
+        items = [
+            (self._pooled_states[key], tfms)
+            for key, tfms in self._get_pooled_tfms().items()
+        ]
+        if self.num_threads == 1 or not items:
+            return [fn(state, tfms, 1) for state, tfms in items]
+        with self._pooled_threads() as executor:
+            if len(items) == 1:
+                state, tfms = items[0]
+                with _pooled_executor(executor, self.num_threads):
+                    return [fn(state, tfms, self.num_threads)]
+            futures = [executor.submit(fn, state, tfms, 1) for state, tfms in items]
+            return [future.result() for future in futures]
+
+    def _compute_pooled_key_features(
+        self,
+        state: PooledState,
+        tfms: Dict[str, _BaseLagTransform],
+        df_sorted: DFType,
+        num_threads: int,
+    ) -> Dict[str, np.ndarray]:
+        """Values of the pooled transforms of one key for every row of ``df_sorted``."""
+        features: Dict[str, np.ndarray] = {}
+        slow_tfms: Dict[str, _BaseLagTransform] = {}
+        # bucket and time ordinal of every row, to read from the aggregates
+        rows = None
+        if state.groups is None:
+            unique_times = np.unique(state.time)
+            time_vals = df_sorted[self.time_col].to_numpy()
+            row_ords = np.searchsorted(unique_times, time_vals)
+            rows = (np.zeros(row_ords.size, dtype=np.int64), row_ords)
+        elif state._idsorted_to_bucket_pos is not None:
+            pos = state._idsorted_to_bucket_pos
+            rows = (state.bucket_id[pos], state.time_index[pos])
+        for name, tfm in tfms.items():
+            vals = None
+            if rows is not None:
+                vals = tfm._compute_feature_from_aggs(state._ts_aggs, *rows)
+            if vals is not None:
+                features[name] = vals
+            else:
+                slow_tfms[name] = tfm
+        if slow_tfms:
+            bucket_vals = compute_pooled_features(
+                state, slow_tfms, num_threads=num_threads
+            )
+            self._join_bucket_features(
+                features,
+                df_sorted,
+                state.bucket_df,
+                bucket_vals,
+                state.join_cols,
+            )
+        return features
+
     def _join_bucket_features(
         self,
         features: Dict[str, np.ndarray],
@@ -869,55 +1013,17 @@ class TimeSeries:
         features = self._compute_transforms(
             transforms=self.transforms, updates_only=False
         )
-        pooled_tfms = self._get_pooled_tfms()
-        if pooled_tfms:
+        if self._get_pooled_tfms():
             if self._sort_idxs is not None:
                 df_sorted = ufp.take_rows(df, self._sort_idxs)
             else:
                 df_sorted = df
-            for key, tfms in pooled_tfms.items():
-                state = self._pooled_states[key]
-                fast_features: Dict[str, Any] = {}
-                slow_tfms: Dict[str, _BaseLagTransform] = {}
-                for name, tfm in tfms.items():
-                    ts_vals = tfm._compute_ts_level_from_aggs(state._ts_aggs)
-                    if ts_vals is not None:
-                        fast_features[name] = ts_vals
-                    else:
-                        slow_tfms[name] = tfm
-                if fast_features:
-                    if state.groups is None:
-                        unique_times = np.unique(state.time)
-                        time_vals = df_sorted[self.time_col].to_numpy()
-                        row_ords = np.searchsorted(unique_times, time_vals)
-                        for name, ts_vals_by_bucket in fast_features.items():
-                            features[name] = ts_vals_by_bucket[0][row_ords]
-                    elif state._idsorted_to_bucket_pos is not None:
-                        pos = state._idsorted_to_bucket_pos
-                        bid_df = state.bucket_id[pos]
-                        ord_df = state.time_index[pos]
-                        for name, ts_vals_by_bucket in fast_features.items():
-                            out = np.full(len(pos), np.nan)
-                            for bid, ts_vals in ts_vals_by_bucket.items():
-                                mask = bid_df == bid
-                                bucket_ords = ord_df[mask]
-                                agg = state._ts_aggs[bid]
-                                dense_pos = np.searchsorted(
-                                    agg.unique_times, bucket_ords
-                                )
-                                out[mask] = ts_vals[dense_pos]
-                            features[name] = out
-                    else:
-                        slow_tfms.update({n: tfms[n] for n in fast_features})
-                if slow_tfms:
-                    bucket_vals = compute_pooled_features(state, slow_tfms)
-                    self._join_bucket_features(
-                        features,
-                        df_sorted,
-                        state.bucket_df,
-                        bucket_vals,
-                        state.join_cols,
-                    )
+            for key_features in self._map_pooled_keys(
+                lambda state, tfms, num_threads: self._compute_pooled_key_features(
+                    state, tfms, df_sorted, num_threads
+                )
+            ):
+                features.update(key_features)
         # filter out the features that already exist in df to avoid overwriting them
         features = {k: v for k, v in features.items() if k not in df}
         if self._restore_idxs is not None:
@@ -1329,64 +1435,83 @@ class TimeSeries:
 
     def _compute_features_df(self) -> DataFrame:
         """Advance ``curr_dates`` one step and compute the features frame (without statics)."""
+        self._advance_curr_dates()
+        features = self._compute_transforms(self.transforms, updates_only=True)
+        self._compute_pooled_step_features(features)
+        features.update(self._compute_step_date_features())
+        self._feature_null_cols = self._null_cols_in_feature_values(
+            features, nan_is_null=self._features_df_constructor is pd.DataFrame
+        )
+        return self._build_features_df(features)
+
+    def _advance_curr_dates(self) -> None:
         self.curr_dates: Union[pd.Index, pl_Series] = ufp.offset_times(
             self.curr_dates, self.freq, 1
         )
         self.test_dates.append(self.curr_dates)
 
-        features = self._compute_transforms(self.transforms, updates_only=True)
-        pooled_tfms = self._get_pooled_tfms()
-        for key, tfms in pooled_tfms.items():
-            state = self._pooled_states[key]
-            n_series = len(self.uids)
-            slow_tfms: Dict[str, _BaseLagTransform] = {}
-            for name, tfm in tfms.items():
-                latest = tfm._compute_latest_from_aggs(
-                    state._ts_aggs,
-                    state.next_time_index_by_bucket,
-                )
-                if latest is not None:
-                    if state.groups is None:
-                        features[name] = np.full(n_series, latest[0])
-                    else:
-                        max_bid = max(
-                            max(latest.keys(), default=-1),
-                            int(state.series_bucket_id.max()),
-                        )
-                        lookup = np.full(max_bid + 1, np.nan)
-                        for bid, val in latest.items():
-                            lookup[bid] = val
-                        features[name] = lookup[state.series_bucket_id]
-                else:
-                    slow_tfms[name] = tfm
-            if slow_tfms:
-                query = state.build_query_arrays(self.curr_dates, n_series)
-                bucket_vals = compute_pooled_features(
-                    state,
-                    slow_tfms,
-                    query_arrays=query,
-                )
+    def _compute_pooled_step_features(self, features: Dict[str, Any]) -> None:
+        """Add the values of the pooled transforms for the current step to ``features``."""
+        for key_features in self._map_pooled_keys(self._pooled_key_step_features):
+            features.update(key_features)
+
+    def _pooled_key_step_features(
+        self,
+        state: PooledState,
+        tfms: Dict[str, _BaseLagTransform],
+        num_threads: int,
+    ) -> Dict[str, np.ndarray]:
+        """Values of the pooled transforms of one key for the current step."""
+        features: Dict[str, np.ndarray] = {}
+        n_series = len(self.uids)
+        slow_tfms: Dict[str, _BaseLagTransform] = {}
+        for name, tfm in tfms.items():
+            latest = tfm._compute_latest_from_aggs(
+                state._ts_aggs,
+                state.next_time_index_by_bucket,
+            )
+            if latest is not None:
                 if state.groups is None:
-                    for name, vals in bucket_vals.items():
-                        features[name] = np.full(n_series, vals[-1])
+                    features[name] = np.full(n_series, latest[0])
                 else:
-                    tmp_bid = query[0]
-                    n_orig = len(state.y)
-                    for name, vals in bucket_vals.items():
-                        new_vals = vals[n_orig:]
-                        new_bid_vals = tmp_bid[n_orig:]
-                        val_map = {}
-                        for bv, v in zip(new_bid_vals, new_vals):
-                            val_map[bv] = v
-                        max_bid = max(
-                            max(val_map.keys(), default=-1),
-                            int(state.series_bucket_id.max()),
-                        )
-                        lookup = np.full(max_bid + 1, np.nan)
-                        for bid, val in val_map.items():
-                            lookup[bid] = val
-                        features[name] = lookup[state.series_bucket_id]
+                    features[name] = _gather_bucket_values(
+                        latest, state.series_bucket_id
+                    )
+            else:
+                slow_tfms[name] = tfm
+        if slow_tfms:
+            # finite-window transforms only need the tail of the history
+            window = None
+            if all(
+                tfm._is_finite_window and tfm.update_samples > 0
+                for tfm in slow_tfms.values()
+            ):
+                window = max(tfm.update_samples for tfm in slow_tfms.values())
+            query = state.build_query_arrays(self.curr_dates, n_series, window=window)
+            bucket_vals = compute_pooled_features(
+                state,
+                slow_tfms,
+                query_arrays=query,
+                num_threads=num_threads,
+            )
+            if state.groups is None:
+                for name, vals in bucket_vals.items():
+                    features[name] = np.full(n_series, vals[-1])
+            else:
+                n_orig = len(query[0]) - n_series
+                new_bid_vals = query[0][n_orig:]
+                for name, vals in bucket_vals.items():
+                    # the query rows of a bucket share their value
+                    lookup = np.full(new_bid_vals.max(initial=-1) + 1, np.nan)
+                    lookup[new_bid_vals] = vals[n_orig:]
+                    features[name] = _gather_bucket_values(
+                        lookup, state.series_bucket_id
+                    )
+        return features
 
+    def _compute_step_date_features(self) -> Dict[str, Any]:
+        """Date features for ``curr_dates``. These don't depend on the target."""
+        features: Dict[str, Any] = {}
         if self._uniform_dates and self.date_features:
             # all series are on the same timestamp, so date features are
             # constant across series: compute them on a single date and
@@ -1404,16 +1529,17 @@ class TimeSeries:
                     self.curr_dates, feature
                 ).items():
                     features[feat_name] = feat_vals
+        return features
 
+    @property
+    def _features_df_constructor(self) -> Callable:
         # native-container boundary — uids/df constructor selected per backend
         if isinstance(self.last_dates, pl_Series):
-            df_constructor = pl_DataFrame
-        else:
-            df_constructor = pd.DataFrame
-        self._feature_null_cols = self._null_cols_in_feature_values(
-            features, nan_is_null=df_constructor is pd.DataFrame
-        )
-        features_df = df_constructor(features)
+            return pl_DataFrame
+        return pd.DataFrame
+
+    def _build_features_df(self, features: Dict[str, Any]) -> DataFrame:
+        features_df = self._features_df_constructor(features)
         if list(features_df.columns) != self.features:
             features_df = features_df[self.features]
         return features_df
@@ -1544,37 +1670,54 @@ class TimeSeries:
         # model features (_statics_keep) so columns dropped by the
         # features_order_ selection below aren't carried through every step
         features_df = self._compute_features_df()
+        X_row, xdf_null_cols = self._step_exog_rows(X_df, X_row)
+        new_x = self._assemble_next_x(
+            features_df, X_row, self._feature_null_cols, xdf_null_cols
+        )
+        self._h += 1
+        return new_x
+
+    def _step_exog_rows(self, X_df, X_row=None) -> Tuple[Any, List[str]]:
+        """Rows of ``X_df`` for the current step and their columns with nulls."""
+        if X_df is None:
+            return None, []
+        if X_row is None:
+            X_row = self._current_step_rows(X_df)
+        if self._xdf_null_cols is None:
+            # X_df is fixed for the whole predict; scan it once so the
+            # common no-nulls case skips the per-step check entirely
+            xdf_nw = nw.from_native(X_df, eager_only=True)
+            if xdf_nw.columns:
+                xdf_null_counts = xdf_nw.null_count().row(0)
+                self._xdf_null_cols = [
+                    c for c, n in zip(xdf_nw.columns, xdf_null_counts) if n
+                ]
+            else:
+                self._xdf_null_cols = []
+        null_cols: List[str] = []
+        if self._xdf_null_cols:
+            row_nw = nw.from_native(X_row, eager_only=True).select(self._xdf_null_cols)
+            row_null_counts = row_nw.null_count().row(0)
+            null_cols = [c for c, n in zip(self._xdf_null_cols, row_null_counts) if n]
+        return X_row, null_cols
+
+    def _assemble_next_x(
+        self,
+        features_df: DataFrame,
+        X_row: Optional[DataFrame],
+        feature_null_cols: List[str],
+        xdf_null_cols: List[str],
+    ):
+        """Build the model input from the statics, computed features and exogenous rows."""
         new_x = ufp.horizontal_concat([self._statics_keep, features_df])
         # statics were scanned in _predict_setup and computed features while
-        # building them in _update_features; assembled here in new_x column
+        # building them in _compute_features_df; assembled here in new_x column
         # order (statics, features, X_row) so the warning matches a full scan
-        cols_with_nulls = self._static_null_cols + self._feature_null_cols
-        if X_df is not None:
-            if X_row is None:
-                X_row = self._current_step_rows(X_df)
-            if self._xdf_null_cols is None:
-                # X_df is fixed for the whole predict; scan it once so the
-                # common no-nulls case skips the per-step check entirely
-                xdf_nw = nw.from_native(X_df, eager_only=True)
-                if xdf_nw.columns:
-                    xdf_null_counts = xdf_nw.null_count().row(0)
-                    self._xdf_null_cols = [
-                        c for c, n in zip(xdf_nw.columns, xdf_null_counts) if n
-                    ]
-                else:
-                    self._xdf_null_cols = []
-            if self._xdf_null_cols:
-                row_nw = nw.from_native(X_row, eager_only=True).select(
-                    self._xdf_null_cols
-                )
-                row_null_counts = row_nw.null_count().row(0)
-                cols_with_nulls += [
-                    c for c, n in zip(self._xdf_null_cols, row_null_counts) if n
-                ]
+        cols_with_nulls = self._static_null_cols + feature_null_cols + xdf_null_cols
+        if X_row is not None:
             new_x = ufp.horizontal_concat([new_x, X_row])
         if cols_with_nulls:
             warnings.warn(f"Found null values in {', '.join(cols_with_nulls)}.")
-        self._h += 1
         if list(new_x.columns) != self.features_order_:
             new_x = new_x[self.features_order_]
         if self.as_numpy:
@@ -1654,20 +1797,22 @@ class TimeSeries:
         X_df: Optional[DFType] = None,
     ) -> DFType:
         """Use `model` to predict the next `horizon` timesteps."""
+        if self._can_predict_lockstep(models, before_predict_callback):
+            return self._predict_recursive_lockstep(
+                models=models,
+                horizon=horizon,
+                after_predict_callback=after_predict_callback,
+                X_df=X_df,
+            )
         for i, (name, model) in enumerate(models.items()):
             with self._backup():
                 self._predict_setup()
+                self._reserve_ga(horizon)
                 for _ in range(horizon):
                     new_x = self._get_features_for_next_step(X_df)
                     if before_predict_callback is not None:
                         new_x = before_predict_callback(new_x)
-                    model_x = new_x
-                    # sklearn models consume pandas/numpy; native conversion at the model boundary
-                    if isinstance(model, CatBoostRegressor) and isinstance(
-                        new_x, pl_DataFrame
-                    ):
-                        model_x = new_x.to_pandas()
-                    predictions = model.predict(model_x)
+                    predictions = _predict_step(model, new_x)
                     if after_predict_callback is not None:
                         predictions = after_predict_callback(predictions)
                     self._update_y(predictions)
@@ -1680,6 +1825,104 @@ class TimeSeries:
                     preds = ufp.assign_columns(preds, name, raw_preds)
         return preds
 
+    def _reserve_ga(self, horizon: int) -> None:
+        """Reserve room in `self.ga` to append the next `horizon` predictions in place.
+
+        The reserved array exposes the unused room as leading nulls of the series,
+        which the lag transform classes skip but user functions may not handle.
+        """
+        local_tfms = self._get_local_tfms(self.transforms)
+        if all(isinstance(tfm, _BaseLagTransform) for tfm in local_tfms.values()):
+            self.ga = self.ga.reserve(horizon)
+
+    def _can_predict_lockstep(
+        self,
+        models: Dict[str, BaseEstimator],
+        before_predict_callback: Optional[Callable],
+    ) -> bool:
+        """Whether the recursive models can be advanced together.
+
+        Pooled states aggregate over all the series of a model's rollout, so
+        they'd need one copy per model, and a `before_predict_callback` may
+        rely on seeing the steps of a single model in order (e.g. `SaveFeatures`).
+        """
+        return (
+            len(models) > 1
+            and before_predict_callback is None
+            and not getattr(self, "_pooled_states", None)
+        )
+
+    def _predict_recursive_lockstep(
+        self,
+        models: Dict[str, BaseEstimator],
+        horizon: int,
+        after_predict_callback: Optional[Callable] = None,
+        X_df: Optional[DFType] = None,
+    ) -> DFType:
+        """Advance all `models` together for the next `horizon` timesteps.
+
+        The series are tiled once per model into a single GroupedArray, so the
+        lag transforms update the targets of every model in one call, while the
+        work that doesn't depend on the target (date features, statics, the
+        exogenous rows and their null scans) is done once per step.
+        """
+        n_series = len(self.uids)
+        tiled_idxs = np.tile(np.arange(n_series), len(models))
+        with self._backup():
+            self._predict_setup()
+            self.ga = self.ga.take(tiled_idxs)
+            for tfm_name, tfm in self.transforms.items():
+                if isinstance(tfm, _BaseLagTransform):
+                    self.transforms[tfm_name] = tfm.take(tiled_idxs)
+            self._reserve_ga(horizon)
+            nan_is_null = self._features_df_constructor is pd.DataFrame
+            for _ in range(horizon):
+                self._advance_curr_dates()
+                date_features = self._compute_step_date_features()
+                date_null_cols = self._null_cols_in_feature_values(
+                    date_features, nan_is_null=nan_is_null
+                )
+                X_row, xdf_null_cols = self._step_exog_rows(X_df)
+                stacked_features = self._compute_transforms(
+                    self.transforms, updates_only=True
+                )
+                step_preds = []
+                for i, model in enumerate(models.values()):
+                    rows = slice(i * n_series, (i + 1) * n_series)
+                    features = {k: v[rows] for k, v in stacked_features.items()}
+                    null_cols = set(date_null_cols)
+                    null_cols.update(
+                        self._null_cols_in_feature_values(
+                            features, nan_is_null=nan_is_null
+                        )
+                    )
+                    features.update(date_features)
+                    new_x = self._assemble_next_x(
+                        self._build_features_df(features),
+                        X_row,
+                        [c for c in self.features if c in null_cols],
+                        xdf_null_cols,
+                    )
+                    predictions = _predict_step(model, new_x)
+                    if after_predict_callback is not None:
+                        predictions = after_predict_callback(predictions)
+                    step_preds.append(np.asarray(predictions))
+                self._h += 1
+                new_y = np.concatenate(step_preds)
+                self.y_pred.append(new_y)
+                self.ga = self.ga.append(new_y)
+            y_pred = np.array(self.y_pred)
+            for i, name in enumerate(models.keys()):
+                self.y_pred = list(y_pred[:, i * n_series : (i + 1) * n_series])
+                if i == 0:
+                    preds = self._get_predictions()
+                    rename_dict = {f"{self.target_col}_pred": name}
+                    preds = ufp.rename(preds, rename_dict)
+                else:
+                    raw_preds = self._get_raw_predictions()
+                    preds = ufp.assign_columns(preds, name, raw_preds)
+        return preds
+
     def _predict_multi(
         self,
         models: Dict[str, Dict[int, BaseEstimator]],
@@ -1895,7 +2138,8 @@ class TimeSeries:
                     "for feature generation or model inputs used during training: "
                     f"{sorted(required_future_cols)}."
                 )
-        with self._maybe_subset(idxs):
+        # a single thread pool serves the pooled features of every step
+        with self._maybe_subset(idxs), self._pooled_threads():
             # invalidate the per-predict statics cache in _predict_setup
             self._static_null_src = None
             if X_df is not None:
@@ -1999,14 +2243,31 @@ class TimeSeries:
                         preds = tfm.inverse_transform(preds)
         return preds
 
-    def save(self, path: Union[str, Path]) -> None:
-        with fsspec.open(path, "wb") as f:
-            cloudpickle.dump(self, f)
+    def save(self, path: Union[str, Path], mmap_arrays: bool = False) -> None:
+        """Save the object to `path`.
+
+        If `mmap_arrays=True`, `path` is a directory where the large arrays are
+        stored as `.npy` files, which get memory-mapped by `TimeSeries.load`."""
+        if not mmap_arrays:
+            with fsspec.open(path, "wb") as f:
+                cloudpickle.dump(self, f)
+            return
+        arrays_dir = fsspec.open(f"{path}/arrays")
+        arrays_dir.fs.makedirs(arrays_dir.path, exist_ok=True)
+        with fsspec.open(f"{path}/state.pkl", "wb") as f:
+            _ArraySplittingPickler(f, arrays_dir=f"{path}/arrays").dump(self)
 
     @staticmethod
     def load(path: Union[str, Path], protocol: Optional[str] = None) -> "TimeSeries":
-        with fsspec.open(path, "rb", protocol=protocol) as f:
-            ts = cloudpickle.load(f)
+        file = fsspec.open(path, "rb", protocol=protocol)
+        if not file.fs.isdir(file.path):
+            with file as f:
+                ts = cloudpickle.load(f)
+            return ts
+        with fsspec.open(f"{path}/state.pkl", "rb", protocol=protocol) as f:
+            ts = _ArrayLoadingUnpickler(
+                f, arrays_dir=f"{path}/arrays", protocol=protocol
+            ).load()
         return ts
 
     def _validate_new_df(self, df: DataFrame) -> None:
@@ -1,7 +1,10 @@
 __all__ = ["MLForecast"]
 
 
+import collections
+import concurrent.futures
 import copy
+import multiprocessing
 import warnings
 import re
 from pathlib import Path
@@ -42,6 +45,8 @@ from mlforecast.core import (
 )
 
 from .grouped_array import GroupedArray
+from .lag_transforms import _BaseLagTransform
+from .pooled import _order_preserving_left_join
 
 if TYPE_CHECKING:
     from mlforecast.lgb_cv import LightGBMCV
@@ -53,7 +58,12 @@ from .conformal_prediction import (
     PredictionIntervals,
     TransferConformal,
     TransferResult,
+    _DensityRatioCache,
+    _QuantileTable,
+    _ScoreStore,
     _add_signed_transfer_intervals,
+    _add_table_intervals,
+    _score_features,
     get_conformal_method,
     get_transfer_method_spec,
     compute_conformity_scores,
@@ -63,6 +73,57 @@ _get_conformal_method = get_conformal_method  # backward compat
 _get_transfer_method_spec = get_transfer_method_spec
 
 
+def _limit_model_threads(model: BaseEstimator, n_threads: int) -> BaseEstimator:
+    """Copy of `model` using `n_threads` threads, if it exposes an `n_jobs` parameter."""
+    model = clone(model)
+    if "n_jobs" in model.get_params(deep=False):
+        model.set_params(n_jobs=n_threads)
+    return model
+
+
+def _restore_model_threads(
+    fitted: BaseEstimator, model: BaseEstimator
+) -> BaseEstimator:
+    """`fitted` using the `n_jobs` of `model` again, see `_limit_model_threads`."""
+    params = model.get_params(deep=False)
+    if "n_jobs" in params:
+        fitted.set_params(n_jobs=params["n_jobs"])
+    return fitted
+
+
+_cv_worker_state: Dict[str, Any] = {}
+
+
+def _init_cv_worker(payload: bytes) -> None:
+    """Loads the forecast object and the arguments shared by every CV window in a worker."""
+    _cv_worker_state.update(cloudpickle.loads(payload))
+
+
+def _run_cv_window(
+    i_window: int,
+    cutoffs: DataFrame,
+    train: DataFrame,
+    valid: DataFrame,
+) -> Tuple[DataFrame, Dict[str, BaseEstimator], Any, Optional[Dict[str, Any]]]:
+    """Trains and predicts the `i_window`-th cross validation window in a worker."""
+    state = _cv_worker_state
+    fcst = copy.deepcopy(state["fcst"])
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore", message="Pooled.*validate_data", category=UserWarning
+        )
+        fcst.fit(train, validate_data=False, **state["fit_kwargs"])
+    result = fcst._cv_window_predictions(
+        cutoffs, train, valid, refit_window=True, **state["predict_kwargs"]
+    )
+    fitted_values = None
+    if state["fit_kwargs"]["fitted"]:
+        fitted_values = ufp.assign_columns(fcst.fcst_fitted_values_, "fold", i_window)
+    # the state of the last window's fit is kept, like in the sequential loop
+    fcst_state = fcst.__dict__ if i_window == state["n_windows"] - 1 else None
+    return result, fcst.models_, fitted_values, fcst_state
+
+
 def _ensure_h_int64(res):
     """Cast the ``h`` column to Int64, preserving the input backend.
 
@@ -152,8 +213,10 @@ def _frozen_backtest(
 class MLForecast:
     # Calibration state (set in ``fit``/``history_warmup``/``load``). Declared
     # here so mypy has a type regardless of method processing order.
-    _cs_df: Optional[DataFrame]
+    _cs_df: Optional[Union[DataFrame, _ScoreStore]]
+    _cs_table: Optional[_QuantileTable]
     _cs_source_scales_: Optional[Dict]
+    _dre_cache: _DensityRatioCache
 
     def __init__(
         self,
@@ -202,6 +265,7 @@ class MLForecast:
             date_features_as_dummies=date_features_as_dummies,
             drop_auxiliary_columns=drop_auxiliary_columns,
         )
+        self._dre_cache = _DensityRatioCache()
 
     @property
     def horizon_features_(self) -> Dict[int, List[str]]:
@@ -493,6 +557,117 @@ class MLForecast:
             weight_col=weight_col,
         )
 
+    def preprocess_chunks(
+        self,
+        df: DFType,
+        series_per_chunk: int,
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+        static_features: Optional[List[str]] = None,
+        dropna: bool = True,
+        keep_last_n: Optional[int] = None,
+        max_horizon: Optional[int] = None,
+        horizons: Optional[List[int]] = None,
+        horizon_features: Optional[Dict[int, List[str]]] = None,
+        horizon_feature_templates: Optional[List[str]] = None,
+        return_X_y: bool = False,
+        as_numpy: bool = False,
+        weight_col: Optional[str] = None,
+        validate_data: bool = True,
+    ) -> Iterator[Union[DFType, Tuple[DFType, np.ndarray]]]:
+        """Add the features to `df` by chunks of series.
+
+        Yields the output of `preprocess` for `series_per_chunk` series at a time,
+        so the features of all the series never have to be in memory at once, e.g. to
+        train estimators that support incremental training and assign them to `models_`.
+        The state required to predict is built from all the series before the first chunk.
+
+        Every chunk is processed independently, so the pooled lag transforms
+        (`global_`, `groupby` or `partition_by`) and the target transforms that aren't
+        computed for each serie separately aren't supported.
+
+        Args:
+            df (pandas or polars DataFrame): Series data in long format.
+            series_per_chunk (int): Number of series in each chunk.
+            id_col (str): Column that identifies each serie. Defaults to 'unique_id'.
+            time_col (str): Column that identifies each timestep, its values can be timestamps or integers. Defaults to 'ds'.
+            target_col (str): Column that contains the target. Defaults to 'y'.
+            static_features (list of str, optional): Names of the features that are static and will be repeated when forecasting. Defaults to None.
+            dropna (bool): Drop rows with missing values produced by the transformations. Defaults to True.
+            keep_last_n (int, optional): Keep only these many records from each serie for the forecasting step. Defaults to None.
+            max_horizon (int, optional): Train this many models, where each model will predict a specific horizon. Defaults to None.
+            horizons (list of int, optional): Train models only for specific horizons (1-indexed). Mutually exclusive with max_horizon. Defaults to None.
+            horizon_features (dict of int to list of str, optional): Explicit mapping of 1-indexed horizons to dynamic exogenous columns. Defaults to None.
+            horizon_feature_templates (list of str, optional): Template patterns for horizon-specific dynamic exogenous features. Defaults to None.
+            return_X_y (bool): Return a tuple with the features and the target. If False will return a single dataframe. Defaults to False.
+            as_numpy (bool): Cast features to numpy array. Only works for `return_X_y=True`. Defaults to False.
+            weight_col (str, optional): Column that contains the sample weights. Defaults to None.
+            validate_data (bool): Run data quality validations before preprocessing. Warns about missing dates and raises on duplicate rows. Defaults to True.
+
+        Yields:
+            DataFrame or tuple of DataFrame and a numpy array: the output of `preprocess` for each chunk.
+        """
+        if len(self.ts._get_local_tfms(self.ts.transforms)) < len(self.ts.transforms):
+            raise ValueError(
+                "Pooled lag transforms (global_, groupby or partition_by) "
+                "aren't supported when preprocessing by chunks."
+            )
+        target_tfms = self.ts.target_transforms or []
+        if not all(
+            isinstance(tfm, _BaseGroupedArrayTargetTransform) for tfm in target_tfms
+        ):
+            raise ValueError(
+                "Only target transforms that are computed for each serie separately "
+                "are supported when preprocessing by chunks."
+            )
+        # unfitted copy used to process the chunks, preprocess fits it from
+        # scratch on every call so a single one is reused for all of them
+        worker = copy.deepcopy(self)
+        self.history_warmup(
+            df,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            static_features=static_features,
+            keep_last_n=keep_last_n,
+            weight_col=weight_col,
+            max_horizon=max_horizon,
+            horizons=horizons,
+            horizon_features=horizon_features,
+            horizon_feature_templates=horizon_feature_templates,
+            as_numpy=as_numpy,
+            validate_data=validate_data,
+        )
+        # the chunks are taken through the sort indices instead of sorting a
+        # copy of the whole frame
+        sort_idxs = ufp.maybe_compute_sort_indices(df, id_col, time_col)
+        sizes = ufp.counts_by_id(df, id_col)["counts"].to_numpy().astype(np.int64)
+        indptr = np.append(0, sizes.cumsum())
+        for start in range(0, sizes.size, series_per_chunk):
+            end = min(start + series_per_chunk, sizes.size)
+            rows = np.arange(indptr[start], indptr[end])
+            if sort_idxs is not None:
+                rows = sort_idxs[rows]
+            chunk = ufp.take_rows(df, rows)
+            yield worker.preprocess(
+                chunk,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                static_features=static_features,
+                dropna=dropna,
+                keep_last_n=keep_last_n,
+                max_horizon=max_horizon,
+                horizons=horizons,
+                horizon_features=horizon_features,
+                horizon_feature_templates=horizon_feature_templates,
+                return_X_y=return_X_y,
+                as_numpy=as_numpy,
+                weight_col=weight_col,
+                validate_data=False,
+            )
+
     def history_warmup(
         self,
         df: DFType,
@@ -589,6 +764,8 @@ class MLForecast:
                 )
         if not hasattr(self, "_cs_df"):
             self._cs_df = None
+        if not hasattr(self, "_cs_table"):
+            self._cs_table = None
         if not hasattr(self, "_cs_source_scales_"):
             self._cs_source_scales_ = None
         self.ts.history_warmup(
@@ -611,6 +788,8 @@ class MLForecast:
         y: Union[np.ndarray, None] = None,
         models_fit_kwargs: Optional[dict[str, dict[str, Any]]] = None,
         generator_factory: Optional[Callable[[], Iterator]] = None,
+        n_jobs: int = 1,
+        threads_per_model: Optional[int] = None,
     ) -> "MLForecast":
         """Manually train models. Use this if you called `MLForecast.preprocess` beforehand.
 
@@ -619,6 +798,11 @@ class MLForecast:
             y (numpy array, optional): Target (for recursive forecasting).
             models_fit_kwargs (dict, optional): Keyword arguments for each model's fit method.
             generator_factory (callable, optional): Factory function that returns an iterator yielding (h, X_h, y_h) tuples per horizon.
+            n_jobs (int): Number of models to train concurrently in a thread pool. Each model and horizon is an independent job.
+                Use -1 to use all available CPU cores. Defaults to 1.
+            threads_per_model (int, optional): Value for the `n_jobs` parameter of the models that have one when `n_jobs > 1`.
+                If `None`, the available CPU cores are split evenly between the jobs. It only applies while training:
+                the trained models keep the `n_jobs` they were defined with for predicting. Defaults to None.
 
         Returns:
             MLForecast: Forecast object with trained models.
@@ -631,11 +815,16 @@ class MLForecast:
                 f"The following model names in `model_fit_kwargs` are not recognized: {unknown_models}. "
                 f"Valid model names are: {list(self.models)}."
             )
+        n_jobs = _resolve_num_threads(n_jobs)
+        models = self.models
+        if n_jobs > 1 and threads_per_model is None:
+            threads_per_model = max(1, _resolve_num_threads(-1) // n_jobs)
 
         def fit_model(
             model, X, y, weight_col, model_fit_kwargs: Optional[dict[str, Any]]
         ):
-            fit_kwargs = model_fit_kwargs or {}
+            # copy since the same kwargs can be used by concurrent fits
+            fit_kwargs = dict(model_fit_kwargs or {})
             if weight_col is not None:
                 if isinstance(X, np.ndarray):
                     fit_kwargs["sample_weight"] = X[:, 0]
@@ -650,14 +839,50 @@ class MLForecast:
                 sample_weight = fit_kwargs.get("sample_weight")
                 if isinstance(sample_weight, pl_Series):
                     fit_kwargs["sample_weight"] = sample_weight.to_numpy()
-            return clone(model).fit(X, y, **fit_kwargs)
+            if n_jobs == 1:
+                return clone(model).fit(X, y, **fit_kwargs)
+            # split the cores between the concurrent fits to avoid oversubscription,
+            # the fitted model predicts with the threads the user set
+            fitted = _limit_model_threads(model, threads_per_model).fit(
+                X, y, **fit_kwargs
+            )
+            return _restore_model_threads(fitted, model)
 
         self.models_: Dict[str, Union[BaseEstimator, Dict[int, BaseEstimator]]] = {}
 
-        if generator_factory is not None:
+        if generator_factory is not None and n_jobs > 1:
+            # a single pass over the horizons, each one is shared by all the models
+            horizons = []
+            fitted_by_job = {}
+            pending: Dict[concurrent.futures.Future, Tuple[str, int]] = {}
+            with concurrent.futures.ThreadPoolExecutor(n_jobs) as executor:
+                for h, X_h, y_h in generator_factory():
+                    horizons.append(h)
+                    for name, model in models.items():
+                        future = executor.submit(
+                            fit_model,
+                            model,
+                            X_h,
+                            y_h,
+                            self.ts.weight_col,
+                            models_fit_kwargs.get(name, None),
+                        )
+                        pending[future] = (name, h)
+                    # bound the number of horizon datasets held by queued fits
+                    while len(pending) > n_jobs:
+                        done, _ = concurrent.futures.wait(
+                            pending, return_when=concurrent.futures.FIRST_COMPLETED
+                        )
+                        for future in done:
+                            fitted_by_job[pending.pop(future)] = future.result()
+                for future in concurrent.futures.as_completed(pending):
+                    fitted_by_job[pending[future]] = future.result()
+            for name in models:
+                self.models_[name] = {h: fitted_by_job[(name, h)] for h in horizons}
+        elif generator_factory is not None:
             # Direct forecasting with generator factory
             # Models are stored as dict keyed by horizon index (0-indexed)
-            for name, model in self.models.items():
+            for name, model in models.items():
                 model_fit_kwargs = models_fit_kwargs.get(name, None)
                 self.models_[name] = {}
                 # Create fresh generator for each model (generators are single-use)
@@ -668,15 +893,31 @@ class MLForecast:
                     )
                     self.models_[name][h] = fitted
         else:
-            # Recursive forecasting (unchanged)
+            # Recursive forecasting
             assert X is not None and y is not None, (
                 "X and y are required when generator_factory is not provided"
             )
-            for name, model in self.models.items():
-                model_fit_kwargs = models_fit_kwargs.get(name, None)
-                self.models_[name] = fit_model(
-                    model, X, y, self.ts.weight_col, model_fit_kwargs
-                )
+            if n_jobs > 1:
+                with concurrent.futures.ThreadPoolExecutor(n_jobs) as executor:
+                    futures = {
+                        name: executor.submit(
+                            fit_model,
+                            model,
+                            X,
+                            y,
+                            self.ts.weight_col,
+                            models_fit_kwargs.get(name, None),
+                        )
+                        for name, model in models.items()
+                    }
+                    for name, future in futures.items():
+                        self.models_[name] = future.result()
+            else:
+                for name, model in models.items():
+                    model_fit_kwargs = models_fit_kwargs.get(name, None)
+                    self.models_[name] = fit_model(
+                        model, X, y, self.ts.weight_col, model_fit_kwargs
+                    )
         return self
 
     def _conformity_scores(
@@ -758,6 +999,34 @@ class MLForecast:
             cv_results, list(self.models.keys()), target_col, feature_cols=feature_cols
         )
 
+    def _quantile_table(self) -> Optional[_QuantileTable]:
+        """Interval widths for the levels declared in `prediction_intervals`."""
+        levels = getattr(self.prediction_intervals, "levels", None)
+        if levels is None or self._cs_df is None:
+            return None
+        return _QuantileTable.from_scores(
+            self._cs_df,
+            model_names=list(self.models.keys()),
+            levels=levels,
+            method=self.prediction_intervals.method,
+            n_windows=self.prediction_intervals.n_windows,
+            h=self.prediction_intervals.h,
+        )
+
+    def clear_transfer_cache(self) -> None:
+        """Drop the density ratio weights cached by transfer-conformal predictions.
+
+        Predictions with `transfer_conformal` methods that weight the calibration
+        scores reuse the weights estimated for the same target features. They're
+        dropped automatically when calling `fit`."""
+        self._dre_cache = _DensityRatioCache()
+
+    def _transfer_cache(self) -> _DensityRatioCache:
+        # objects pickled before the cache existed don't have it
+        if getattr(self, "_dre_cache", None) is None:
+            self._dre_cache = _DensityRatioCache()
+        return self._dre_cache
+
     def _invert_transforms_fitted(self, df: DFType) -> DFType:
         if self.ts.target_transforms is None:
             return df
@@ -1139,6 +1408,8 @@ class MLForecast:
         models_fit_kwargs: Optional[dict[str, dict[str, Any]]] = None,
         validate_data: bool = True,
         cache_train_df: bool = True,
+        n_jobs: int = 1,
+        threads_per_model: Optional[int] = None,
     ) -> "MLForecast":
         """Apply the feature engineering and train the models.
 
@@ -1167,19 +1438,19 @@ class MLForecast:
                 `forecast_fitted_values(h>1)` can be called later for recursive models without
                 passing `train_df`. Disable this to avoid the memory overhead and pass
                 `train_df` directly to `forecast_fitted_values` when needed. Defaults to True.
+            n_jobs (int): Number of models to train concurrently in a thread pool. Each model and horizon is an independent job.
+                Use -1 to use all available CPU cores. Defaults to 1.
+            threads_per_model (int, optional): Value for the `n_jobs` parameter of the models that have one when `n_jobs > 1`.
+                If `None`, the available CPU cores are split evenly between the jobs. It only applies while training:
+                the trained models keep the `n_jobs` they were defined with for predicting. Defaults to None.
 
         Returns:
             MLForecast: Forecast object with series values and trained models.
         """
-        if fitted and self.ts.target_transforms is not None:
-            for tfm in self.ts.target_transforms:
-                if hasattr(tfm, "store_fitted"):
-                    tfm.store_fitted = True
-        self._cs_df = None
-        self._cs_source_scales_ = None
+        self._reset_fit_state(fitted)
         if prediction_intervals is not None:
             self.prediction_intervals = prediction_intervals
-            self._cs_df = self._conformity_scores(
+            cs_df = self._conformity_scores(
                 df=df,
                 id_col=id_col,
                 time_col=time_col,
@@ -1195,6 +1466,18 @@ class MLForecast:
                 h=prediction_intervals.h,
                 as_numpy=as_numpy,
             )
+            model_names = list(self.models.keys())
+            # the weighted methods store the features of every score
+            non_feat = {id_col, time_col, "cutoff", *model_names}
+            self._cs_df = _ScoreStore.from_frame(
+                cs_df,
+                model_names=model_names,
+                id_col=id_col,
+                n_windows=prediction_intervals.n_windows,
+                h=prediction_intervals.h,
+                feature_cols=[c for c in cs_df.columns if c not in non_feat],
+            )
+            self._cs_table = self._quantile_table()
             if prediction_intervals.scale_estimator is not None:
                 from .conformal_prediction import _compute_series_scales
 
@@ -1243,7 +1526,10 @@ class MLForecast:
 
             # Train models using generator factory
             self.fit_models(
-                generator_factory=generator_factory, models_fit_kwargs=models_fit_kwargs
+                generator_factory=generator_factory,
+                models_fit_kwargs=models_fit_kwargs,
+                n_jobs=n_jobs,
+                threads_per_model=threads_per_model,
             )
 
             if fitted:
@@ -1265,10 +1551,7 @@ class MLForecast:
                     weight_col=self.ts.weight_col,
                     original_df=original_df,
                 )
-                fitted_values = ufp.drop_index_if_pandas(fitted_values)
-                self.fcst_fitted_values_ = fitted_values
-                if hasattr(self, "_fitted_train_df_"):
-                    delattr(self, "_fitted_train_df_")
+                self._store_fitted_values(fitted_values)
         else:
             # Standard recursive path (unchanged)
             prep = self.preprocess(
@@ -1295,7 +1578,13 @@ class MLForecast:
                 if as_numpy:
                     X = ufp.to_numpy(X)
                 del prep
-            self.fit_models(X, y, models_fit_kwargs)
+            self.fit_models(
+                X,
+                y,
+                models_fit_kwargs,
+                n_jobs=n_jobs,
+                threads_per_model=threads_per_model,
+            )
             if fitted:
                 fitted_values = self._compute_fitted_values(
                     base=base,
@@ -1307,14 +1596,35 @@ class MLForecast:
                     max_horizon=max_horizon,
                     weight_col=self.ts.weight_col,
                 )
-                fitted_values = ufp.drop_index_if_pandas(fitted_values)
-                self.fcst_fitted_values_ = fitted_values
-                if cache_train_df:
-                    self._fitted_train_df_ = ufp.copy_if_pandas(df, deep=True)
-                elif hasattr(self, "_fitted_train_df_"):
-                    delattr(self, "_fitted_train_df_")
+                self._store_fitted_values(
+                    fitted_values, train_df=df if cache_train_df else None
+                )
         return self
 
+    def _reset_fit_state(self, fitted: bool) -> None:
+        """Drop the state of a previous fit before training the models again."""
+        if fitted and self.ts.target_transforms is not None:
+            for tfm in self.ts.target_transforms:
+                if hasattr(tfm, "store_fitted"):
+                    tfm.store_fitted = True
+        self._cs_df = None
+        self._cs_table = None
+        self._cs_source_scales_ = None
+        self.clear_transfer_cache()
+        for attr in ("fcst_fitted_values_", "_fitted_train_df_"):
+            if hasattr(self, attr):
+                delattr(self, attr)
+
+    def _store_fitted_values(
+        self, fitted_values: DataFrame, train_df: Optional[DataFrame] = None
+    ) -> None:
+        """Keep the in-sample predictions and optionally the data they came from.
+
+        `train_df` is used to compute the multi-step fitted values on demand."""
+        self.fcst_fitted_values_ = ufp.drop_index_if_pandas(fitted_values)
+        if train_df is not None:
+            self._fitted_train_df_ = ufp.copy_if_pandas(train_df, deep=True)
+
     def forecast_fitted_values(
         self,
         level: Optional[List[Union[int, float]]] = None,
@@ -1566,14 +1876,9 @@ class MLForecast:
             if callable(transfer_conformal.weights):
                 model_cols = set(self.models.keys())
                 non_feat = {self.ts.id_col, self.ts.time_col, "cutoff"} | model_cols
-                feat_cols = [c for c in self._cs_df.columns if c not in non_feat]
-                src = (
-                    np.column_stack(
-                        [self._cs_df[c].to_numpy() for c in feat_cols]
-                    ).astype(float)
-                    if feat_cols
-                    else None
-                )
+                _, src = _score_features(self._cs_df, non_feat)
+                if src is not None:
+                    src = src.astype(float)
                 w_arr = transfer_conformal.weights(src)
             else:
                 w_arr = np.asarray(transfer_conformal.weights, dtype=float)
@@ -1642,10 +1947,11 @@ class MLForecast:
                     id_col=self.ts.id_col,
                     time_col=self.ts.time_col,
                     preprocess_fn=(self.preprocess if spec.needs_preprocess else None),
-                    source_cs_df=(self._cs_df if spec.needs_source_cs else None),
+                    source_cs_df=self._cs_df if spec.needs_source_cs else None,
                     source_scales=(
                         self._cs_source_scales_ if spec.needs_source_cs else None
                     ),
+                    **({"dre_cache": self._transfer_cache()} if spec.uses_dre else {}),
                 )
             finally:
                 self.models_ = _saved_models_
@@ -1683,11 +1989,13 @@ class MLForecast:
                     )
                     warnings.warn(warn_msg, UserWarning)
                 else:
-                    cs_ids = set(
-                        nw.from_native(self._cs_df, eager_only=True)[self.ts.id_col]
-                        .unique()
-                        .to_list()
-                    )
+                    if isinstance(self._cs_df, _ScoreStore):
+                        cs_uids = nw.from_native(self._cs_df.uids, series_only=True)
+                    else:
+                        cs_uids = nw.from_native(self._cs_df, eager_only=True)[
+                            self.ts.id_col
+                        ]
+                    cs_ids = set(cs_uids.unique().to_list())
                     if ids is None:
                         active_ids = set(self.ts.uids)
                         if cs_ids != active_ids and new_df is None:
@@ -1778,8 +2086,11 @@ class MLForecast:
                                 "ids= filtering: the weights array aligns with the full calibration "
                                 "set and would misalign after id-based filtering."
                             )
-                        ids_mask = ufp.is_in(self._cs_df[self.ts.id_col], ids)
-                        cs_df = ufp.filter_with_mask(self._cs_df, ids_mask)
+                        if isinstance(self._cs_df, _ScoreStore):
+                            cs_df = self._cs_df.take(ids)
+                        else:
+                            ids_mask = ufp.is_in(self._cs_df[self.ts.id_col], ids)
+                            cs_df = ufp.filter_with_mask(self._cs_df, ids_mask)
                         n_series = len(ids)
                     else:
                         cs_df = self._cs_df
@@ -1807,7 +2118,22 @@ class MLForecast:
                             id_col=self.ts.id_col,
                             source_scales=self._cs_source_scales_,
                         )
-                    if _transfer_result is not None and _transfer_result.signed:
+                    cs_table = getattr(self, "_cs_table", None)
+                    if (
+                        cs_table is not None
+                        and _transfer_result is None
+                        and new_df is None
+                        and ids is None
+                        and cs_table.covers(level_)
+                    ):
+                        forecasts = _add_table_intervals(
+                            forecasts,
+                            cs_table,
+                            model_names=list(model_names),
+                            level=level_,
+                            horizon=h,
+                        )
+                    elif _transfer_result is not None and _transfer_result.signed:
                         forecasts = _add_signed_transfer_intervals(
                             forecasts,
                             cs_df,
@@ -1856,6 +2182,222 @@ class MLForecast:
             if _saved_cs_df is not None:
                 self._cs_df = _saved_cs_df
 
+    def _parallel_cv_windows(
+        self,
+        df: DFType,
+        n_jobs: int,
+        split_kwargs: Dict[str, Any],
+        fit_kwargs: Dict[str, Any],
+        predict_kwargs: Dict[str, Any],
+    ) -> Tuple[List[DFType], List[Dict[str, BaseEstimator]], List[DFType]]:
+        """Trains and predicts every cross validation window in a process pool.
+
+        The splits are computed once here and each worker only receives the
+        rows of its window. At most one window per worker is in flight, so only
+        that many splits are held at once. The state of the last window's fit is
+        kept, like in the sequential loop.
+        Returns the results, models and fitted values in window order."""
+        n_windows = split_kwargs["n_windows"]
+        n_workers = min(n_jobs, n_windows)
+        payload = cloudpickle.dumps(
+            {
+                "fcst": self,
+                "n_windows": n_windows,
+                "fit_kwargs": fit_kwargs,
+                "predict_kwargs": predict_kwargs,
+            }
+        )
+        results = []
+        cv_models = []
+        cv_fitted_values = []
+
+        def collect(future: concurrent.futures.Future) -> None:
+            result, models, fitted_values, fcst_state = future.result()
+            results.append(result)
+            cv_models.append(models)
+            if fitted_values is not None:
+                cv_fitted_values.append(fitted_values)
+            if fcst_state is not None:
+                self.__dict__.update(fcst_state)
+
+        # spawn avoids forking a process that has already started OpenMP threads
+        with concurrent.futures.ProcessPoolExecutor(
+            n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_cv_worker,
+            initargs=(payload,),
+        ) as executor:
+            in_flight: collections.deque = collections.deque()
+            splits = ufp.backtest_splits(df, **split_kwargs)
+            for i_window, (cutoffs, train, valid) in enumerate(splits):
+                if len(in_flight) == n_workers:
+                    collect(in_flight.popleft())
+                in_flight.append(
+                    executor.submit(_run_cv_window, i_window, cutoffs, train, valid)
+                )
+            while in_flight:
+                collect(in_flight.popleft())
+        return results, cv_models, cv_fitted_values
+
+    def _cv_window_predictions(
+        self,
+        cutoffs: DFType,
+        train: DFType,
+        valid: DFType,
+        refit_window: bool,
+        h: int,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        before_predict_callback: Optional[Callable],
+        after_predict_callback: Optional[Callable],
+        level: Optional[List[Union[int, float]]],
+    ) -> DFType:
+        """Predict a cross validation window and merge the actuals."""
+        static = [c for c in self.ts.static_features_.columns if c != id_col]
+        dynamic = [
+            c
+            for c in valid.columns
+            if c not in static + [id_col, time_col, target_col]
+        ]
+        if dynamic:
+            X_df: Optional[DataFrame] = ufp.drop_columns(
+                valid, static + [target_col]
+            )
+        else:
+            X_df = None
+        y_pred = self.predict(
+            h=h,
+            before_predict_callback=before_predict_callback,
+            after_predict_callback=after_predict_callback,
+            new_df=train if not refit_window else None,
+            level=level,
+            X_df=X_df,
+        )
+        y_pred = ufp.join(y_pred, cutoffs, on=id_col, how="left")
+        result = ufp.join(
+            valid[[id_col, time_col, target_col]],
+            y_pred,
+            on=[id_col, time_col],
+        )
+        sort_idxs = ufp.maybe_compute_sort_indices(result, id_col, time_col)
+        if sort_idxs is not None:
+            result = ufp.take_rows(result, sort_idxs)
+        # Calculate expected rows accounting for sparse horizons
+        internal_horizons = getattr(self.ts, "_horizons", None)
+        full_range = (
+            list(range(self.ts.max_horizon)) if self.ts.max_horizon else None
+        )
+        is_sparse = (
+            internal_horizons is not None and internal_horizons != full_range
+        )
+        if is_sparse:
+            # Sparse horizons: expect only predictions for trained horizons <= h
+            assert internal_horizons is not None
+            n_trained_horizons = sum(th < h for th in internal_horizons)
+            n_series = nw.from_native(valid[id_col], series_only=True).n_unique()
+            expected_rows = n_trained_horizons * n_series
+        else:
+            expected_rows = valid.shape[0]
+        if result.shape[0] < expected_rows:
+            raise ValueError(
+                "Cross validation result produced less results than expected. "
+                "Please verify that the frequency set on the MLForecast constructor matches your series' "
+                "and that there aren't any missing periods."
+            )
+        return result
+
+    def _can_reuse_cv_features(
+        self,
+        max_horizon: Optional[int],
+        horizons: Optional[List[int]],
+        input_size: Optional[int],
+    ) -> bool:
+        """Whether the features of each CV window match the ones of the full history.
+
+        The training windows are prefixes of the series, so this holds when every
+        feature only depends on the current and previous values of its serie. Target
+        transforms are fitted on each window (e.g. the scalers' statistics), pooled lag
+        transforms aggregate over other series and functions can look at the whole
+        serie, so those aren't supported, and neither are the targets of the direct
+        approach, which look ahead of each timestamp.
+        """
+        if max_horizon is not None or horizons is not None or input_size is not None:
+            return False
+        if self.ts.target_transforms is not None:
+            return False
+        tfms = self.ts.transforms
+        local_tfms = self.ts._get_local_tfms(tfms)
+        return len(local_tfms) == len(tfms) and all(
+            isinstance(tfm, _BaseLagTransform) for tfm in tfms.values()
+        )
+
+    def _fit_on_features(
+        self,
+        df: DFType,
+        prep: DFType,
+        id_col: str,
+        time_col: str,
+        target_col: str,
+        static_features: Optional[List[str]],
+        keep_last_n: Optional[int],
+        fitted: bool,
+        as_numpy: bool,
+        weight_col: Optional[str],
+        cache_train_df: bool = True,
+    ) -> "MLForecast":
+        """Train the recursive models on `prep`, the features already computed for `df`.
+
+        Leaves the same state as `fit` on `df` with the recursive strategy."""
+        self._reset_fit_state(fitted)
+        self.history_warmup(
+            df,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            static_features=static_features,
+            keep_last_n=keep_last_n,
+            weight_col=weight_col,
+            as_numpy=as_numpy,
+            validate_data=False,
+        )
+        # history_warmup keeps the model shape of a previous fit
+        self.ts.max_horizon = None
+        self.ts._horizons = None
+        base = prep[[id_col, time_col]]
+        X, y = self._extract_X_y(prep, target_col, weight_col)
+        if as_numpy:
+            X = ufp.to_numpy(X)
+        self.fit_models(X, y)
+        if fitted:
+            fitted_values = self._compute_fitted_values(
+                base=base,
+                X=X,
+                y=y,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                max_horizon=None,
+                weight_col=self.ts.weight_col,
+            )
+            self._store_fitted_values(
+                fitted_values, train_df=df if cache_train_df else None
+            )
+        return self
+
+    @staticmethod
+    def _filter_until_cutoffs(
+        df: DFType, cutoffs: DFType, id_col: str, time_col: str
+    ) -> DFType:
+        """Keep the rows of `df` up to the cutoff of their serie."""
+        rows_cutoffs = _order_preserving_left_join(
+            nw.from_native(df[[id_col, time_col]]),
+            nw.from_native(cutoffs),
+            on=[id_col],
+        )
+        mask = (rows_cutoffs[time_col] <= rows_cutoffs["cutoff"]).to_numpy()
+        return ufp.filter_with_mask(df, mask)
+
     def cross_validation(
         self,
         df: DFType,
@@ -1882,6 +2424,8 @@ class MLForecast:
         as_numpy: bool = False,
         weight_col: Optional[str] = None,
         validate_data: bool = True,
+        shared_features: bool = False,
+        n_jobs: int = 1,
     ) -> DFType:
         """Perform time series cross validation.
         Creates `n_windows` splits where each window has `h` test periods,
@@ -1915,6 +2459,12 @@ class MLForecast:
             as_numpy (bool): Cast features to numpy array. Defaults to True.
             weight_col (str, optional): Column that contains the sample weights. Defaults to None.
             validate_data (bool): Run data quality validations on the full dataset before cross-validation. Warns about missing dates and raises on duplicate rows. Defaults to True.
+            shared_features (bool): Compute the features once on the full history and take the training rows of each window from them
+                instead of computing them for every window. Only used when the features of each window are guaranteed to match,
+                i.e. without target transforms, pooled lag transforms, function lag transforms, `input_size`, direct models or `prediction_intervals`;
+                otherwise the features are computed for every window. Defaults to False.
+            n_jobs (int): Number of windows to evaluate concurrently in a process pool. Only used with `refit=True`, since otherwise
+                the windows share their models, and `shared_features` isn't used with it. Use -1 to use all available CPU cores. Defaults to 1.
 
         Returns:
             pandas or polars DataFrame: Predictions for each window with the series id, timestamp, last train date, target value and predictions from each model.
@@ -1926,8 +2476,19 @@ class MLForecast:
         results = []
         cv_models = []
         cv_fitted_values = []
-        splits = ufp.backtest_splits(
-            df,
+        # take the features of the windows from the ones computed once on the
+        # full history when they're guaranteed to match. this is always done for
+        # the fitted values of the windows that aren't refit, and also for the
+        # training of the ones that are with shared_features=True
+        can_reuse_features = self._can_reuse_cv_features(
+            max_horizon=max_horizon, horizons=horizons, input_size=input_size
+        )
+        reuse_features = fitted and can_reuse_features
+        fit_on_shared_features = (
+            shared_features and can_reuse_features and prediction_intervals is None
+        )
+        full_prep: Optional[DFType] = None
+        split_kwargs = dict(
             n_windows=n_windows,
             h=h,
             id_col=id_col,
@@ -1936,65 +2497,133 @@ class MLForecast:
             step_size=step_size,
             input_size=input_size,
         )
+        fit_kwargs = dict(
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            static_features=static_features,
+            dropna=dropna,
+            keep_last_n=keep_last_n,
+            max_horizon=max_horizon,
+            horizons=horizons,
+            horizon_features=horizon_features,
+            horizon_feature_templates=horizon_feature_templates,
+            prediction_intervals=prediction_intervals,
+            fitted=fitted,
+            as_numpy=as_numpy,
+            weight_col=weight_col,
+        )
+        predict_kwargs = dict(
+            h=h,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            before_predict_callback=before_predict_callback,
+            after_predict_callback=after_predict_callback,
+            level=level,
+        )
+        n_jobs = _resolve_num_threads(n_jobs)
+        if n_jobs > 1 and refit is not True:
+            warnings.warn(
+                "`n_jobs` is only used with `refit=True`, the windows will be evaluated sequentially."
+            )
+            n_jobs = 1
+        if n_jobs > 1 and shared_features:
+            warnings.warn(
+                "`shared_features` isn't used with `n_jobs > 1`, the features of each "
+                "window are computed in its worker."
+            )
+        if n_jobs > 1:
+            splits = []
+            results, cv_models, cv_fitted_values = self._parallel_cv_windows(
+                df,
+                n_jobs=n_jobs,
+                split_kwargs=split_kwargs,
+                fit_kwargs=fit_kwargs,
+                predict_kwargs=predict_kwargs,
+            )
+        else:
+            splits = ufp.backtest_splits(df, **split_kwargs)
         for i_window, (cutoffs, train, valid) in enumerate(splits):
             should_fit = i_window == 0 or (refit > 0 and i_window % refit == 0)
-            if should_fit:
-                with warnings.catch_warnings():
-                    warnings.filterwarnings(
-                        "ignore",
-                        message="Pooled.*validate_data",
-                        category=UserWarning,
-                    )
-                    self.fit(
-                        train,
+            if fit_on_shared_features if should_fit else reuse_features:
+                if full_prep is None:
+                    full_prep = self.preprocess(
+                        df,
                         id_col=id_col,
                         time_col=time_col,
                         target_col=target_col,
                         static_features=static_features,
                         dropna=dropna,
                         keep_last_n=keep_last_n,
-                        max_horizon=max_horizon,
-                        horizons=horizons,
-                        horizon_features=horizon_features,
-                        horizon_feature_templates=horizon_feature_templates,
-                        prediction_intervals=prediction_intervals,
-                        fitted=fitted,
-                        as_numpy=as_numpy,
+                        return_X_y=False,
                         weight_col=weight_col,
                         validate_data=False,
                     )
+                window_prep = self._filter_until_cutoffs(
+                    full_prep, cutoffs, id_col=id_col, time_col=time_col
+                )
+            if should_fit and fit_on_shared_features:
+                self._fit_on_features(
+                    train,
+                    window_prep,
+                    id_col=id_col,
+                    time_col=time_col,
+                    target_col=target_col,
+                    static_features=static_features,
+                    keep_last_n=keep_last_n,
+                    fitted=fitted,
+                    as_numpy=as_numpy,
+                    weight_col=weight_col,
+                )
                 cv_models.append(self.models_)
                 if fitted:
                     cv_fitted_values.append(
                         ufp.assign_columns(self.fcst_fitted_values_, "fold", i_window)
                     )
-            if fitted and not should_fit:
-                if self.ts.target_transforms is not None:
-                    for tfm in self.ts.target_transforms:
-                        if hasattr(tfm, "store_fitted"):
-                            tfm.store_fitted = True
+            elif should_fit:
                 with warnings.catch_warnings():
                     warnings.filterwarnings(
                         "ignore",
                         message="Pooled.*validate_data",
                         category=UserWarning,
                     )
-                    prep = self.preprocess(
-                        train,
-                        id_col=id_col,
-                        time_col=time_col,
-                        target_col=target_col,
-                        static_features=static_features,
-                        dropna=dropna,
-                        keep_last_n=keep_last_n,
-                        max_horizon=max_horizon,
-                        horizons=horizons,
-                        horizon_features=horizon_features,
-                        horizon_feature_templates=horizon_feature_templates,
-                        return_X_y=False,
-                        weight_col=weight_col,
-                        validate_data=False,
+                    self.fit(train, validate_data=False, **fit_kwargs)
+                cv_models.append(self.models_)
+                if fitted:
+                    cv_fitted_values.append(
+                        ufp.assign_columns(self.fcst_fitted_values_, "fold", i_window)
                     )
+            if fitted and not should_fit:
+                if self.ts.target_transforms is not None:
+                    for tfm in self.ts.target_transforms:
+                        if hasattr(tfm, "store_fitted"):
+                            tfm.store_fitted = True
+                if reuse_features:
+                    prep = window_prep
+                else:
+                    with warnings.catch_warnings():
+                        warnings.filterwarnings(
+                            "ignore",
+                            message="Pooled.*validate_data",
+                            category=UserWarning,
+                        )
+                        prep = self.preprocess(
+                            train,
+                            id_col=id_col,
+                            time_col=time_col,
+                            target_col=target_col,
+                            static_features=static_features,
+                            dropna=dropna,
+                            keep_last_n=keep_last_n,
+                            max_horizon=max_horizon,
+                            horizons=horizons,
+                            horizon_features=horizon_features,
+                            horizon_feature_templates=horizon_feature_templates,
+                            return_X_y=False,
+                            weight_col=weight_col,
+                            validate_data=False,
+                        )
                 assert not isinstance(prep, tuple)
                 effective_max_horizon = self.ts.max_horizon
                 base = prep[[id_col, time_col]]
@@ -2015,59 +2644,12 @@ class MLForecast:
                 )
                 fitted_values = ufp.assign_columns(fitted_values, "fold", i_window)
                 cv_fitted_values.append(fitted_values)
-            static = [c for c in self.ts.static_features_.columns if c != id_col]
-            dynamic = [
-                c
-                for c in valid.columns
-                if c not in static + [id_col, time_col, target_col]
-            ]
-            if dynamic:
-                X_df: Optional[DataFrame] = ufp.drop_columns(
-                    valid, static + [target_col]
-                )
-            else:
-                X_df = None
-            y_pred = self.predict(
-                h=h,
-                before_predict_callback=before_predict_callback,
-                after_predict_callback=after_predict_callback,
-                new_df=train if not should_fit else None,
-                level=level,
-                X_df=X_df,
+            result = self._cv_window_predictions(
+                cutoffs, train, valid, refit_window=should_fit, **predict_kwargs
             )
-            y_pred = ufp.join(y_pred, cutoffs, on=id_col, how="left")
-            result = ufp.join(
-                valid[[id_col, time_col, target_col]],
-                y_pred,
-                on=[id_col, time_col],
-            )
-            sort_idxs = ufp.maybe_compute_sort_indices(result, id_col, time_col)
-            if sort_idxs is not None:
-                result = ufp.take_rows(result, sort_idxs)
-            # Calculate expected rows accounting for sparse horizons
-            internal_horizons = getattr(self.ts, "_horizons", None)
-            full_range = (
-                list(range(self.ts.max_horizon)) if self.ts.max_horizon else None
-            )
-            is_sparse = (
-                internal_horizons is not None and internal_horizons != full_range
-            )
-            if is_sparse:
-                # Sparse horizons: expect only predictions for trained horizons <= h
-                assert internal_horizons is not None
-                n_trained_horizons = sum(th < h for th in internal_horizons)
-                n_series = nw.from_native(valid[id_col], series_only=True).n_unique()
-                expected_rows = n_trained_horizons * n_series
-            else:
-                expected_rows = valid.shape[0]
-            if result.shape[0] < expected_rows:
-                raise ValueError(
-                    "Cross validation result produced less results than expected. "
-                    "Please verify that the frequency set on the MLForecast constructor matches your series' "
-                    "and that there aren't any missing periods."
-                )
             results.append(result)
-        del self.models_
+        if hasattr(self, "models_"):
+            del self.models_
         self.cv_models_ = cv_models
         self.cv_fitted_values_ = cv_fitted_values
         out = ufp.vertical_concat(results, match_categories=False)
@@ -2085,13 +2667,18 @@ class MLForecast:
         out = ufp.drop_index_if_pandas(out)
         return out[first_out_cols + remaining_cols]
 
-    def save(self, path: Union[str, Path]) -> None:
+    def save(self, path: Union[str, Path], mmap_arrays: bool = False) -> None:
         """Save forecast object
 
         Args:
             path (str or pathlib.Path): Directory where artifacts will be stored.
+            mmap_arrays (bool): Store the large arrays of the series state as `.npy` files that are
+                memory-mapped when loading, which makes loading faster and lets processes share them. Defaults to False.
         """
-        self.ts.save(f"{path}/ts.pkl")
+        if mmap_arrays:
+            self.ts.save(f"{path}/ts", mmap_arrays=True)
+        else:
+            self.ts.save(f"{path}/ts.pkl")
         with fsspec.open(f"{path}/models.pkl", "wb") as f:
             cloudpickle.dump(self.models_, f)
         if self._cs_df is not None:
@@ -2107,7 +2694,10 @@ class MLForecast:
         Args:
             path (str or pathlib.Path): Directory with saved artifacts.
         """
-        ts = TimeSeries.load(f"{path}/ts.pkl")
+        try:
+            ts = TimeSeries.load(f"{path}/ts.pkl")
+        except FileNotFoundError:
+            ts = TimeSeries.load(f"{path}/ts")
         with fsspec.open(f"{path}/models.pkl", "rb") as f:
             models = cloudpickle.load(f)
         try:
@@ -2121,6 +2711,7 @@ class MLForecast:
         if intervals is not None:
             fcst.prediction_intervals = intervals["settings"]
             fcst._cs_df = intervals["scores"]
+            fcst._cs_table = fcst._quantile_table()
         return fcst
 
     def update(self, df: DataFrame, validate_new_data: bool = False) -> None:
@@ -3,7 +3,7 @@ __all__ = ["GroupedArray"]
 
 import concurrent.futures
 import warnings
-from typing import Any, Dict, Mapping, Tuple, Union
+from typing import Any, Dict, Iterator, Mapping, Tuple, Union
 
 import numpy as np
 from coreforecast.grouped_array import GroupedArray as CoreGroupedArray
@@ -57,6 +57,32 @@ def _transform_series_nojit(data, indptr, updates_only, lag, func, *args) -> np.
     )
 
 
+def _append_several(data, indptr, new_sizes, new_values, new_groups, new_indptr):
+    """Copies every existing group followed by its new values into a new array.
+
+    `new_indptr` holds the boundaries of the combined groups."""
+    new_data = np.empty(new_indptr[-1], dtype=data.dtype)
+    old_idx = 0
+    new_vals_idx = 0
+    for i in range(new_sizes.size):
+        start = new_indptr[i]
+        if not new_groups[i]:
+            old_start = indptr[old_idx]
+            old_end = indptr[old_idx + 1]
+            new_data[start : start + old_end - old_start] = data[old_start:old_end]
+            start += old_end - old_start
+            old_idx += 1
+        n_new = new_sizes[i]
+        new_data[start : start + n_new] = new_values[
+            new_vals_idx : new_vals_idx + n_new
+        ]
+        new_vals_idx += n_new
+    return new_data
+
+
+_jitted_append_several = njit(_append_several, nogil=True)
+
+
 class GroupedArray:
     """Array made up of different groups. Can be thought of (and iterated) as a list of arrays.
 
@@ -175,17 +201,26 @@ class GroupedArray:
         return results
 
     def expand_target(self, max_horizon: int) -> np.ndarray:
-        out = np.full_like(
-            self.data, np.nan, shape=(self.data.size, max_horizon), order="F"
-        )
-        for j in range(max_horizon):
-            for i in range(self.n_groups):
-                if self.indptr[i + 1] - self.indptr[i] > j:
-                    out[self.indptr[i] : self.indptr[i + 1] - j, j] = self.data[
-                        self.indptr[i] + j : self.indptr[i + 1]
-                    ]
+        """Matrix whose column `j` has the value `j` steps ahead of each row."""
+        out = np.empty_like(self.data, shape=(self.data.size, max_horizon), order="F")
+        for j, target in enumerate(self.iter_target_horizons(max_horizon)):
+            out[:, j] = target
         return out
 
+    def iter_target_horizons(self, max_horizon: int) -> Iterator[np.ndarray]:
+        """Yields the columns of `expand_target` one at a time."""
+        # number of values from each row to the end of its group (inclusive)
+        rows = np.arange(self.data.size)
+        remaining = np.repeat(self.indptr[1:], np.diff(self.indptr)) - rows
+        for j in range(max_horizon):
+            # rows that still have a value j steps ahead in their group
+            keep = remaining > j
+            rows = rows[keep]
+            remaining = remaining[keep]
+            out = np.full_like(self.data, np.nan)
+            out[rows] = self.data[rows + j]
+            yield out
+
     def take_from_groups(self, idx: Union[int, slice]) -> "GroupedArray":
         """Takes `idx` from each group in the array."""
         ranges = [
@@ -211,31 +246,67 @@ class GroupedArray:
     def append_several(
         self, new_sizes: np.ndarray, new_values: np.ndarray, new_groups: np.ndarray
     ) -> "GroupedArray":
-        new_data = np.empty(self.data.size + new_values.size, dtype=self.data.dtype)
-        new_indptr = np.empty(new_sizes.size + 1, dtype=self.indptr.dtype)
+        """Appends `new_sizes[i]` values from `new_values` to the i-th group.
+
+        The groups flagged in `new_groups` don't exist yet and are inserted.
+        Returns a copy."""
+        sizes = new_sizes.astype(self.indptr.dtype)
+        sizes[~new_groups] += np.diff(self.indptr)
+        new_indptr = np.empty(sizes.size + 1, dtype=self.indptr.dtype)
         new_indptr[0] = 0
-        old_indptr_idx = 0
-        new_vals_idx = 0
-        for i, is_new in enumerate(new_groups):
-            new_size = new_sizes[i]
-            if is_new:
-                old_size = 0
-            else:
-                prev_slice = slice(
-                    self.indptr[old_indptr_idx], self.indptr[old_indptr_idx + 1]
-                )
-                old_indptr_idx += 1
-                old_size = prev_slice.stop - prev_slice.start
-                new_size += old_size
-                new_data[new_indptr[i] : new_indptr[i] + old_size] = self.data[
-                    prev_slice
-                ]
-            new_indptr[i + 1] = new_indptr[i] + new_size
-            new_data[new_indptr[i] + old_size : new_indptr[i + 1]] = new_values[
-                new_vals_idx : new_vals_idx + new_sizes[i]
-            ]
-            new_vals_idx += new_sizes[i]
+        np.cumsum(sizes, out=new_indptr[1:])
+        new_values = new_values.astype(self.data.dtype, copy=False)
+        if hasattr(_jitted_append_several, "nopython_signatures"):
+            append_fn = _jitted_append_several
+        else:
+            append_fn = _append_several
+        new_data = append_fn(
+            self.data, self.indptr, new_sizes, new_values, new_groups, new_indptr
+        )
         return GroupedArray(new_data, new_indptr)
 
+    def reserve(self, capacity: int) -> "GroupedArray":
+        """Copies the array into a buffer with room to append `capacity` values per group.
+
+        Appending to the returned array writes the new values in place instead of
+        copying all the groups on every call."""
+        return _ReservedGroupedArray(self, capacity)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(ndata={self.data.size}, n_groups={self.n_groups})"
+
+
+class _ReservedGroupedArray(GroupedArray):
+    """GroupedArray with `capacity` slots of slack after the values of each group.
+
+    The groups must be contiguous, so the unused slack of a group shows up as
+    leading nulls of the next one. The lag transforms start every group at its
+    first non-null value, so they produce the same results as on the compact array.
+    Appending writes into the slack and advances the group boundaries."""
+
+    def __init__(self, ga: GroupedArray, capacity: int):
+        sizes = np.diff(ga.indptr)
+        shifts = np.arange(ga.n_groups) * capacity
+        self._buffer = np.full(
+            ga.data.size + shifts.size * capacity, np.nan, dtype=ga.data.dtype
+        )
+        self._buffer[np.arange(ga.data.size) + np.repeat(shifts, sizes)] = ga.data
+        self._ends = ga.indptr[1:] + shifts
+        self._remaining = capacity
+        indptr = np.append(0, self._ends)
+        super().__init__(self._buffer[: indptr[-1]], indptr)
+
+    def append(self, new_data: np.ndarray) -> GroupedArray:
+        """Appends each element of `new_data` to each existing group in place.
+
+        Falls back to copying once the reserved capacity has been used."""
+        if not self._remaining:
+            return super().append(new_data)
+        if new_data.size != self.n_groups:
+            raise ValueError(f"`new_data` must be of size {self.n_groups:,}")
+        self._buffer[self._ends] = new_data
+        self._ends += 1
+        self._remaining -= 1
+        self.indptr = np.append(0, self._ends)
+        self.data = self._buffer[: self.indptr[-1]]
+        return self
@@ -21,16 +21,21 @@ __all__ = [
 ]
 
 
+import concurrent.futures
+import contextvars
 import copy
+import functools
 import inspect
 import re
 import warnings
-from typing import Callable, Dict, Optional, Protocol, Sequence
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Protocol, Sequence
 
 import coreforecast.lag_transforms as core_tfms
 import numpy as np
 from coreforecast.grouped_array import GroupedArray as CoreGroupedArray
 from sklearn.base import BaseEstimator
+from utilsforecast.compat import njit
 
 
 def _pascal2camel(pascal_str: str) -> str:
@@ -82,35 +87,517 @@ def _validate_time_agg(time_agg, global_, groupby, *, allow_none=True, scope_exe
         )
 
 
-def _build_sparse_table(arr, op):
-    n = len(arr)
-    if n == 0:
-        return np.empty((1, 0))
-    K = max(1, int(np.log2(n)) + 1)
-    table = np.full((K, n), np.nan)
-    table[0] = arr
-    for j in range(1, K):
-        step = 1 << (j - 1)
-        valid = n - (1 << j) + 1
-        if valid <= 0:
-            break
-        table[j, :valid] = op(table[j - 1, :valid], table[j - 1, step : step + valid])
-    return table
-
-
-def _query_sparse_table(table, lefts, rights, op):
-    lengths = rights - lefts + 1
-    valid = lengths > 0
-    k = np.zeros_like(lengths)
-    k[valid] = np.floor(np.log2(lengths[valid])).astype(int)
-    result = np.full(len(lefts), np.nan)
-    v = valid & (lefts >= 0)
-    if v.any():
-        left_vals = table[k[v], lefts[v]]
-        right_idx = rights[v] - (1 << k[v]) + 1
-        right_vals = table[k[v], right_idx]
-        result[v] = op(left_vals, right_vals)
-    return result
+# Pooled kernels only split their work in ranges of at least this many queries
+# (or pending timestamps), see `_pooled_executor`.
+_MIN_RANGE_SIZE = 4096
+
+# executor and number of threads the pooled kernels run by this thread use
+_POOLED_EXECUTOR: contextvars.ContextVar = contextvars.ContextVar(
+    "_POOLED_EXECUTOR", default=None
+)
+
+
+@contextmanager
+def _pooled_executor(
+    executor: concurrent.futures.Executor, num_threads: int
+) -> Iterator[None]:
+    """Splits the pooled kernels run by the calling thread across ``executor``.
+
+    The setting is local to the calling thread, so the work submitted to the
+    executor never submits more work to it."""
+    token = _POOLED_EXECUTOR.set((executor, num_threads))
+    try:
+        yield
+    finally:
+        _POOLED_EXECUTOR.reset(token)
+
+
+def _range_bounds(n: int, work: Optional[np.ndarray] = None) -> np.ndarray:
+    """Bounds of the ranges ``range(n)`` is split into, one per thread.
+
+    With ``work`` every range gets about the same total work instead of the
+    same number of items."""
+    setting = _POOLED_EXECUTOR.get()
+    total = n if work is None else int(work.sum())
+    n_ranges = 1 if setting is None else min(setting[1], total // _MIN_RANGE_SIZE)
+    if n_ranges <= 1:
+        return np.array([0, n])
+    targets = np.linspace(0, total, n_ranges + 1)[1:-1]
+    if work is None:
+        cuts = targets.astype(np.int64)
+    else:
+        cuts = np.searchsorted(np.cumsum(work), targets)
+    return np.unique(np.concatenate([[0], cuts, [n]]))
+
+
+def _run_ranges(fn: Callable[[int, int], None], bounds: np.ndarray) -> None:
+    """``fn(start, end)`` for every range, on the executor if there are several."""
+    if bounds.size <= 2:
+        fn(int(bounds[0]), int(bounds[-1]))
+        return
+    executor, _ = _POOLED_EXECUTOR.get()
+    futures = [
+        executor.submit(fn, int(start), int(end))
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+    for future in futures:
+        future.result()
+
+
+def _timestamp_stats(code, sums, counts, sum_sq, mins, maxs, j):
+    """Sum, count, sum of squares, min and max of the ``j``-th stored timestamp.
+
+    ``code`` is 0 for the raw aggregates or ``1 + _TIME_AGGS.index(time_agg)``,
+    which turns the timestamp into a single observation of its ``time_agg``
+    value, like ``_ReaggregatedAggregates``."""
+    s, c, mn, mx = sums[j], counts[j], mins[j], maxs[j]
+    if code == 0:
+        return s, c, sum_sq[j], mn, mx
+    if code == 2:
+        v = c
+    elif code == 4:
+        v = mn
+    elif code == 5:
+        v = mx
+    elif c > 0:
+        v = s if code == 1 else s / c
+    else:
+        v = np.nan
+    if np.isnan(v):
+        return 0.0, 0.0, 0.0, v, v
+    return v, 1.0, v * v, v, v
+
+
+_jitted_timestamp_stats = njit(_timestamp_stats, nogil=True)
+
+
+def _count_at_or_before(times, starts, lens, bucket_ids, bounds, out, start, end):
+    """Number of timestamps of the bucket of every query that are at most its bound."""
+    for q in range(start, end):
+        b = bucket_ids[q]
+        lo = 0
+        hi = lens[b] if 0 <= b < lens.size else 0
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if times[starts[b] + mid] <= bounds[q]:
+                lo = mid + 1
+            else:
+                hi = mid
+        out[q] = lo
+
+
+_jitted_count_at_or_before = njit(_count_at_or_before, nogil=True)
+
+
+def _gather_prefix(arr, starts, bucket_ids, k, default, out, start, end):
+    """Value of ``arr`` at the ``k``-th timestamp of the bucket of every query."""
+    for q in range(start, end):
+        if k[q] > 0:
+            out[q] = arr[starts[bucket_ids[q]] + k[q] - 1]
+        else:
+            out[q] = default
+
+
+_jitted_gather_prefix = njit(_gather_prefix, nogil=True)
+
+
+def _sliding_extremes(
+    stats,
+    code,
+    sums,
+    counts,
+    sum_sq,
+    mins,
+    maxs,
+    starts,
+    bucket_ids,
+    lo,
+    hi,
+    order,
+    width,
+    use_max,
+    out,
+    start,
+    end,
+):
+    """Minimum (or maximum), skipping NaNs, of the timestamps ``[lo, hi)`` of
+    the bucket of the queries ``order[start:end]``.
+
+    The queries are sorted by bucket and window, so both ends of the windows
+    only move forward within a bucket. A monotonic deque of candidate positions
+    slides over the bucket in a ring buffer of ``width`` slots, the longest
+    window, so it runs in linear time and O(width) extra memory."""
+    cap = max(1, width)
+    pos = np.empty(cap, dtype=np.int64)
+    vals = np.empty(cap)
+    head = 0
+    tail = 0
+    bucket = -1
+    pushed = 0
+    for k in range(start, end):
+        q = order[k]
+        if hi[q] <= lo[q]:
+            out[q] = np.nan
+            continue
+        if bucket_ids[q] != bucket:
+            bucket = bucket_ids[q]
+            head = tail
+            pushed = lo[q]
+        # drop the positions leaving the window before pushing, the deque then
+        # never holds more than the window's positions
+        while tail > head and pos[head % cap] < lo[q]:
+            head += 1
+        if pushed < lo[q]:
+            pushed = lo[q]
+        while pushed < hi[q]:
+            j = starts[bucket] + pushed
+            _, _, _, mn, mx = stats(code, sums, counts, sum_sq, mins, maxs, j)
+            v = mx if use_max else mn
+            if not np.isnan(v):
+                while tail > head and (
+                    vals[(tail - 1) % cap] <= v
+                    if use_max
+                    else vals[(tail - 1) % cap] >= v
+                ):
+                    tail -= 1
+                pos[tail % cap] = pushed
+                vals[tail % cap] = v
+                tail += 1
+            pushed += 1
+        out[q] = vals[head % cap] if tail > head else np.nan
+
+
+_jitted_sliding_extremes = njit(_sliding_extremes, nogil=True)
+
+
+def _scan_counts(
+    stats,
+    code,
+    sums,
+    counts,
+    sum_sq,
+    mins,
+    maxs,
+    starts,
+    lens,
+    done,
+    cum_c,
+    buckets,
+    start,
+    end,
+):
+    """Cumulative counts of ``buckets[start:end]`` from their ``done``-th
+    timestamp."""
+    for k in range(start, end):
+        b = buckets[k]
+        for i in range(done[b], lens[b]):
+            j = starts[b] + i
+            _, c, _, _, _ = stats(code, sums, counts, sum_sq, mins, maxs, j)
+            cum_c[j] = c + cum_c[j - 1] if i > 0 else c
+
+
+_jitted_scan_counts = njit(_scan_counts, nogil=True)
+
+
+def _scan_moments(
+    stats,
+    code,
+    sums,
+    counts,
+    sum_sq,
+    mins,
+    maxs,
+    starts,
+    lens,
+    done,
+    cum_s,
+    cum_c,
+    cum_sq,
+    buckets,
+    start,
+    end,
+):
+    """Cumulative sums, counts and sums of squares of ``buckets[start:end]``
+    from their ``done``-th timestamp."""
+    for k in range(start, end):
+        b = buckets[k]
+        for i in range(done[b], lens[b]):
+            j = starts[b] + i
+            s, c, sq, _, _ = stats(code, sums, counts, sum_sq, mins, maxs, j)
+            if i > 0:
+                s += cum_s[j - 1]
+                c += cum_c[j - 1]
+                sq += cum_sq[j - 1]
+            cum_s[j] = s
+            cum_c[j] = c
+            cum_sq[j] = sq
+
+
+_jitted_scan_moments = njit(_scan_moments, nogil=True)
+
+
+def _scan_extremes(
+    stats,
+    code,
+    sums,
+    counts,
+    sum_sq,
+    mins,
+    maxs,
+    starts,
+    lens,
+    done,
+    cum_min,
+    cum_max,
+    buckets,
+    start,
+    end,
+):
+    """Running minimum and maximum, skipping NaNs, of ``buckets[start:end]``
+    from their ``done``-th timestamp."""
+    for k in range(start, end):
+        b = buckets[k]
+        for i in range(done[b], lens[b]):
+            j = starts[b] + i
+            _, _, _, mn, mx = stats(code, sums, counts, sum_sq, mins, maxs, j)
+            if i > 0:
+                if np.isnan(mn) or cum_min[j - 1] < mn:
+                    mn = cum_min[j - 1]
+                if np.isnan(mx) or cum_max[j - 1] > mx:
+                    mx = cum_max[j - 1]
+            cum_min[j] = mn
+            cum_max[j] = mx
+
+
+_jitted_scan_extremes = njit(_scan_extremes, nogil=True)
+
+
+def _scan_ewm(
+    stats,
+    code,
+    sums,
+    counts,
+    sum_sq,
+    mins,
+    maxs,
+    starts,
+    lens,
+    done,
+    alpha,
+    ewm,
+    buckets,
+    start,
+    end,
+):
+    """Exponentially weighted mean of the timestamp means of
+    ``buckets[start:end]`` from their ``done``-th timestamp, skipping the
+    timestamps without observations."""
+    for k in range(start, end):
+        b = buckets[k]
+        for i in range(done[b], lens[b]):
+            j = starts[b] + i
+            s, c, _, _, _ = stats(code, sums, counts, sum_sq, mins, maxs, j)
+            prev = ewm[j - 1] if i > 0 else np.nan
+            if c > 0:
+                x = s / c
+                ewm[j] = x if np.isnan(prev) else alpha * x + (1 - alpha) * prev
+            else:
+                ewm[j] = prev
+
+
+_jitted_scan_ewm = njit(_scan_ewm, nogil=True)
+
+
+def _kernel(kernel: Callable, jitted: Callable, with_stats: bool = False) -> Callable:
+    """``jitted`` if numba is available, else ``kernel``.
+
+    ``with_stats`` binds the matching ``_timestamp_stats`` as first argument."""
+    if hasattr(jitted, "nopython_signatures"):
+        fn, stats = jitted, _jitted_timestamp_stats
+    else:
+        fn, stats = kernel, _timestamp_stats
+    return functools.partial(fn, stats) if with_stats else fn
+
+
+def _target_ordinals(target_ords, size: int) -> np.ndarray:
+    """``target_ords[bid]`` for every bucket id below ``size``, -1 when missing."""
+    if hasattr(target_ords, "lookup"):
+        return target_ords.lookup(np.arange(size))
+    bids = np.fromiter(target_ords.keys(), dtype=np.int64, count=len(target_ords))
+    ords = np.fromiter(target_ords.values(), dtype=np.int64, count=len(target_ords))
+    out = np.full(size, -1, dtype=np.int64)
+    keep = bids < size
+    out[bids[keep]] = ords[keep]
+    return out
+
+
+class _BucketWindows:
+    """Windows of the pooled aggregates that end before a set of queries.
+
+    Query ``q`` asks about the timestamps of bucket ``bucket_ids[q]`` before
+    ``times[q]``. Reads the flat arrays behind the aggregates (see
+    ``_BucketAggregates``): a window is located with a binary search in its
+    bucket and its sums come from running statistics, which are only updated
+    for the appended timestamps. The kernels release the GIL and run over
+    ranges of the queries, which are split across the threads of
+    ``_pooled_executor``, so a large bucket is shared by several threads.
+
+    Nothing is computed until a statistic is requested, so building the
+    windows for a transform that doesn't use them is free."""
+
+    def __init__(self, ts_aggs, bucket_ids=None, times=None, target_ords=None):
+        self._ts_aggs = ts_aggs
+        self._bucket_ids = bucket_ids
+        self._times = times
+        self._target_ords = target_ords
+
+    @functools.cached_property
+    def _flat(self):
+        from .pooled import _flat_aggregates
+
+        aggs, time_agg = _flat_aggregates(self._ts_aggs)
+        code = 0 if time_agg is None else 1 + _TIME_AGGS.index(time_agg)
+        return aggs, code
+
+    @property
+    def aggs(self):
+        return self._flat[0]
+
+    @property
+    def code(self) -> int:
+        return self._flat[1]
+
+    @functools.cached_property
+    def queries(self):
+        """Bucket id and time ordinal of every query."""
+        if self._target_ords is not None:
+            size = self.aggs.lens.size
+            return np.arange(size), _target_ordinals(self._target_ords, size)
+        return (
+            np.asarray(self._bucket_ids, dtype=np.int64),
+            np.asarray(self._times, dtype=np.int64),
+        )
+
+    @classmethod
+    def latest(cls, ts_aggs, target_ords) -> "_BucketWindows":
+        """One query per bucket id, at its ``target_ords`` ordinal."""
+        return cls(ts_aggs, target_ords=target_ords)
+
+    def _stat_arrays(self):
+        fields = self.aggs.fields
+        return tuple(
+            fields[name] for name in ("sums", "counts", "sum_sq", "mins", "maxs")
+        )
+
+    def _run(self, fn: Callable, *args) -> None:
+        """``fn(*args, start, end)`` over the ranges of the queries."""
+        n = self.queries[0].size
+        _run_ranges(functools.partial(fn, *args), _range_bounds(n))
+
+    def count_before(self, offset: int) -> np.ndarray:
+        """Number of timestamps of every query at least ``offset`` before it."""
+        bucket_ids, times = self.queries
+        out = np.empty(bucket_ids.size, dtype=np.int64)
+        self._run(
+            _kernel(_count_at_or_before, _jitted_count_at_or_before),
+            self.aggs.fields["unique_times"],
+            self.aggs.starts,
+            self.aggs.lens,
+            bucket_ids,
+            times - offset,
+            out,
+        )
+        return out
+
+    def _at(self, arr: np.ndarray, k: np.ndarray, default: float) -> np.ndarray:
+        """Value of ``arr`` at the ``k``-th timestamp of every query."""
+        out = np.empty(k.size)
+        self._run(
+            _kernel(_gather_prefix, _jitted_gather_prefix),
+            arr,
+            self.aggs.starts,
+            self.queries[0],
+            k,
+            default,
+            out,
+        )
+        return out
+
+    def _prefix(self, key, n_outputs, kernel, jitted, *extra):
+        def scan(aggs, done, outs):
+            pending = np.maximum(aggs.lens, 0) - done
+            buckets = np.flatnonzero(pending > 0)
+            fn = functools.partial(
+                _kernel(kernel, jitted, with_stats=True),
+                self.code,
+                *self._stat_arrays(),
+                aggs.starts,
+                aggs.lens,
+                done,
+                *extra,
+                *outs,
+                buckets,
+            )
+            _run_ranges(fn, _range_bounds(buckets.size, pending[buckets]))
+
+        # the scan reads the fields after `prefix` gave the store its own arrays
+        return self.aggs.prefix((key, self.code) + extra, n_outputs, scan)
+
+    def counts(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """Number of observations in the timestamps ``[lo, hi)``."""
+        (cum,) = self._prefix("counts", 1, _scan_counts, _jitted_scan_counts)
+        return self._at(cum, hi, 0.0) - self._at(cum, lo, 0.0)
+
+    def moments(self, lo: np.ndarray, hi: np.ndarray):
+        """Sum, count and sum of squares of the timestamps ``[lo, hi)``."""
+        cums = self._prefix("moments", 3, _scan_moments, _jitted_scan_moments)
+        return tuple(self._at(cum, hi, 0.0) - self._at(cum, lo, 0.0) for cum in cums)
+
+    def extremes_up_to(self, hi: np.ndarray):
+        """Minimum and maximum of the first ``hi`` timestamps."""
+        cums = self._prefix("extremes", 2, _scan_extremes, _jitted_scan_extremes)
+        return tuple(self._at(cum, hi, np.nan) for cum in cums)
+
+    def window_extreme(self, lo: np.ndarray, hi: np.ndarray, use_max: bool):
+        """Minimum (or maximum) of the timestamps ``[lo, hi)``.
+
+        The windows of a bucket have to move forward together, like the ones
+        of a fixed number of periods before every query do."""
+        bucket_ids = self.queries[0]
+        out = np.empty(lo.size)
+        if not lo.size:
+            return out
+        self._run(
+            _kernel(_sliding_extremes, _jitted_sliding_extremes, with_stats=True),
+            self.code,
+            *self._stat_arrays(),
+            self.aggs.starts,
+            bucket_ids,
+            lo,
+            hi,
+            np.lexsort((lo, hi, bucket_ids)),
+            int((hi - lo).max()),
+            use_max,
+            out,
+        )
+        return out
+
+    def ewm_up_to(self, hi: np.ndarray, alpha: float) -> np.ndarray:
+        """Exponentially weighted mean of the first ``hi`` timestamps."""
+        (ewm,) = self._prefix("ewm", 1, _scan_ewm, _jitted_scan_ewm, float(alpha))
+        return self._at(ewm, hi, np.nan)
+
+
+def _window_mean(s, c, min_samples):
+    ok = (c >= min_samples) & (c > 0)
+    return np.where(ok, s / np.where(ok, c, 1.0), np.nan)
+
+
+def _window_std(s, c, sq, min_samples):
+    ok = (c >= min_samples) & (c > 1)
+    safe_c = np.where(ok, c, 2.0)
+    var = np.maximum((sq - s**2 / safe_c) / (safe_c - 1), 0.0)
+    return np.where(ok, np.sqrt(var), np.nan)
 
 
 class _BaseLagTransform(BaseEstimator):
@@ -175,11 +662,16 @@ class _BaseLagTransform(BaseEstimator):
     # ``Combine`` override the public hooks instead, so each inner transform
     # applies its own re-aggregation. Re-aggregation is lazy (see
     # ``_ReaggregatedAggregates``), so applying it before an unsupported
-    # ``_impl`` that returns ``None`` costs nothing.
+    # ``_impl`` that returns ``None`` costs nothing. The transforms that read
+    # the aggregates only define ``_window_values``, which the aggregate
+    # ``_impl`` methods evaluate on the windows of their queries.
+    def _window_values(self, _windows: "_BucketWindows") -> Optional[np.ndarray]:
+        return None
+
     def _bucket_feature_from_aggs_impl(
-        self, _bid_arr, _ord_arr, _ts_aggs
+        self, bid_arr, ord_arr, ts_aggs
     ) -> Optional[np.ndarray]:
-        return None
+        return self._window_values(_BucketWindows(ts_aggs, bid_arr, ord_arr))
 
     def _bucket_feature_rows_impl(
         self, _bid_arr, _ord_arr, _y_arr
@@ -187,12 +679,9 @@ class _BaseLagTransform(BaseEstimator):
         return None
 
     def _latest_from_aggs_impl(
-        self, _ts_aggs, _target_ords
-    ) -> Optional[Dict[int, float]]:
-        return None
-
-    def _ts_level_from_aggs_impl(self, _ts_aggs) -> Optional[Dict[int, np.ndarray]]:
-        return None
+        self, ts_aggs, target_ords
+    ) -> Optional[np.ndarray]:
+        return self._window_values(_BucketWindows.latest(ts_aggs, target_ords))
 
     @property
     def _pooled_time_agg(self) -> Optional[str]:
@@ -207,12 +696,9 @@ class _BaseLagTransform(BaseEstimator):
         y_arr: np.ndarray,
         _ts_aggs=None,
     ) -> Optional[np.ndarray]:
-        if _ts_aggs:
-            out = self._bucket_feature_from_aggs_impl(
-                bid_arr, ord_arr, self._maybe_reagg(_ts_aggs)
-            )
-            if out is not None:
-                return out
+        out = self._compute_feature_from_aggs(_ts_aggs, bid_arr, ord_arr)
+        if out is not None:
+            return out
         if self._pooled_time_agg:
             return self._compute_bucket_feature_collapsed(
                 bid_arr, ord_arr, y_arr, _ts_aggs
@@ -223,21 +709,32 @@ class _BaseLagTransform(BaseEstimator):
         self,
         ts_aggs,
         target_ords: Dict[int, int],
-    ) -> Optional[Dict[int, float]]:
+    ) -> Optional[np.ndarray]:
         """Compute feature value at the target timestamp per bucket from cached aggregates.
 
         ``target_ords`` maps bucket_id to the time-index ordinal at which to
         evaluate the statistic (typically ``next_time_index_by_bucket``).
-        Returns None if this transform doesn't support the fast path.
+        Returns an array indexed by bucket id (NaN for ids without aggregates),
+        or None if this transform doesn't support the fast path.
         """
         if not ts_aggs:
             return None
         return self._latest_from_aggs_impl(self._maybe_reagg(ts_aggs), target_ords)
 
-    def _compute_ts_level_from_aggs(self, ts_aggs):
+    def _compute_feature_from_aggs(
+        self,
+        ts_aggs,
+        bid_arr: np.ndarray,
+        ord_arr: np.ndarray,
+    ) -> Optional[np.ndarray]:
+        """Compute the feature of every ``(bid_arr, ord_arr)`` row from the aggregates.
+
+        Returns None if this transform doesn't support the fast path."""
         if not ts_aggs:
             return None
-        return self._ts_level_from_aggs_impl(self._maybe_reagg(ts_aggs))
+        return self._bucket_feature_from_aggs_impl(
+            bid_arr, ord_arr, self._maybe_reagg(ts_aggs)
+        )
 
     def _maybe_reagg(self, ts_aggs):
         """Return per-timestamp aggregates collapsed by ``_pooled_time_agg``,
@@ -443,7 +940,7 @@ class LookupLag(_BaseLagTransform):
         self,
         ts_aggs,
         _target_ords,
-    ) -> Optional[Dict[int, float]]:
+    ) -> Optional[np.ndarray]:
         # Fast predict path: the looked-up value is the target `lag` occurrences
         # back. In local partition mode each bucket is a single series (one
         # observation per timestamp), so ``agg.sums[-lag] / agg.counts[-lag]`` is
@@ -453,14 +950,16 @@ class LookupLag(_BaseLagTransform):
         # history and building unused aggregates at every recursive step.
         if not ts_aggs:
             return None
+        from .pooled import _flat_aggregates
+
+        aggs, _ = _flat_aggregates(ts_aggs)
         lag = self._core_tfm.lag
-        result: Dict[int, float] = {}
-        for bid, agg in ts_aggs.items():
-            if len(agg.unique_times) < lag:
-                result[bid] = float("nan")
-            else:
-                count = agg.counts[-lag]
-                result[bid] = agg.sums[-lag] / count if count > 0 else float("nan")
+        result = np.full(aggs.lens.size, np.nan)
+        bids = np.flatnonzero(aggs.lens >= lag)
+        pos = aggs.starts[bids] + aggs.lens[bids] - lag
+        counts = aggs.fields["counts"][pos]
+        has = counts > 0
+        result[bids[has]] = aggs.fields["sums"][pos[has]] / counts[has]
         return result
 
     @property
@@ -613,74 +1112,7 @@ class _RollingBase(_BaseLagTransform):
         )
 
 
-def _rolling_mean_from_agg(agg, lag, window_size, min_samples):
-    cum_sum = np.cumsum(agg.sums)
-    cum_cnt = np.cumsum(agg.counts)
-    upper_ord = agg.unique_times - lag
-    lower_ord = agg.unique_times - lag - window_size
-    upper_idxs = np.searchsorted(agg.unique_times, upper_ord, side="right") - 1
-    lower_idxs = np.searchsorted(agg.unique_times, lower_ord, side="right") - 1
-    upper_sum = np.where(upper_idxs >= 0, cum_sum[upper_idxs], 0.0)
-    upper_cnt = np.where(upper_idxs >= 0, cum_cnt[upper_idxs], 0.0)
-    lower_sum = np.where(lower_idxs >= 0, cum_sum[lower_idxs], 0.0)
-    lower_cnt = np.where(lower_idxs >= 0, cum_cnt[lower_idxs], 0.0)
-    win_sum = upper_sum - lower_sum
-    win_cnt = upper_cnt - lower_cnt
-    safe_cnt = np.where(win_cnt > 0, win_cnt, 1.0)
-    return np.where(
-        (win_cnt >= min_samples) & (win_cnt > 0), win_sum / safe_cnt, np.nan
-    )
-
-
 class RollingMean(_RollingBase):
-    def _latest_from_aggs_impl(
-        self,
-        ts_aggs,
-        target_ords: Dict[int, int],
-    ) -> Dict[int, float]:
-        lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        result: Dict[int, float] = {}
-        for bid, agg in ts_aggs.items():
-            if len(agg.unique_times) == 0:
-                result[bid] = float("nan")
-                continue
-            cum_sum = np.cumsum(agg.sums)
-            cum_cnt = np.cumsum(agg.counts)
-            t = target_ords[bid]
-            upper = t - lag
-            lower = t - lag - w
-            ui = int(np.searchsorted(agg.unique_times, upper, side="right")) - 1
-            li = int(np.searchsorted(agg.unique_times, lower, side="right")) - 1
-            s = (cum_sum[ui] if ui >= 0 else 0.0) - (cum_sum[li] if li >= 0 else 0.0)
-            c = (cum_cnt[ui] if ui >= 0 else 0.0) - (cum_cnt[li] if li >= 0 else 0.0)
-            result[bid] = s / c if c >= min_samples and c > 0 else float("nan")
-        return result
-
-    def _ts_level_from_aggs_impl(self, ts_aggs):
-        lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        return {
-            bid: _rolling_mean_from_agg(agg, lag, w, min_samples)
-            for bid, agg in ts_aggs.items()
-        }
-
-    def _bucket_feature_from_aggs_impl(self, bid_arr, ord_arr, ts_aggs):
-        lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        n = len(bid_arr)
-        result = np.empty(n)
-        result[:] = np.nan
-        for bid, agg in ts_aggs.items():
-            idxs = np.where(bid_arr == bid)[0]
-            feat_u = _rolling_mean_from_agg(agg, lag, w, min_samples)
-            inv = np.searchsorted(agg.unique_times, ord_arr[idxs])
-            result[idxs] = feat_u[inv]
-        return result
-
     def _bucket_feature_rows_impl(self, bid_arr, ord_arr, y_arr):
         lag = self._core_tfm.lag
         w = self.window_size
@@ -717,233 +1149,52 @@ class RollingMean(_RollingBase):
             result[idxs] = feat_u[inv]
         return result
 
-
-def _rolling_std_from_agg(agg, lag, window_size, min_samples):
-    cum_sum = np.cumsum(agg.sums)
-    cum_cnt = np.cumsum(agg.counts)
-    cum_sum_sq = np.cumsum(agg.sum_sq)
-    upper_ord = agg.unique_times - lag
-    lower_ord = agg.unique_times - lag - window_size
-    upper_idxs = np.searchsorted(agg.unique_times, upper_ord, side="right") - 1
-    lower_idxs = np.searchsorted(agg.unique_times, lower_ord, side="right") - 1
-    upper_s = np.where(upper_idxs >= 0, cum_sum[upper_idxs], 0.0)
-    lower_s = np.where(lower_idxs >= 0, cum_sum[lower_idxs], 0.0)
-    upper_sq = np.where(upper_idxs >= 0, cum_sum_sq[upper_idxs], 0.0)
-    lower_sq = np.where(lower_idxs >= 0, cum_sum_sq[lower_idxs], 0.0)
-    upper_c = np.where(upper_idxs >= 0, cum_cnt[upper_idxs], 0.0)
-    lower_c = np.where(lower_idxs >= 0, cum_cnt[lower_idxs], 0.0)
-    win_sum = upper_s - lower_s
-    win_sq = upper_sq - lower_sq
-    win_cnt = upper_c - lower_c
-    safe_n = np.where(win_cnt > 0, win_cnt, 1.0)
-    den = np.where(win_cnt > 1, win_cnt - 1, 1.0)
-    var = (win_sq - win_sum**2 / safe_n) / den
-    var = np.maximum(var, 0.0)
-    return np.where((win_cnt >= min_samples) & (win_cnt > 1), np.sqrt(var), np.nan)
+    def _window_values(self, windows: _BucketWindows) -> np.ndarray:
+        lag = self._core_tfm.lag
+        hi = windows.count_before(lag)
+        lo = windows.count_before(lag + self.window_size)
+        s, c, _ = windows.moments(lo, hi)
+        return _window_mean(s, c, _resolve_min_samples(self))
 
 
 class RollingStd(_RollingBase):
     def _window_stat(self, vals: np.ndarray) -> float:
         return float(np.std(vals, ddof=1)) if len(vals) > 1 else np.nan
 
-    def _bucket_feature_from_aggs_impl(self, bid_arr, ord_arr, ts_aggs):
+    def _window_values(self, windows: _BucketWindows) -> np.ndarray:
         lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        n = len(bid_arr)
-        result = np.empty(n)
-        result[:] = np.nan
-        for bid, agg in ts_aggs.items():
-            idxs = np.where(bid_arr == bid)[0]
-            feat_u = _rolling_std_from_agg(agg, lag, w, min_samples)
-            inv = np.searchsorted(agg.unique_times, ord_arr[idxs])
-            result[idxs] = feat_u[inv]
-        return result
-
-    def _latest_from_aggs_impl(
-        self,
-        ts_aggs,
-        target_ords: Dict[int, int],
-    ) -> Dict[int, float]:
-        lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        result: Dict[int, float] = {}
-        for bid, agg in ts_aggs.items():
-            if len(agg.unique_times) == 0:
-                result[bid] = float("nan")
-                continue
-            cum_sum = np.cumsum(agg.sums)
-            cum_cnt = np.cumsum(agg.counts)
-            cum_sum_sq = np.cumsum(agg.sum_sq)
-            t = target_ords[bid]
-            upper = t - lag
-            lower = t - lag - w
-            ui = int(np.searchsorted(agg.unique_times, upper, side="right")) - 1
-            li = int(np.searchsorted(agg.unique_times, lower, side="right")) - 1
-            s = (cum_sum[ui] if ui >= 0 else 0.0) - (cum_sum[li] if li >= 0 else 0.0)
-            sq = (cum_sum_sq[ui] if ui >= 0 else 0.0) - (
-                cum_sum_sq[li] if li >= 0 else 0.0
-            )
-            c = (cum_cnt[ui] if ui >= 0 else 0.0) - (cum_cnt[li] if li >= 0 else 0.0)
-            if c >= min_samples and c > 1:
-                var = (sq - s**2 / c) / (c - 1)
-                var = max(var, 0.0)
-                result[bid] = float(np.sqrt(var))
-            else:
-                result[bid] = float("nan")
-        return result
-
-    def _ts_level_from_aggs_impl(self, ts_aggs):
-        lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        return {
-            bid: _rolling_std_from_agg(agg, lag, w, min_samples)
-            for bid, agg in ts_aggs.items()
-        }
-
-
-def _rolling_min_from_agg(agg, lag, window_size, min_samples):
-    sparse = _build_sparse_table(agg.mins, np.fmin)
-    cum_cnt = np.cumsum(agg.counts)
-    upper_ord = agg.unique_times - lag
-    lower_ord = agg.unique_times - lag - window_size + 1
-    upper_idxs = np.searchsorted(agg.unique_times, upper_ord, side="right") - 1
-    lower_idxs = np.searchsorted(agg.unique_times, lower_ord, side="left")
-    upper_cnt = np.where(upper_idxs >= 0, cum_cnt[upper_idxs], 0.0)
-    lower_cnt = np.where(lower_idxs > 0, cum_cnt[lower_idxs - 1], 0.0)
-    win_cnt = upper_cnt - lower_cnt
-    result = _query_sparse_table(sparse, lower_idxs, upper_idxs, np.fmin)
-    return np.where((win_cnt >= min_samples) & (win_cnt > 0), result, np.nan)
-
-
-def _rolling_max_from_agg(agg, lag, window_size, min_samples):
-    sparse = _build_sparse_table(agg.maxs, np.fmax)
-    cum_cnt = np.cumsum(agg.counts)
-    upper_ord = agg.unique_times - lag
-    lower_ord = agg.unique_times - lag - window_size + 1
-    upper_idxs = np.searchsorted(agg.unique_times, upper_ord, side="right") - 1
-    lower_idxs = np.searchsorted(agg.unique_times, lower_ord, side="left")
-    upper_cnt = np.where(upper_idxs >= 0, cum_cnt[upper_idxs], 0.0)
-    lower_cnt = np.where(lower_idxs > 0, cum_cnt[lower_idxs - 1], 0.0)
-    win_cnt = upper_cnt - lower_cnt
-    result = _query_sparse_table(sparse, lower_idxs, upper_idxs, np.fmax)
-    return np.where((win_cnt >= min_samples) & (win_cnt > 0), result, np.nan)
+        hi = windows.count_before(lag)
+        lo = windows.count_before(lag + self.window_size)
+        s, c, sq = windows.moments(lo, hi)
+        return _window_std(s, c, sq, _resolve_min_samples(self))
+
+
+def _rolling_extreme(
+    tfm: "_RollingBase", windows: "_BucketWindows", use_max: bool
+) -> np.ndarray:
+    lag = tfm._core_tfm.lag
+    hi = windows.count_before(lag)
+    lo = windows.count_before(lag + tfm.window_size)
+    c = windows.counts(lo, hi)
+    result = windows.window_extreme(lo, hi, use_max)
+    result[(c < _resolve_min_samples(tfm)) | (c <= 0)] = np.nan
+    return result
 
 
 class RollingMin(_RollingBase):
     def _window_stat(self, vals: np.ndarray) -> float:
         return float(np.min(vals))
 
-    def _bucket_feature_from_aggs_impl(self, bid_arr, ord_arr, ts_aggs):
-        lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        n = len(bid_arr)
-        result = np.full(n, np.nan)
-        for bid, agg in ts_aggs.items():
-            idxs = np.where(bid_arr == bid)[0]
-            feat_u = _rolling_min_from_agg(agg, lag, w, min_samples)
-            inv = np.searchsorted(agg.unique_times, ord_arr[idxs])
-            result[idxs] = feat_u[inv]
-        return result
-
-    def _latest_from_aggs_impl(
-        self,
-        ts_aggs,
-        target_ords: Dict[int, int],
-    ) -> Dict[int, float]:
-        lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        result: Dict[int, float] = {}
-        for bid, agg in ts_aggs.items():
-            if len(agg.unique_times) == 0:
-                result[bid] = float("nan")
-                continue
-            sparse = _build_sparse_table(agg.mins, np.fmin)
-            cum_cnt = np.cumsum(agg.counts)
-            t = target_ords[bid]
-            upper = t - lag
-            lower = t - lag - w + 1
-            ui = int(np.searchsorted(agg.unique_times, upper, side="right")) - 1
-            li = int(np.searchsorted(agg.unique_times, lower, side="left"))
-            c = (cum_cnt[ui] if ui >= 0 else 0.0) - (cum_cnt[li - 1] if li > 0 else 0.0)
-            if c >= min_samples and c > 0:
-                val = _query_sparse_table(
-                    sparse, np.array([li]), np.array([ui]), np.fmin
-                )
-                result[bid] = float(val[0])
-            else:
-                result[bid] = float("nan")
-        return result
-
-    def _ts_level_from_aggs_impl(self, ts_aggs):
-        lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        return {
-            bid: _rolling_min_from_agg(agg, lag, w, min_samples)
-            for bid, agg in ts_aggs.items()
-        }
+    def _window_values(self, windows: _BucketWindows) -> np.ndarray:
+        return _rolling_extreme(self, windows, use_max=False)
 
 
 class RollingMax(_RollingBase):
     def _window_stat(self, vals: np.ndarray) -> float:
         return float(np.max(vals))
 
-    def _bucket_feature_from_aggs_impl(self, bid_arr, ord_arr, ts_aggs):
-        lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        n = len(bid_arr)
-        result = np.full(n, np.nan)
-        for bid, agg in ts_aggs.items():
-            idxs = np.where(bid_arr == bid)[0]
-            feat_u = _rolling_max_from_agg(agg, lag, w, min_samples)
-            inv = np.searchsorted(agg.unique_times, ord_arr[idxs])
-            result[idxs] = feat_u[inv]
-        return result
-
-    def _latest_from_aggs_impl(
-        self,
-        ts_aggs,
-        target_ords: Dict[int, int],
-    ) -> Dict[int, float]:
-        lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        result: Dict[int, float] = {}
-        for bid, agg in ts_aggs.items():
-            if len(agg.unique_times) == 0:
-                result[bid] = float("nan")
-                continue
-            sparse = _build_sparse_table(agg.maxs, np.fmax)
-            cum_cnt = np.cumsum(agg.counts)
-            t = target_ords[bid]
-            upper = t - lag
-            lower = t - lag - w + 1
-            ui = int(np.searchsorted(agg.unique_times, upper, side="right")) - 1
-            li = int(np.searchsorted(agg.unique_times, lower, side="left"))
-            c = (cum_cnt[ui] if ui >= 0 else 0.0) - (cum_cnt[li - 1] if li > 0 else 0.0)
-            if c >= min_samples and c > 0:
-                val = _query_sparse_table(
-                    sparse, np.array([li]), np.array([ui]), np.fmax
-                )
-                result[bid] = float(val[0])
-            else:
-                result[bid] = float("nan")
-        return result
-
-    def _ts_level_from_aggs_impl(self, ts_aggs):
-        lag = self._core_tfm.lag
-        w = self.window_size
-        min_samples = _resolve_min_samples(self)
-        return {
-            bid: _rolling_max_from_agg(agg, lag, w, min_samples)
-            for bid, agg in ts_aggs.items()
-        }
+    def _window_values(self, windows: _BucketWindows) -> np.ndarray:
+        return _rolling_extreme(self, windows, use_max=True)
 
 
 class RollingQuantile(_RollingBase):
@@ -1272,194 +1523,42 @@ class _ExpandingBase(_BaseLagTransform):
         )
 
 
-def _expanding_mean_from_agg(agg, lag):
-    cum_sum = np.cumsum(agg.sums)
-    cum_cnt = np.cumsum(agg.counts)
-    upper_ord = agg.unique_times - lag
-    upper_idxs = np.searchsorted(agg.unique_times, upper_ord, side="right") - 1
-    win_sum = np.where(upper_idxs >= 0, cum_sum[upper_idxs], 0.0)
-    win_cnt = np.where(upper_idxs >= 0, cum_cnt[upper_idxs], 0.0)
-    safe_cnt = np.where(win_cnt > 0, win_cnt, 1.0)
-    return np.where(win_cnt > 0, win_sum / safe_cnt, np.nan)
-
-
 class ExpandingMean(_ExpandingBase):
     def _expanding_stat(self, vals: np.ndarray) -> float:
         return float(np.mean(vals))
 
-    def _bucket_feature_from_aggs_impl(self, bid_arr, ord_arr, ts_aggs):
-        lag = self._core_tfm.lag
-        n = len(bid_arr)
-        result = np.full(n, np.nan)
-        for bid, agg in ts_aggs.items():
-            idxs = np.where(bid_arr == bid)[0]
-            feat_u = _expanding_mean_from_agg(agg, lag)
-            inv = np.searchsorted(agg.unique_times, ord_arr[idxs])
-            result[idxs] = feat_u[inv]
-        return result
-
-    def _latest_from_aggs_impl(self, ts_aggs, target_ords):
-        lag = self._core_tfm.lag
-        result: Dict[int, float] = {}
-        for bid, agg in ts_aggs.items():
-            if len(agg.unique_times) == 0:
-                result[bid] = float("nan")
-                continue
-            cum_sum = np.cumsum(agg.sums)
-            cum_cnt = np.cumsum(agg.counts)
-            t = target_ords[bid]
-            upper = t - lag
-            ui = int(np.searchsorted(agg.unique_times, upper, side="right")) - 1
-            s = cum_sum[ui] if ui >= 0 else 0.0
-            c = cum_cnt[ui] if ui >= 0 else 0.0
-            result[bid] = s / c if c > 0 else float("nan")
-        return result
-
-    def _ts_level_from_aggs_impl(self, ts_aggs):
-        lag = self._core_tfm.lag
-        return {bid: _expanding_mean_from_agg(agg, lag) for bid, agg in ts_aggs.items()}
-
-
-def _expanding_std_from_agg(agg, lag):
-    cum_sum = np.cumsum(agg.sums)
-    cum_cnt = np.cumsum(agg.counts)
-    cum_sum_sq = np.cumsum(agg.sum_sq)
-    upper_ord = agg.unique_times - lag
-    upper_idxs = np.searchsorted(agg.unique_times, upper_ord, side="right") - 1
-    win_sum = np.where(upper_idxs >= 0, cum_sum[upper_idxs], 0.0)
-    win_sq = np.where(upper_idxs >= 0, cum_sum_sq[upper_idxs], 0.0)
-    win_cnt = np.where(upper_idxs >= 0, cum_cnt[upper_idxs], 0.0)
-    safe_n = np.where(win_cnt > 0, win_cnt, 1.0)
-    den = np.where(win_cnt > 1, win_cnt - 1, 1.0)
-    var = (win_sq - win_sum**2 / safe_n) / den
-    var = np.maximum(var, 0.0)
-    return np.where((win_cnt > 1), np.sqrt(var), np.nan)
+    def _window_values(self, windows: _BucketWindows) -> np.ndarray:
+        hi = windows.count_before(self._core_tfm.lag)
+        s, c, _ = windows.moments(np.zeros_like(hi), hi)
+        return _window_mean(s, c, 1)
 
 
 class ExpandingStd(_ExpandingBase):
     def _expanding_stat(self, vals: np.ndarray) -> float:
         return float(np.std(vals, ddof=1)) if len(vals) > 1 else np.nan
 
-    def _bucket_feature_from_aggs_impl(self, bid_arr, ord_arr, ts_aggs):
-        lag = self._core_tfm.lag
-        n = len(bid_arr)
-        result = np.full(n, np.nan)
-        for bid, agg in ts_aggs.items():
-            idxs = np.where(bid_arr == bid)[0]
-            feat_u = _expanding_std_from_agg(agg, lag)
-            inv = np.searchsorted(agg.unique_times, ord_arr[idxs])
-            result[idxs] = feat_u[inv]
-        return result
-
-    def _latest_from_aggs_impl(self, ts_aggs, target_ords):
-        lag = self._core_tfm.lag
-        result: Dict[int, float] = {}
-        for bid, agg in ts_aggs.items():
-            if len(agg.unique_times) == 0:
-                result[bid] = float("nan")
-                continue
-            cum_sum = np.cumsum(agg.sums)
-            cum_cnt = np.cumsum(agg.counts)
-            cum_sum_sq = np.cumsum(agg.sum_sq)
-            t = target_ords[bid]
-            upper = t - lag
-            ui = int(np.searchsorted(agg.unique_times, upper, side="right")) - 1
-            s = cum_sum[ui] if ui >= 0 else 0.0
-            c = cum_cnt[ui] if ui >= 0 else 0.0
-            sq = cum_sum_sq[ui] if ui >= 0 else 0.0
-            if c > 1:
-                var = (sq - s**2 / c) / (c - 1)
-                var = max(var, 0.0)
-                result[bid] = float(np.sqrt(var))
-            else:
-                result[bid] = float("nan")
-        return result
-
-    def _ts_level_from_aggs_impl(self, ts_aggs):
-        lag = self._core_tfm.lag
-        return {bid: _expanding_std_from_agg(agg, lag) for bid, agg in ts_aggs.items()}
-
-
-def _expanding_min_from_agg(agg, lag):
-    prefix_min = np.fmin.accumulate(agg.mins)
-    upper_ord = agg.unique_times - lag
-    upper_idxs = np.searchsorted(agg.unique_times, upper_ord, side="right") - 1
-    return np.where(upper_idxs >= 0, prefix_min[upper_idxs], np.nan)
-
-
-def _expanding_max_from_agg(agg, lag):
-    prefix_max = np.fmax.accumulate(agg.maxs)
-    upper_ord = agg.unique_times - lag
-    upper_idxs = np.searchsorted(agg.unique_times, upper_ord, side="right") - 1
-    return np.where(upper_idxs >= 0, prefix_max[upper_idxs], np.nan)
+    def _window_values(self, windows: _BucketWindows) -> np.ndarray:
+        hi = windows.count_before(self._core_tfm.lag)
+        s, c, sq = windows.moments(np.zeros_like(hi), hi)
+        return _window_std(s, c, sq, 2)
 
 
 class ExpandingMin(_ExpandingBase):
     def _expanding_stat(self, vals: np.ndarray) -> float:
         return float(np.min(vals))
 
-    def _bucket_feature_from_aggs_impl(self, bid_arr, ord_arr, ts_aggs):
-        lag = self._core_tfm.lag
-        n = len(bid_arr)
-        result = np.full(n, np.nan)
-        for bid, agg in ts_aggs.items():
-            idxs = np.where(bid_arr == bid)[0]
-            feat_u = _expanding_min_from_agg(agg, lag)
-            inv = np.searchsorted(agg.unique_times, ord_arr[idxs])
-            result[idxs] = feat_u[inv]
-        return result
-
-    def _latest_from_aggs_impl(self, ts_aggs, target_ords):
-        lag = self._core_tfm.lag
-        result: Dict[int, float] = {}
-        for bid, agg in ts_aggs.items():
-            if len(agg.unique_times) == 0:
-                result[bid] = float("nan")
-                continue
-            prefix_min = np.fmin.accumulate(agg.mins)
-            t = target_ords[bid]
-            upper = t - lag
-            ui = int(np.searchsorted(agg.unique_times, upper, side="right")) - 1
-            result[bid] = float(prefix_min[ui]) if ui >= 0 else float("nan")
-        return result
-
-    def _ts_level_from_aggs_impl(self, ts_aggs):
-        lag = self._core_tfm.lag
-        return {bid: _expanding_min_from_agg(agg, lag) for bid, agg in ts_aggs.items()}
+    def _window_values(self, windows: _BucketWindows) -> np.ndarray:
+        hi = windows.count_before(self._core_tfm.lag)
+        return windows.extremes_up_to(hi)[0]
 
 
 class ExpandingMax(_ExpandingBase):
     def _expanding_stat(self, vals: np.ndarray) -> float:
         return float(np.max(vals))
 
-    def _bucket_feature_from_aggs_impl(self, bid_arr, ord_arr, ts_aggs):
-        lag = self._core_tfm.lag
-        n = len(bid_arr)
-        result = np.full(n, np.nan)
-        for bid, agg in ts_aggs.items():
-            idxs = np.where(bid_arr == bid)[0]
-            feat_u = _expanding_max_from_agg(agg, lag)
-            inv = np.searchsorted(agg.unique_times, ord_arr[idxs])
-            result[idxs] = feat_u[inv]
-        return result
-
-    def _latest_from_aggs_impl(self, ts_aggs, target_ords):
-        lag = self._core_tfm.lag
-        result: Dict[int, float] = {}
-        for bid, agg in ts_aggs.items():
-            if len(agg.unique_times) == 0:
-                result[bid] = float("nan")
-                continue
-            prefix_max = np.fmax.accumulate(agg.maxs)
-            t = target_ords[bid]
-            upper = t - lag
-            ui = int(np.searchsorted(agg.unique_times, upper, side="right")) - 1
-            result[bid] = float(prefix_max[ui]) if ui >= 0 else float("nan")
-        return result
-
-    def _ts_level_from_aggs_impl(self, ts_aggs):
-        lag = self._core_tfm.lag
-        return {bid: _expanding_max_from_agg(agg, lag) for bid, agg in ts_aggs.items()}
+    def _window_values(self, windows: _BucketWindows) -> np.ndarray:
+        hi = windows.count_before(self._core_tfm.lag)
+        return windows.extremes_up_to(hi)[1]
 
 
 class ExpandingQuantile(_ExpandingBase):
@@ -1499,34 +1598,6 @@ class ExpandingQuantile(_ExpandingBase):
         return float(np.quantile(vals, self.p))
 
 
-def _ewm_from_agg(agg, lag, alpha):
-    # ``agg`` may be a lazy ``_ReaggregatedAggregates`` view whose ``counts`` /
-    # ``sums`` are recomputed on every attribute access. Hoist ``counts`` once
-    # and size off ``unique_times`` (a plain cached array, always the same
-    # length) so we don't materialize the derived arrays more than needed.
-    counts = agg.counts
-    mean_per_ord = np.full(len(agg.unique_times), np.nan)
-    np.divide(agg.sums, counts, out=mean_per_ord, where=counts > 0)
-    feat_u = np.full(len(agg.unique_times), np.nan)
-    ewm = np.nan
-    consume_idx = 0
-    for k in range(len(agg.unique_times)):
-        upper = agg.unique_times[k] - lag
-        while (
-            consume_idx < len(agg.unique_times)
-            and agg.unique_times[consume_idx] <= upper
-        ):
-            if not np.isnan(mean_per_ord[consume_idx]):
-                ewm = (
-                    mean_per_ord[consume_idx]
-                    if np.isnan(ewm)
-                    else alpha * mean_per_ord[consume_idx] + (1 - alpha) * ewm
-                )
-            consume_idx += 1
-        feat_u[k] = ewm
-    return feat_u
-
-
 class ExponentiallyWeightedMean(_BaseLagTransform):
     """Exponentially weighted average
 
@@ -1655,48 +1726,9 @@ class ExponentiallyWeightedMean(_BaseLagTransform):
             result[idxs] = feat_u[inv]
         return result
 
-    def _bucket_feature_from_aggs_impl(self, bid_arr, ord_arr, ts_aggs):
-        lag = self._core_tfm.lag
-        alpha = self.alpha
-        n = len(bid_arr)
-        result = np.full(n, np.nan)
-        for bid, agg in ts_aggs.items():
-            idxs = np.where(bid_arr == bid)[0]
-            feat_u = _ewm_from_agg(agg, lag, alpha)
-            inv = np.searchsorted(agg.unique_times, ord_arr[idxs])
-            result[idxs] = feat_u[inv]
-        return result
-
-    def _latest_from_aggs_impl(self, ts_aggs, target_ords):
-        lag = self._core_tfm.lag
-        alpha = self.alpha
-        result: Dict[int, float] = {}
-        for bid, agg in ts_aggs.items():
-            if len(agg.unique_times) == 0:
-                result[bid] = float("nan")
-                continue
-            t = target_ords[bid]
-            counts = agg.counts
-            mean_per_ord = np.full(len(agg.unique_times), np.nan)
-            np.divide(agg.sums, counts, out=mean_per_ord, where=counts > 0)
-            ewm = np.nan
-            upper = t - lag
-            for k in range(len(agg.unique_times)):
-                if agg.unique_times[k] > upper:
-                    break
-                if not np.isnan(mean_per_ord[k]):
-                    ewm = (
-                        mean_per_ord[k]
-                        if np.isnan(ewm)
-                        else alpha * mean_per_ord[k] + (1 - alpha) * ewm
-                    )
-            result[bid] = float(ewm) if not np.isnan(ewm) else float("nan")
-        return result
-
-    def _ts_level_from_aggs_impl(self, ts_aggs):
-        lag = self._core_tfm.lag
-        alpha = self.alpha
-        return {bid: _ewm_from_agg(agg, lag, alpha) for bid, agg in ts_aggs.items()}
+    def _window_values(self, windows: _BucketWindows) -> np.ndarray:
+        hi = windows.count_before(self._core_tfm.lag)
+        return windows.ewm_up_to(hi, self.alpha)
 
 
 class Offset(_BaseLagTransform):
@@ -1742,8 +1774,8 @@ class Offset(_BaseLagTransform):
     def _is_finite_window(self) -> bool:
         return self.tfm._is_finite_window
 
-    def _compute_ts_level_from_aggs(self, ts_aggs):
-        return self.tfm._compute_ts_level_from_aggs(ts_aggs)
+    def _compute_feature_from_aggs(self, ts_aggs, bid_arr, ord_arr):
+        return self.tfm._compute_feature_from_aggs(ts_aggs, bid_arr, ord_arr)
 
     def _compute_latest_from_aggs(self, ts_aggs, target_ords):
         return self.tfm._compute_latest_from_aggs(ts_aggs, target_ords)
@@ -1827,18 +1859,18 @@ class Combine(_BaseLagTransform):
     def _is_finite_window(self) -> bool:
         return self.tfm1._is_finite_window and self.tfm2._is_finite_window
 
-    def _compute_ts_level_from_aggs(self, ts_aggs):
-        r1 = self.tfm1._compute_ts_level_from_aggs(ts_aggs)
-        r2 = self.tfm2._compute_ts_level_from_aggs(ts_aggs)
+    def _compute_feature_from_aggs(self, ts_aggs, bid_arr, ord_arr):
+        r1 = self.tfm1._compute_feature_from_aggs(ts_aggs, bid_arr, ord_arr)
+        r2 = self.tfm2._compute_feature_from_aggs(ts_aggs, bid_arr, ord_arr)
         if r1 is not None and r2 is not None:
-            return {bid: self.operator(r1[bid], r2[bid]) for bid in r1 if bid in r2}
+            return self.operator(r1, r2)
         return None
 
     def _compute_latest_from_aggs(self, ts_aggs, target_ords):
         r1 = self.tfm1._compute_latest_from_aggs(ts_aggs, target_ords)
         r2 = self.tfm2._compute_latest_from_aggs(ts_aggs, target_ords)
         if r1 is not None and r2 is not None:
-            return {bid: self.operator(r1[bid], r2[bid]) for bid in r1 if bid in r2}
+            return self.operator(r1, r2)
         return None
 
     def _compute_bucket_feature(
@@ -1,14 +1,17 @@
 __all__ = ["PooledState", "compute_pooled_features"]
 
+import concurrent.futures
+import contextlib
 import copy
+from collections.abc import Mapping, MutableMapping
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import narwhals as nw
 import numpy as np
 import utilsforecast.processing as ufp
 
-from .lag_transforms import _BaseLagTransform, _TIME_AGGS
+from .lag_transforms import _POOLED_EXECUTOR, _BaseLagTransform, _TIME_AGGS
 
 
 def _dedupe_preserve_order(items):
@@ -104,6 +107,23 @@ def _encode_join_keys(left_nw, right_nw, cols):
     return left_nw.with_columns(left_exprs), right_nw.with_columns(right_exprs)
 
 
+def _encoded_key_arrays(frame_nw, cols, to_int=None) -> List[np.ndarray]:
+    """Sentinel-encoded ``cols`` of ``frame_nw`` as numpy string arrays.
+
+    ``to_int`` holds a flag per column with the same meaning as in
+    ``_encode_col_expr``; see ``_encode_join_keys`` for how it's chosen."""
+    if to_int is None:
+        to_int = [False] * len(cols)
+    schema = frame_nw.schema
+    encoded = frame_nw.select(
+        [
+            _encode_col_expr(c, schema[c], to_int=flag).alias(c)
+            for c, flag in zip(cols, to_int)
+        ]
+    )
+    return [encoded.get_column(c).to_numpy().astype(str) for c in cols]
+
+
 _ROW_ORDER_COL = "_mlf_row_order"
 
 
@@ -168,6 +188,44 @@ def lookup_bucket_ids(data, groups, cols):
     return joined.get_column("_bucket_id").to_numpy()
 
 
+def _extend_buffer(
+    buffers: Dict[str, np.ndarray], name: str, arr: np.ndarray, new_vals
+) -> np.ndarray:
+    """``arr`` followed by ``new_vals``, backed by a capacity-doubling buffer.
+
+    When ``arr`` is a prefix view of ``buffers[name]`` with enough room the new
+    values are written right after it and a longer view is returned, so repeated
+    appends cost O(len(new_vals)) amortized. Otherwise (first append, the field
+    was reassigned or the buffer is full) ``arr`` is copied into a new buffer of
+    twice the required size. Views taken earlier keep their values, since only
+    the slots past their end are written."""
+    new_vals = np.asarray(new_vals)
+    n = len(arr)
+    size = n + new_vals.size
+    dtype = np.result_type(arr, new_vals)
+    buf = buffers.get(name)
+    if (
+        buf is None
+        or arr.base is not buf
+        or buf.dtype != dtype
+        or size > buf.size
+        or arr.__array_interface__["data"][0] != buf.__array_interface__["data"][0]
+    ):
+        buf = np.empty(max(2 * size, 8), dtype=dtype)
+        buf[:n] = arr
+        buffers[name] = buf
+    buf[n:size] = new_vals
+    return buf[:size]
+
+
+def _gather_bucket_values(values: np.ndarray, bucket_ids: np.ndarray) -> np.ndarray:
+    """``values[bucket_ids]``, with NaN for the ids past the end of ``values``."""
+    n_missing = int(bucket_ids.max(initial=-1)) + 1 - values.size
+    if n_missing > 0:
+        values = np.append(values, np.full(n_missing, np.nan))
+    return values[bucket_ids]
+
+
 @dataclass
 class _TimestampAggregates:
     """Per-timestamp aggregates for a single bucket."""
@@ -179,43 +237,353 @@ class _TimestampAggregates:
     mins: np.ndarray
     maxs: np.ndarray
 
+    _FIELDS = ("unique_times", "sums", "counts", "sum_sq", "mins", "maxs")
+
+
+def _concat_ranges(starts: np.ndarray, lens: np.ndarray) -> np.ndarray:
+    """``np.arange(s, s + n)`` for every ``s, n`` in ``starts, lens``, concatenated."""
+    offsets = np.cumsum(lens) - lens
+    return np.arange(int(lens.sum())) + np.repeat(starts - offsets, lens)
+
+
+class _BucketAggregates(Mapping):
+    """Per-timestamp aggregates of every bucket, stored in shared flat arrays.
+
+    The aggregates of bucket ``bid`` are ``arr[starts[bid] : starts[bid] +
+    lens[bid]]`` for every array in ``fields`` (the fields of
+    ``_TimestampAggregates``) and buckets without aggregates have ``lens == -1``.
+    Every bucket has room for ``caps[bid]`` timestamps, so appending usually
+    writes right after its values; a full bucket is moved past ``top`` with
+    twice the room. The values of a bucket are never overwritten, so a shallow
+    copy is a consistent snapshot, and the copy moves its values into its own
+    arrays before its first write.
+
+    Behaves as a read-only mapping from bucket id to its aggregates. The
+    running statistics used at prediction (see ``prefix``) are kept next to the
+    fields and only the appended timestamps are scanned to update them."""
+
+    def __init__(
+        self,
+        fields: Dict[str, np.ndarray],
+        starts: np.ndarray,
+        lens: np.ndarray,
+        caps: np.ndarray,
+        top: int,
+    ):
+        self.fields = fields
+        self.starts = starts
+        self.lens = lens
+        self.caps = caps
+        self.top = top
+        self._owned = True
+        # `_TimestampAggregates` views, valid while the bucket has that length
+        self._views: Dict[int, _TimestampAggregates] = {}
+        # running statistics by key, with the number of timestamps of every
+        # bucket they cover
+        self._prefixes: Dict[Any, Tuple[np.ndarray, Tuple[np.ndarray, ...]]] = {}
+
+    @classmethod
+    def empty(cls) -> "_BucketAggregates":
+        fields = {
+            name: np.empty(0, dtype=np.int64 if name == "unique_times" else float)
+            for name in _TimestampAggregates._FIELDS
+        }
+        no_buckets = np.empty(0, dtype=np.int64)
+        return cls(fields, no_buckets, no_buckets.copy(), no_buckets.copy(), 0)
+
+    @classmethod
+    def from_sizes(
+        cls, bucket_ids: np.ndarray, sizes: np.ndarray, fields: Dict[str, np.ndarray]
+    ) -> "_BucketAggregates":
+        """Aggregates stored one bucket after the other, in ``bucket_ids`` order."""
+        if not bucket_ids.size:
+            return cls.empty()
+        n_buckets = int(bucket_ids.max()) + 1
+        starts = np.zeros(n_buckets, dtype=np.int64)
+        lens = np.full(n_buckets, -1, dtype=np.int64)
+        starts[bucket_ids] = np.cumsum(sizes) - sizes
+        lens[bucket_ids] = sizes
+        return cls(fields, starts, lens, np.maximum(lens, 0), int(sizes.sum()))
+
+    @classmethod
+    def from_segments(
+        cls, seg_bids: np.ndarray, fields: Dict[str, np.ndarray]
+    ) -> "_BucketAggregates":
+        """Aggregates from segments sorted by bucket, ``seg_bids`` being the buckets."""
+        if not seg_bids.size:
+            return cls.empty()
+        bucket_starts = np.flatnonzero(np.append(True, seg_bids[1:] != seg_bids[:-1]))
+        sizes = np.diff(np.append(bucket_starts, seg_bids.size))
+        return cls.from_sizes(seg_bids[bucket_starts], sizes, fields)
+
+    @classmethod
+    def from_aggs(cls, aggs: Mapping) -> "_BucketAggregates":
+        """Aggregates from a mapping of bucket id to ``_TimestampAggregates``."""
+        if isinstance(aggs, cls):
+            return aggs
+        if not aggs:
+            return cls.empty()
+        bucket_ids = np.array(sorted(aggs), dtype=np.int64)
+        per_bucket = [aggs[bid] for bid in bucket_ids.tolist()]
+        sizes = np.array([len(agg.unique_times) for agg in per_bucket], dtype=np.int64)
+        fields = {
+            name: np.concatenate([getattr(agg, name) for agg in per_bucket]).astype(
+                np.int64 if name == "unique_times" else float, copy=False
+            )
+            for name in _TimestampAggregates._FIELDS
+        }
+        return cls.from_sizes(bucket_ids, sizes, fields)
+
+    def __getitem__(self, bid: int) -> _TimestampAggregates:
+        if not 0 <= bid < self.lens.size or self.lens[bid] < 0:
+            raise KeyError(bid)
+        n = int(self.lens[bid])
+        agg = self._views.get(bid)
+        # the first n values of a bucket never change
+        if agg is None or len(agg.unique_times) != n:
+            start = int(self.starts[bid])
+            agg = _TimestampAggregates(
+                **{name: arr[start : start + n] for name, arr in self.fields.items()}
+            )
+            self._views[int(bid)] = agg
+        return agg
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.lens >= 0))
+
+    def __iter__(self):
+        return iter(np.flatnonzero(self.lens >= 0).tolist())
+
+    def __copy__(self) -> "_BucketAggregates":
+        new = _BucketAggregates.__new__(_BucketAggregates)
+        new.__dict__.update(self.__dict__)
+        new.fields = dict(self.fields)
+        new.starts = self.starts.copy()
+        new.lens = self.lens.copy()
+        new.caps = self.caps.copy()
+        new._owned = False
+        new._views = dict(self._views)
+        new._prefixes = {
+            key: (done.copy(), outs) for key, (done, outs) in self._prefixes.items()
+        }
+        return new
+
+    def __getstate__(self):
+        # the arrays hold spare room and the caches duplicate them
+        packed = copy.copy(self)
+        packed._prefixes = {}
+        packed._pack(np.maximum(self.lens, 0))
+        state = packed.__dict__.copy()
+        state["_views"] = {}
+        return state
+
+    def _arrays(self):
+        yield from self.fields.values()
+        for _, outs in self._prefixes.values():
+            yield from outs
+
+    def _map_arrays(self, fn: Callable[[np.ndarray], np.ndarray]) -> None:
+        self.fields = {name: fn(arr) for name, arr in self.fields.items()}
+        self._prefixes = {
+            key: (done, tuple(fn(arr) for arr in outs))
+            for key, (done, outs) in self._prefixes.items()
+        }
+
+    def _pack(self, caps: np.ndarray) -> None:
+        """Moves every bucket into new arrays, with room for ``caps[bid]`` values."""
+        n = np.maximum(self.lens, 0)
+        starts = np.cumsum(caps) - caps
+        top = int(caps.sum())
+        src = _concat_ranges(self.starts, n)
+        dst = _concat_ranges(starts, n)
+
+        def packed(arr):
+            out = np.empty(top, dtype=arr.dtype)
+            out[dst] = arr[src]
+            return out
+
+        self._map_arrays(packed)
+        self.starts = starts
+        self.caps = caps
+        self.top = top
+        self._owned = True
+
+    def _own(self) -> None:
+        """Gives a copy arrays of its own, with room to double every bucket."""
+        if not self._owned:
+            self._pack(np.where(self.lens >= 0, np.maximum(2 * self.lens, 1), 0))
+
+    def _reserve(self, size: int) -> None:
+        capacity = self.fields["sums"].size
+        if size <= capacity:
+            return
+        capacity = max(2 * size, 8)
+        top = self.top
+
+        def grown(arr):
+            out = np.empty(capacity, dtype=arr.dtype)
+            out[:top] = arr[:top]
+            return out
+
+        self._map_arrays(grown)
+
+    def _move_to_end(self, bucket_ids: np.ndarray, caps: np.ndarray) -> None:
+        n = self.lens[bucket_ids]
+        starts = self.top + np.cumsum(caps) - caps
+        top = self.top + int(caps.sum())
+        self._reserve(top)
+        src = _concat_ranges(self.starts[bucket_ids], n)
+        dst = _concat_ranges(starts, n)
+        for arr in self._arrays():
+            arr[dst] = arr[src]
+        self.starts[bucket_ids] = starts
+        self.caps[bucket_ids] = caps
+        self.top = top
+
+    def extend(self, seg_bids: np.ndarray, fields: Dict[str, np.ndarray]) -> None:
+        """Appends segments to the buckets that have aggregates.
+
+        ``seg_bids`` are the buckets of the segments, sorted, and the segments of
+        a bucket come after its current timestamps."""
+        known = seg_bids < self.lens.size
+        known[known] = self.lens[seg_bids[known]] >= 0
+        if not known.all():
+            seg_bids = seg_bids[known]
+            fields = {name: arr[known] for name, arr in fields.items()}
+        if not seg_bids.size:
+            return
+        self._own()
+        bucket_ids, first, counts = np.unique(
+            seg_bids, return_index=True, return_counts=True
+        )
+        new_lens = self.lens[bucket_ids] + counts
+        full = new_lens > self.caps[bucket_ids]
+        if full.any():
+            self._move_to_end(bucket_ids[full], 2 * new_lens[full])
+        ends = self.starts[bucket_ids] + self.lens[bucket_ids]
+        dst = np.repeat(ends - first, counts) + np.arange(seg_bids.size)
+        for name, arr in self.fields.items():
+            arr[dst] = fields[name]
+        self.lens[bucket_ids] = new_lens
+
+    def add_empty(self, bucket_ids: np.ndarray) -> None:
+        """Adds empty aggregates for the ``bucket_ids`` that don't have any."""
+        if not bucket_ids.size:
+            return
+        n_buckets = int(bucket_ids.max()) + 1
+        if n_buckets > self.lens.size:
+            pad = n_buckets - self.lens.size
+            self.starts = np.append(self.starts, np.zeros(pad, dtype=np.int64))
+            self.lens = np.append(self.lens, np.full(pad, -1, dtype=np.int64))
+            self.caps = np.append(self.caps, np.zeros(pad, dtype=np.int64))
+        new = bucket_ids[self.lens[bucket_ids] < 0]
+        self.starts[new] = self.top
+        self.caps[new] = 0
+        self.lens[new] = 0
+
+    def trimmed(self, cutoffs: np.ndarray) -> "_BucketAggregates":
+        """The timestamps of every bucket from ``cutoffs[bid]`` on, renumbered to
+        start at the cutoff. Buckets left without timestamps are dropped."""
+        n = np.maximum(self.lens, 0)
+        pos = _concat_ranges(self.starts, n)
+        seg_bids = np.repeat(np.arange(n.size), n)
+        seg_cutoffs = cutoffs[seg_bids]
+        times = self.fields["unique_times"][pos]
+        keep = times >= seg_cutoffs
+        fields = {name: arr[pos[keep]] for name, arr in self.fields.items()}
+        fields["unique_times"] = times[keep] - seg_cutoffs[keep]
+        return _BucketAggregates.from_segments(seg_bids[keep], fields)
+
+    def prefix(
+        self,
+        key: Any,
+        n_outputs: int,
+        scan: Callable[["_BucketAggregates", np.ndarray, Tuple[np.ndarray, ...]], None],
+    ) -> Tuple[np.ndarray, ...]:
+        """Running statistics of every bucket, as arrays aligned with the fields.
+
+        ``scan(self, done, outputs)`` must fill the ``n_outputs`` arrays of
+        every bucket from its ``done[bid]``-th timestamp on. The outputs are kept
+        under ``key`` with the number of timestamps of every bucket they cover,
+        so later calls only scan the timestamps appended since. The values of a
+        bucket are never overwritten, so covering as many timestamps as the
+        bucket has means the outputs are up to date, in copies too. Every
+        transform reading the same statistics shares them and must not mutate
+        them."""
+        n = np.maximum(self.lens, 0)
+        entry = self._prefixes.get(key)
+        if entry is None or entry[0].size != n.size or (entry[0] != n).any():
+            self._own()
+            entry = self._prefixes.get(key)
+            if entry is None:
+                size = self.fields["sums"].size
+                entry = (
+                    np.zeros(n.size, dtype=np.int64),
+                    tuple(np.empty(size) for _ in range(n_outputs)),
+                )
+            done, outs = entry
+            if done.size < n.size:
+                done = np.append(done, np.zeros(n.size - done.size, dtype=np.int64))
+            scan(self, done, outs)
+            entry = (n, outs)
+            self._prefixes[key] = entry
+        return entry[1]
+
+
+def _segment_aggregates(
+    bid_arr: np.ndarray,
+    ord_arr: np.ndarray,
+    y_arr: np.ndarray,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Aggregates of every ``(bucket, ordinal)`` segment of the rows, in a single pass.
+
+    The rows are sorted once by ``(bucket, ordinal)`` and every aggregate is
+    reduced over the contiguous segments, so the cost doesn't grow with the
+    number of buckets. Returns the bucket of every segment (sorted) and the
+    ``_TimestampAggregates`` fields of the segments."""
+    order = np.lexsort((ord_arr, bid_arr))
+    bids = bid_arr[order]
+    ords = ord_arr[order]
+    y = np.asarray(y_arr, dtype=float)[order]
+    # start of every (bucket, ordinal) segment
+    new_seg = np.empty(len(order), dtype=bool)
+    new_seg[0] = True
+    np.not_equal(bids[1:], bids[:-1], out=new_seg[1:])
+    new_seg[1:] |= ords[1:] != ords[:-1]
+    seg_starts = np.flatnonzero(new_seg)
+    seg_id = np.cumsum(new_seg) - 1
+    m = len(seg_starts)
+    valid = ~np.isnan(y)
+    # bincount accumulates in row order, which the stable sort preserves
+    fields = {
+        "unique_times": ords[seg_starts],
+        "sums": np.bincount(seg_id, weights=np.where(valid, y, 0.0), minlength=m),
+        "counts": np.bincount(seg_id, weights=valid.astype(float), minlength=m),
+        "sum_sq": np.bincount(seg_id, weights=np.where(valid, y**2, 0.0), minlength=m),
+        # fmin/fmax skip NaNs and give NaN for segments without valid values
+        "mins": np.fmin.reduceat(y, seg_starts),
+        "maxs": np.fmax.reduceat(y, seg_starts),
+    }
+    return bids[seg_starts], fields
+
 
 def _build_ts_aggs(
     bid_arr: np.ndarray,
     ord_arr: np.ndarray,
     y_arr: np.ndarray,
-) -> Dict[int, _TimestampAggregates]:
-    aggs: Dict[int, _TimestampAggregates] = {}
-    for bid in np.unique(bid_arr):
-        mask = bid_arr == bid
-        ord_b = ord_arr[mask]
-        y_b = y_arr[mask]
-        unique_ord, inv = np.unique(ord_b, return_inverse=True)
-        m = len(unique_ord)
-        valid = ~np.isnan(y_b)
-        y_valid = np.where(valid, y_b, 0.0)
-        sums = np.bincount(inv, weights=y_valid, minlength=m)
-        counts = np.bincount(inv, weights=valid.astype(float), minlength=m)
-        sum_sq = np.bincount(inv, weights=np.where(valid, y_b**2, 0.0), minlength=m)
-        mins = np.full(m, np.inf)
-        maxs = np.full(m, -np.inf)
-        valid_inv = inv[valid]
-        valid_y = y_b[valid]
-        if len(valid_y) > 0:
-            np.minimum.at(mins, valid_inv, valid_y)
-            np.maximum.at(maxs, valid_inv, valid_y)
-        no_valid = mins == np.inf
-        mins[no_valid] = np.nan
-        maxs[no_valid] = np.nan
-        aggs[int(bid)] = _TimestampAggregates(
-            unique_times=unique_ord,
-            sums=sums,
-            counts=counts,
-            sum_sq=sum_sq,
-            mins=mins,
-            maxs=maxs,
-        )
-    return aggs
+) -> _BucketAggregates:
+    """Per-timestamp aggregates of every bucket, computed in a single pass.
+
+    See :func:`_segment_aggregates`. The aggregates of all buckets are stored
+    in shared flat arrays (CSR-style, see ``_BucketAggregates``) and each
+    bucket is looked up as views into its range; nothing mutates the values
+    of a bucket, updates only append to it.
+    """
+    if len(bid_arr) == 0:
+        return _BucketAggregates.empty()
+    return _BucketAggregates.from_segments(
+        *_segment_aggregates(bid_arr, ord_arr, y_arr)
+    )
 
 
 def _time_agg_values(agg: _TimestampAggregates, time_agg: str) -> np.ndarray:
@@ -307,9 +675,27 @@ class _ReaggregatedAggregates:
         return self._values
 
 
+class _ReaggregatedBuckets(Mapping):
+    """Read-only mapping from bucket id to the ``_ReaggregatedAggregates`` of
+    the bucket's aggregates in ``source``."""
+
+    def __init__(self, source: Mapping, time_agg: str):
+        self.source = source
+        self.time_agg = time_agg
+
+    def __getitem__(self, bid: int) -> _ReaggregatedAggregates:
+        return _ReaggregatedAggregates(self.source[bid], self.time_agg)
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def __iter__(self):
+        return iter(self.source)
+
+
 def _reaggregate_ts_aggs(
-    ts_aggs: Dict[int, _TimestampAggregates], time_agg: str
-) -> Dict[int, _ReaggregatedAggregates]:
+    ts_aggs: Mapping, time_agg: str
+) -> _ReaggregatedBuckets:
     """Collapse each bucket's per-timestamp aggregates to a single value per
     timestamp, returning lazy ``_TimestampAggregates``-compatible views shaped
     so the existing rolling/expanding/ewm helpers compute the transform *over
@@ -318,16 +704,25 @@ def _reaggregate_ts_aggs(
     :class:`_ReaggregatedAggregates` for the field layout.
 
     The input is the shared ``PooledState._ts_aggs`` cache and is never
-    mutated.  ``unique_times`` is intentionally shared by reference
-    (``append_predictions`` reassigns it via ``np.append`` rather than mutating
-    in place) and preserved exactly, because the fit-path fast mapping indexes
-    results by that grid.  Callers must recompute this per call — never cache
-    it, or it goes stale after ``append_predictions`` extends the underlying
-    aggregates.
+    mutated.  ``unique_times`` is intentionally shared by reference (the values
+    of a bucket are never overwritten, see :class:`_BucketAggregates`) and
+    preserved exactly, because the fit-path fast mapping indexes results by
+    that grid.  The mapping looks up the source on every access, but the
+    per-bucket views it returns must not be kept across ``append_predictions``,
+    which extends the underlying aggregates.
     """
     if time_agg not in _TIME_AGGS:
         raise ValueError(f"time_agg must be one of {_TIME_AGGS}; got {time_agg!r}.")
-    return {bid: _ReaggregatedAggregates(agg, time_agg) for bid, agg in ts_aggs.items()}
+    return _ReaggregatedBuckets(ts_aggs, time_agg)
+
+
+def _flat_aggregates(ts_aggs: Mapping) -> Tuple[_BucketAggregates, Optional[str]]:
+    """The flat aggregates behind ``ts_aggs`` and the ``time_agg`` applied to them."""
+    time_agg = None
+    if isinstance(ts_aggs, _ReaggregatedBuckets):
+        time_agg = ts_aggs.time_agg
+        ts_aggs = ts_aggs.source
+    return _BucketAggregates.from_aggs(ts_aggs), time_agg
 
 
 def _collapse_rows_by_time(
@@ -335,7 +730,7 @@ def _collapse_rows_by_time(
     ord_arr: np.ndarray,
     y_arr: np.ndarray,
     time_agg: str,
-    ts_aggs: Optional[Dict[int, _TimestampAggregates]] = None,
+    ts_aggs: Optional[Mapping[int, _TimestampAggregates]] = None,
 ):
     """Collapse raw ``(bucket, ordinal, y)`` rows to one row per
     ``(bucket, timestamp)`` holding the ``time_agg`` aggregate, for the
@@ -414,17 +809,300 @@ def _compute_time_index(bid_arr, ts_arr):
     periods — no synthetic zeros are injected.
     """
     idx_arr = np.empty(len(ts_arr), dtype=np.int64)
-    next_by_bucket = {}
-    for bid in np.unique(bid_arr):
+    uniq_bid = np.unique(bid_arr)
+    lengths = np.empty(uniq_bid.size, dtype=np.int64)
+    for i, bid in enumerate(uniq_bid):
         mask = bid_arr == bid
         ts_b = ts_arr[mask]
         unique_ts = np.unique(ts_b)
         idx_arr[mask] = np.searchsorted(unique_ts, ts_b)
-        next_by_bucket[int(bid)] = len(unique_ts)
-    return idx_arr, next_by_bucket
+        lengths[i] = len(unique_ts)
+    return idx_arr, _BucketOrdinals.from_arrays(uniq_bid.astype(np.int64), lengths)
+
+
+class _ParentCalendars(Mapping):
+    """Sorted time grid of every parent scope, stored as a single array.
+
+    The calendar of parent ``pid`` is ``data[indptr[pid] : indptr[pid + 1]]``
+    and parents are numbered consecutively from 0. Updates rebind ``data`` and
+    ``indptr`` instead of writing into them, so a shallow copy is a consistent
+    snapshot. Behaves as a read-only mapping from parent id to its calendar."""
+
+    def __init__(self, data: np.ndarray, indptr: np.ndarray):
+        self.data = data
+        self.indptr = indptr
+
+    @classmethod
+    def from_pairs(
+        cls, parent_ids: np.ndarray, times: np.ndarray, n_parents: int
+    ) -> "_ParentCalendars":
+        """Calendars from unique ``(parent_id, time)`` pairs in any order."""
+        order = np.lexsort((times, parent_ids))
+        indptr = np.zeros(n_parents + 1, dtype=np.int64)
+        np.cumsum(np.bincount(parent_ids, minlength=n_parents), out=indptr[1:])
+        return cls(times[order], indptr)
+
+    def __getitem__(self, pid: int) -> np.ndarray:
+        if not 0 <= pid < len(self):
+            raise KeyError(pid)
+        return self.data[self.indptr[pid] : self.indptr[pid + 1]]
+
+    def __len__(self) -> int:
+        return self.indptr.size - 1
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def add_parent(self, n: int = 1) -> int:
+        """Adds ``n`` parents with empty calendars and returns the first new id."""
+        first = len(self)
+        self.indptr = np.append(self.indptr, np.repeat(self.indptr[-1], n))
+        return first
+
+    def insert_time(self, ts) -> None:
+        """Adds ``ts`` to every calendar that doesn't have it yet."""
+        ends = self.indptr[1:]
+        nonempty = self.lengths > 0
+        last = self.data[ends[nonempty] - 1]
+        at_end = np.ones(len(self), dtype=bool)
+        at_end[nonempty] = last < ts
+        pids = [np.flatnonzero(at_end)]
+        positions = [ends[at_end]]
+        # calendars whose last time is >= ts, usually none
+        for pid in np.flatnonzero(~at_end):
+            grid = self[pid]
+            pos = np.searchsorted(grid, ts)
+            if grid[pos] != ts:
+                pids.append(np.array([pid]))
+                positions.append(np.array([self.indptr[pid] + pos]))
+        parent_ids = np.concatenate(pids)
+        if not parent_ids.size:
+            return
+        self.data = np.insert(self.data, np.concatenate(positions), ts)
+        added = np.bincount(parent_ids, minlength=len(self))
+        self.indptr = self.indptr + np.append(0, np.cumsum(added))
+
+    def merge(self, parent_ids: np.ndarray, times: np.ndarray) -> None:
+        """Adds each of ``times`` to the calendar of the matching ``parent_ids``."""
+        if not parent_ids.size:
+            return
+        all_pids = np.concatenate(
+            [np.repeat(np.arange(len(self)), self.lengths), parent_ids]
+        )
+        all_times = np.concatenate(
+            [self.data, times.astype(self.data.dtype, copy=False)]
+        )
+        order = np.lexsort((all_times, all_pids))
+        all_pids = all_pids[order]
+        all_times = all_times[order]
+        keep = np.ones(all_times.size, dtype=bool)
+        keep[1:] = (all_pids[1:] != all_pids[:-1]) | (all_times[1:] != all_times[:-1])
+        self.data = all_times[keep]
+        indptr = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(all_pids[keep], minlength=len(self)), out=indptr[1:])
+        self.indptr = indptr
+
+    def trim_to_last(self, n: int) -> None:
+        """Keeps only the last ``n`` times of every calendar."""
+        keep_lengths = np.minimum(self.lengths, n)
+        indptr = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(keep_lengths, out=indptr[1:])
+        # position in `data` of every kept time
+        starts = self.indptr[1:] - keep_lengths
+        src = np.arange(indptr[-1]) + np.repeat(starts - indptr[:-1], keep_lengths)
+        self.data = self.data[src]
+        self.indptr = indptr
+
+    def positions(self, parent_ids: np.ndarray, times: np.ndarray) -> np.ndarray:
+        """``np.searchsorted(self[pid], t)`` for every pair of ``parent_ids`` and ``times``."""
+        n_data = self.data.size
+        all_pids = np.concatenate(
+            [np.repeat(np.arange(len(self)), self.lengths), parent_ids]
+        )
+        all_times = np.concatenate(
+            [self.data, times.astype(self.data.dtype, copy=False)]
+        )
+        # queries sort before equal calendar times, like side="left"
+        is_data = np.arange(all_pids.size) < n_data
+        order = np.lexsort((is_data, all_times, all_pids))
+        sorted_is_data = is_data[order]
+        data_before = np.cumsum(sorted_is_data) - sorted_is_data
+        query_rows = order[~sorted_is_data] - n_data
+        out = np.empty(len(times), dtype=np.int64)
+        out[query_rows] = (
+            data_before[~sorted_is_data] - self.indptr[parent_ids[query_rows]]
+        )
+        return out
+
+
+class _BucketParents(Mapping):
+    """Parent id of every bucket, stored as an array indexed by bucket id.
+
+    Buckets without a parent hold -1 and are left out of the mapping. Like
+    ``_ParentCalendars``, updates rebind ``parent_ids`` so a shallow copy is a
+    consistent snapshot."""
+
+    def __init__(self, parent_ids: np.ndarray):
+        self.parent_ids = parent_ids
+
+    @classmethod
+    def from_arrays(
+        cls, bucket_ids: np.ndarray, parent_ids: np.ndarray
+    ) -> "_BucketParents":
+        size = int(bucket_ids.max()) + 1 if bucket_ids.size else 0
+        out = np.full(size, -1, dtype=np.int64)
+        out[bucket_ids] = parent_ids
+        return cls(out)
+
+    def __getitem__(self, bid: int) -> int:
+        if not 0 <= bid < self.parent_ids.size or self.parent_ids[bid] < 0:
+            raise KeyError(bid)
+        return int(self.parent_ids[bid])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.parent_ids >= 0))
 
+    def __iter__(self):
+        return iter(np.flatnonzero(self.parent_ids >= 0).tolist())
 
-def _compute_time_index_from_parent(bid_arr, ts_arr, parent_grids):
+    def lookup(self, bucket_ids: np.ndarray) -> np.ndarray:
+        """Parent of each of ``bucket_ids``, -1 for the ones without a parent."""
+        out = np.full(bucket_ids.size, -1, dtype=np.int64)
+        known = bucket_ids < self.parent_ids.size
+        out[known] = self.parent_ids[bucket_ids[known]]
+        return out
+
+    def assign(self, bucket_ids: np.ndarray, parent_ids: np.ndarray) -> None:
+        size = max(self.parent_ids.size, int(bucket_ids.max()) + 1)
+        out = np.full(size, -1, dtype=np.int64)
+        out[: self.parent_ids.size] = self.parent_ids
+        out[bucket_ids] = parent_ids
+        self.parent_ids = out
+
+
+class _BucketOrdinals(MutableMapping):
+    """Next time ordinal of every bucket, stored as an array indexed by bucket id.
+
+    Buckets without an ordinal hold -1 and are left out of the mapping."""
+
+    def __init__(self, ords: np.ndarray):
+        self.ords = ords
+
+    @classmethod
+    def from_arrays(
+        cls, bucket_ids: np.ndarray, ords: np.ndarray
+    ) -> "_BucketOrdinals":
+        size = int(bucket_ids.max()) + 1 if bucket_ids.size else 0
+        out = np.full(size, -1, dtype=np.int64)
+        out[bucket_ids] = ords
+        return cls(out)
+
+    @classmethod
+    def from_mapping(cls, ords: Mapping) -> "_BucketOrdinals":
+        if isinstance(ords, cls):
+            return ords
+        return cls.from_arrays(
+            np.fromiter(ords.keys(), dtype=np.int64, count=len(ords)),
+            np.fromiter(ords.values(), dtype=np.int64, count=len(ords)),
+        )
+
+    def __getitem__(self, bid: int) -> int:
+        if not 0 <= bid < self.ords.size or self.ords[bid] < 0:
+            raise KeyError(bid)
+        return int(self.ords[bid])
+
+    def __setitem__(self, bid: int, ord_: int) -> None:
+        self.assign(np.array([bid], dtype=np.int64), np.array([ord_]))
+
+    def __delitem__(self, bid: int) -> None:
+        if bid not in self:
+            raise KeyError(bid)
+        self.ords[bid] = -1
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.ords >= 0))
+
+    def __iter__(self):
+        return iter(np.flatnonzero(self.ords >= 0).tolist())
+
+    def copy(self) -> "_BucketOrdinals":
+        return _BucketOrdinals(self.ords.copy())
+
+    __copy__ = copy
+
+    def lookup(self, bucket_ids: np.ndarray) -> np.ndarray:
+        """Next ordinal of each of ``bucket_ids``, -1 for the ones without one."""
+        out = np.full(bucket_ids.size, -1, dtype=np.int64)
+        known = bucket_ids < self.ords.size
+        out[known] = self.ords[bucket_ids[known]]
+        return out
+
+    def assign(self, bucket_ids: np.ndarray, ords: np.ndarray) -> None:
+        size = int(bucket_ids.max(initial=-1)) + 1
+        if size > self.ords.size:
+            pad = np.full(size - self.ords.size, -1, dtype=np.int64)
+            self.ords = np.append(self.ords, pad)
+        self.ords[bucket_ids] = ords
+
+
+class _KeyIndex:
+    """Maps composite keys to integer ids through sorted integer codes.
+
+    Every key column is factorized against its sorted unique values and the
+    codes of the columns are combined one at a time, refactorizing after each
+    step so the combined codes stay below the number of keys. Looking up keys
+    is then a ``np.searchsorted`` per column, without joins or Python loops."""
+
+    def __init__(self, columns: List[np.ndarray], ids: np.ndarray):
+        self.levels: List[np.ndarray] = []
+        self.combos: List[np.ndarray] = []
+        codes = np.zeros(ids.size, dtype=np.int64)
+        for j, col in enumerate(columns):
+            levels, col_codes = np.unique(col, return_inverse=True)
+            self.levels.append(levels)
+            if j == 0:
+                codes = col_codes.ravel()
+            else:
+                combos, codes = np.unique(
+                    codes * levels.size + col_codes.ravel(), return_inverse=True
+                )
+                codes = codes.ravel()
+                self.combos.append(combos)
+        self.ids = np.full(codes.max(initial=-1) + 1, -1, dtype=np.int64)
+        self.ids[codes] = ids
+
+    @staticmethod
+    def _match(sorted_vals: np.ndarray, vals: np.ndarray):
+        pos = np.searchsorted(sorted_vals, vals)
+        pos = np.minimum(pos, max(sorted_vals.size - 1, 0))
+        if not sorted_vals.size:
+            return pos, np.zeros(vals.size, dtype=bool)
+        return pos, sorted_vals[pos] == vals
+
+    def lookup(self, columns: List[np.ndarray]) -> np.ndarray:
+        """Id of each key in ``columns``, -1 for the keys that aren't indexed."""
+        found = np.ones(columns[0].size, dtype=bool)
+        codes = np.zeros(columns[0].size, dtype=np.int64)
+        for j, (levels, col) in enumerate(zip(self.levels, columns)):
+            col_codes, hit = self._match(levels, col)
+            found &= hit
+            if j == 0:
+                codes = col_codes
+            else:
+                codes, hit = self._match(
+                    self.combos[j - 1], codes * levels.size + col_codes
+                )
+                found &= hit
+        out = np.full(found.size, -1, dtype=np.int64)
+        out[found] = self.ids[codes[found]]
+        return out
+
+
+def _compute_time_index_from_parent(bid_arr, ts_arr, calendars, bucket_to_parent):
     """Assign ordinals using the parent calendar's time grid.
 
     For partition_by states, ordinals must reflect the parent calendar so
@@ -438,25 +1116,24 @@ def _compute_time_index_from_parent(bid_arr, ts_arr, parent_grids):
         Bucket ID for each observation.
     ts_arr : np.ndarray
         Timestamp for each observation.
-    parent_grids : Dict[int, np.ndarray]
-        Maps each bucket_id to the sorted unique timestamps of its parent
-        calendar.
+    calendars : _ParentCalendars
+        Sorted unique timestamps of every parent calendar.
+    bucket_to_parent : _BucketParents
+        Parent of each bucket.
 
     Returns
     -------
     idx_arr : np.ndarray
         Ordinal coordinates derived from parent calendar positions.
-    next_by_bucket : Dict[int, int]
+    next_by_bucket : _BucketOrdinals
         Next ordinal for each bucket (= len(parent_grid)).
     """
-    idx_arr = np.empty(len(ts_arr), dtype=np.int64)
-    next_by_bucket = {}
-    for bid in np.unique(bid_arr):
-        mask = bid_arr == bid
-        ts_b = ts_arr[mask]
-        parent_ts = parent_grids[int(bid)]
-        idx_arr[mask] = np.searchsorted(parent_ts, ts_b)
-        next_by_bucket[int(bid)] = len(parent_ts)
+    uniq, inv = np.unique(bid_arr, return_inverse=True)
+    uniq_parents = bucket_to_parent.lookup(uniq)
+    idx_arr = calendars.positions(uniq_parents[inv.ravel()], ts_arr)
+    next_by_bucket = _BucketOrdinals.from_arrays(
+        uniq.astype(np.int64), calendars.lengths[uniq_parents]
+    )
     return idx_arr, next_by_bucket
 
 
@@ -504,18 +1181,37 @@ class PooledState:
     time: np.ndarray
     time_index: np.ndarray
     y: np.ndarray
-    next_time_index_by_bucket: Dict[int, int]
+    next_time_index_by_bucket: _BucketOrdinals
     join_cols: List[str]
     mode: str = "nonlocal"
     partition_cols: Optional[List[str]] = None
     key_cols: Optional[List[str]] = None
     parent_scope_cols: Optional[List[str]] = None
-    _parent_time_grids: Optional[Dict[int, np.ndarray]] = None
-    _bucket_to_parent_id: Optional[Dict[int, int]] = None
-    _parent_to_buckets: Optional[Dict[int, List[int]]] = None
-    _scope_key_to_parent_id: Optional[Dict[tuple, int]] = None
-    _ts_aggs: Dict[int, _TimestampAggregates] = field(default_factory=dict)
+    _parent_time_grids: Optional[_ParentCalendars] = None
+    _bucket_to_parent_id: Optional[_BucketParents] = None
+    _ts_aggs: _BucketAggregates = field(default_factory=_BucketAggregates.empty)
     _idsorted_to_bucket_pos: Optional[np.ndarray] = None
+    # growable storage for the flat arrays (see `_extend_buffer`)
+    _buffers: Dict[str, np.ndarray] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    # key indexes over ``groups`` (see `_key_index`), tagged with the frame
+    # they were built from
+    _key_indexes: Dict[Any, Tuple[Any, Any]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.next_time_index_by_bucket = _BucketOrdinals.from_mapping(
+            self.next_time_index_by_bucket
+        )
+
+    def __getstate__(self):
+        # the buffers hold spare capacity and duplicate the field views
+        state = self.__dict__.copy()
+        state["_buffers"] = {}
+        state["_key_indexes"] = {}
+        return state
 
     @property
     def group_uids(self):
@@ -540,38 +1236,26 @@ class PooledState:
         "y",
         "_idsorted_to_bucket_pos",
     )
-    _MUTABLE_DICT_FIELDS = (
-        "next_time_index_by_bucket",
-        "_parent_time_grids",
-        "_bucket_to_parent_id",
-        "_scope_key_to_parent_id",
-    )
+    _MUTABLE_COPY_FIELDS = ("next_time_index_by_bucket", "_ts_aggs")
 
     def snapshot(self):
         """Cheap structural backup for recursive prediction.
 
-        Prediction only ever **replaces** the array fields wholesale
-        (``np.append`` / ``np.concatenate`` produce new arrays) and rebinds
-        attributes on the ``_TimestampAggregates`` instances — it never mutates
-        a shared array in place. So a faithful backup needs only reference
-        copies of the arrays plus shallow copies of the mutable containers and
-        of each aggregate instance; no array data is duplicated (unlike a full
-        ``deepcopy`` of every pooled state per model per ``predict``).
+        Prediction only ever **rebinds** the array fields, either to new arrays
+        or to longer views of their growable buffers (``_extend_buffer`` only
+        writes past the end of the current view), and only appends to the
+        aggregates of a bucket (``_BucketAggregates``). The values seen through
+        a view never change, so a faithful backup needs only reference copies of
+        the arrays (in effect, their lengths) plus shallow copies of the mutable
+        containers; no array data is duplicated (unlike a full ``deepcopy`` of
+        every pooled state per model per ``predict``).
         """
         snap = {f: getattr(self, f) for f in self._MUTABLE_REF_FIELDS}
-        for f in self._MUTABLE_DICT_FIELDS:
-            v = getattr(self, f)
-            snap[f] = None if v is None else dict(v)
-        # lists are reassigned wholesale today, but copy them defensively so a
-        # future in-place ``append`` can't corrupt the backup.
-        snap["_parent_to_buckets"] = (
-            None
-            if self._parent_to_buckets is None
-            else {k: list(v) for k, v in self._parent_to_buckets.items()}
-        )
-        # each agg instance is mutated in place (``agg.sums = np.append(...)``),
-        # so copy the instances; their arrays are replaced wholesale, share them.
-        snap["_ts_aggs"] = {bid: copy.copy(agg) for bid, agg in self._ts_aggs.items()}
+        for f in self._MUTABLE_COPY_FIELDS:
+            snap[f] = copy.copy(getattr(self, f))
+        # the parent arrays are rebound on every update
+        snap["_parent_time_grids"] = copy.copy(self._parent_time_grids)
+        snap["_bucket_to_parent_id"] = copy.copy(self._bucket_to_parent_id)
         return snap
 
     def restore(self, snap):
@@ -721,65 +1405,56 @@ class PooledState:
         else:
             parent_scope_cols = None
 
-        parent_id_map: Dict[tuple, int] = {}
-        bucket_to_parent: Dict[int, int] = {}
-        parent_grids: Dict[int, np.ndarray] = {}
-        next_pid = 0
-
         if parent_scope_cols is not None:
             # Sentinel-encode the scope columns so a null/NaN scope value (e.g. a
             # null groupby key under groupby+partition_by) matches itself and only
-            # itself: scope keys are used both as dict keys (NaN != NaN would split
-            # one scope across parents) and as a grid filter (an `== null` predicate
-            # matches nothing). Mirrors the null-equal bucket-key handling above.
+            # itself: scope keys are the join keys for the calendars here and the
+            # index keys when `_resolve_parents` assigns new buckets later (NaN !=
+            # NaN would split one scope across parents). Mirrors the null-equal
+            # bucket-key handling above.
             enc_scope_cols = [f"__enc_{c}" for c in parent_scope_cols]
             groups_nw = _encode_keys(nw.from_native(groups), parent_scope_cols)
             sorted_nw = _encode_keys(nw.from_native(sorted_df), parent_scope_cols)
-            # Single pass over the unique (scope, time) pairs to build every
-            # scope's calendar at once instead of filtering the full frame per
-            # bucket. Scope keys are read via .rows() so they compare equal to
-            # the .row(0) tuples `_resolve_parent_for_bucket` builds later;
-            # times come from .to_numpy() so grids keep their native dtype.
-            scope_time = sorted_nw.select(enc_scope_cols + [time_col]).unique()
-            grid_scope_keys = scope_time.select(enc_scope_cols).rows()
-            grid_ts_vals = scope_time.get_column(time_col).to_numpy()
-            times_by_scope: Dict[tuple, list] = {}
-            for key, ts in zip(grid_scope_keys, grid_ts_vals):
-                times_by_scope.setdefault(key, []).append(ts)
-
             # `groups` has one row per bucket in ascending _bucket_id order, so
-            # iterating it assigns parent ids in the same order as before.
-            bucket_scope_keys = groups_nw.select(enc_scope_cols).rows()
-            for bid, scope_key in zip(
-                groups_nw.get_column("_bucket_id").to_numpy(), bucket_scope_keys
-            ):
-                if scope_key not in parent_id_map:
-                    pid = next_pid
-                    next_pid += 1
-                    parent_id_map[scope_key] = pid
-                    parent_grids[pid] = np.sort(np.asarray(times_by_scope[scope_key]))
-                bucket_to_parent[int(bid)] = parent_id_map[scope_key]
-        else:
-            all_ts = sorted_df[time_col].to_numpy()
-            global_ts = np.sort(np.unique(all_ts))
-            parent_grids[0] = global_ts
-            for bid in np.unique(bid_arr):
-                bucket_to_parent[int(bid)] = 0
-
-        parent_to_buckets: Dict[int, List[int]] = {}
-        for bid, pid in bucket_to_parent.items():
-            parent_to_buckets.setdefault(pid, []).append(bid)
-
-        if parent_scope_cols is not None:
-            scope_key_to_parent = dict(parent_id_map)
+            # parent ids follow the first bucket of each scope.
+            parents_nw = (
+                groups_nw.select(enc_scope_cols)
+                .unique(keep="first", maintain_order=True)
+                .with_row_index(name="_parent_id")
+                .with_columns(nw.col("_parent_id").cast(nw.Int64))
+            )
+            n_parents = parents_nw.shape[0]
+            bucket_pids = _order_preserving_left_join(
+                groups_nw.select(enc_scope_cols + ["_bucket_id"]),
+                parents_nw,
+                on=enc_scope_cols,
+            )
+            bucket_to_parent = _BucketParents.from_arrays(
+                bucket_pids.get_column("_bucket_id").to_numpy().astype(np.int64),
+                bucket_pids.get_column("_parent_id").to_numpy().astype(np.int64),
+            )
+            # Every calendar is built at once from the unique (parent, time) pairs
+            # as flat columns; times come from .to_numpy() so the calendars keep
+            # their native dtype.
+            parent_times = sorted_nw.select(enc_scope_cols + [time_col]).unique()
+            parent_times = parent_times.join(parents_nw, on=enc_scope_cols)
+            parent_grids = _ParentCalendars.from_pairs(
+                parent_times.get_column("_parent_id").to_numpy().astype(np.int64),
+                parent_times.get_column(time_col).to_numpy(),
+                n_parents,
+            )
         else:
-            scope_key_to_parent = {(): 0}
+            global_ts = np.unique(sorted_df[time_col].to_numpy())
+            parent_grids = _ParentCalendars(
+                global_ts, np.array([0, global_ts.size], dtype=np.int64)
+            )
+            uniq_bid = np.unique(bid_arr)
+            bucket_to_parent = _BucketParents.from_arrays(
+                uniq_bid, np.zeros(uniq_bid.size, dtype=np.int64)
+            )
 
-        per_bucket_grids = {
-            bid: parent_grids[bucket_to_parent[bid]] for bid in bucket_to_parent
-        }
         ord_arr, next_by_bucket = _compute_time_index_from_parent(
-            bid_arr, ts_raw, per_bucket_grids
+            bid_arr, ts_raw, parent_grids, bucket_to_parent
         )
 
         sf_cols = set(static_features.columns)
@@ -809,8 +1484,6 @@ class PooledState:
             parent_scope_cols=parent_scope_cols,
             _parent_time_grids=parent_grids,
             _bucket_to_parent_id=bucket_to_parent,
-            _parent_to_buckets=parent_to_buckets,
-            _scope_key_to_parent_id=scope_key_to_parent,
             _ts_aggs=_build_ts_aggs(bid_arr, ord_arr, y_float),
         )
 
@@ -833,88 +1506,100 @@ class PooledState:
         if self.key_cols is None:
             return
         key_cols = self.key_cols
-        context_with_bid = _attach_bucket_id(context_df, self.groups, key_cols)
-        context_with_bid, self.groups = _extend_groups(
-            context_with_bid, self.groups, key_cols
+        context_nw = nw.from_native(context_df)
+        groups_schema = nw.from_native(self.groups).schema
+        context_schema = context_nw.schema
+        # same int<->float reconcile as `_encode_join_keys`
+        groups_to_int = tuple(
+            groups_schema[c].is_float() and context_schema[c].is_integer()
+            for c in key_cols
+        )
+        context_to_int = [
+            context_schema[c].is_float() and groups_schema[c].is_integer()
+            for c in key_cols
+        ]
+        new_bid = self._key_index(key_cols, groups_to_int).lookup(
+            _encoded_key_arrays(context_nw, key_cols, context_to_int)
         )
-        new_bid = context_with_bid["_bucket_id"].to_numpy().astype(np.int64)
+        if (new_bid < 0).any():
+            # unseen keys get new buckets
+            context_with_bid = _attach_bucket_id(context_df, self.groups, key_cols)
+            context_with_bid, self.groups = _extend_groups(
+                context_with_bid, self.groups, key_cols
+            )
+            new_bid = context_with_bid["_bucket_id"].to_numpy().astype(np.int64)
         self.series_bucket_id = new_bid
-        groups_nw = nw.from_native(self.groups)
-        if self.parent_scope_cols:
-            # Encode once so the per-bucket `_resolve_parent_for_bucket` loop below
-            # reuses it instead of re-encoding each new bucket.
-            groups_nw = _encode_keys(groups_nw, self.parent_scope_cols)
-        for bid in np.unique(new_bid):
-            bid_int = int(bid)
-            if bid_int not in self.next_time_index_by_bucket:
-                pid = self._resolve_parent_for_bucket(bid_int, groups_nw=groups_nw)
-                if pid is not None and self._parent_time_grids is not None:
-                    self.next_time_index_by_bucket[bid_int] = len(
-                        self._parent_time_grids[pid]
-                    )
-                else:
-                    self.next_time_index_by_bucket[bid_int] = 0
-            if bid_int not in self._ts_aggs:
-                self._ts_aggs[bid_int] = _TimestampAggregates(
-                    unique_times=np.array([], dtype=np.intp),
-                    sums=np.array([], dtype=np.float64),
-                    counts=np.array([], dtype=np.intp),
-                    sum_sq=np.array([], dtype=np.float64),
-                    mins=np.array([], dtype=np.float64),
-                    maxs=np.array([], dtype=np.float64),
-                )
-
-    def _resolve_parent_for_bucket(self, bid: int, groups_nw=None) -> Optional[int]:
-        """Find or create the parent_id for a bucket from its scope columns.
-
-        ``groups_nw`` is an optional pre-wrapped Narwhals view of ``self.groups``;
-        callers that resolve many buckets in a loop pass it once to avoid
-        re-wrapping per bucket. When omitted it is wrapped internally.
-        """
-        if (
-            self._bucket_to_parent_id is None
-            or self._parent_to_buckets is None
-            or self._parent_time_grids is None
-            or self._scope_key_to_parent_id is None
-        ):
-            return None
-
-        if bid in self._bucket_to_parent_id:
-            return self._bucket_to_parent_id[bid]
-
+        uniq_bid = np.unique(new_bid)
+        new_buckets = uniq_bid[self.next_time_index_by_bucket.lookup(uniq_bid) < 0]
+        if new_buckets.size:
+            if self._bucket_to_parent_id is not None:
+                pids = self._resolve_parents(new_buckets)
+                next_idxs = self._parent_time_grids.lengths[pids]
+            else:
+                next_idxs = np.zeros(new_buckets.size, dtype=np.int64)
+            self.next_time_index_by_bucket.assign(new_buckets, next_idxs)
+        # only the buckets without aggregates get an empty entry
+        self._ts_aggs = _BucketAggregates.from_aggs(self._ts_aggs)
+        self._ts_aggs.add_empty(uniq_bid)
+
+    def _key_index(self, cols: List[str], to_int: Tuple[bool, ...]) -> _KeyIndex:
+        """Index from the ``cols`` keys of ``groups`` to their bucket ids.
+
+        Built once per version of ``groups``, which is only ever rebound."""
+        cache_key = (tuple(cols), to_int)
+        entry = self._key_indexes.get(cache_key)
+        if entry is None or entry[0] is not self.groups:
+            groups_nw = nw.from_native(self.groups)
+            index = _KeyIndex(
+                _encoded_key_arrays(groups_nw, cols, to_int),
+                groups_nw.get_column("_bucket_id").to_numpy().astype(np.int64),
+            )
+            entry = (self.groups, index)
+            self._key_indexes[cache_key] = entry
+        return entry[1]
+
+    def _resolve_parents(self, bids: np.ndarray) -> np.ndarray:
+        """Find or create the parent of each of the (sorted) ``bids``.
+
+        A bucket joins the parent of the known buckets with its scope key. Every
+        unseen scope gets a new parent with an empty calendar, numbered in the
+        order of its first bucket."""
+        pids = self._bucket_to_parent_id.lookup(bids)
+        new = pids < 0
+        if not new.any():
+            return pids
         if self.parent_scope_cols is None:
-            scope_key = ()
+            pids[new] = 0
         else:
-            if groups_nw is None:
-                groups_nw = nw.from_native(self.groups)
-            # `_scope_key_to_parent_id` is keyed by sentinel-encoded scope tuples
-            # (see `from_partition`), so encode here too — null/NaN scope values
-            # must resolve to the same parent, not a fresh one per NaN.
-            enc_scope_cols = [f"__enc_{c}" for c in self.parent_scope_cols]
-            if enc_scope_cols[0] not in groups_nw.columns:
-                groups_nw = _encode_keys(groups_nw, self.parent_scope_cols)
-            row_nw = groups_nw.filter(nw.col("_bucket_id") == bid)
-            if len(row_nw) == 0:
-                return None
-            scope_key = row_nw.select(enc_scope_cols).row(0)
-
-        if scope_key in self._scope_key_to_parent_id:
-            pid = self._scope_key_to_parent_id[scope_key]
-            self._bucket_to_parent_id[bid] = pid
-            self._parent_to_buckets[pid].append(bid)
-            return pid
-
-        pid = max(self._parent_time_grids.keys()) + 1 if self._parent_time_grids else 0
-        dtype = (
-            next(iter(self._parent_time_grids.values())).dtype
-            if self._parent_time_grids
-            else self.time.dtype
-        )
-        self._parent_time_grids[pid] = np.array([], dtype=dtype)
-        self._bucket_to_parent_id[bid] = pid
-        self._parent_to_buckets[pid] = [bid]
-        self._scope_key_to_parent_id[scope_key] = pid
-        return pid
+            groups_nw = nw.from_native(self.groups)
+            # sentinel-encoded as in `from_partition`, so null/NaN scope values
+            # resolve to the same parent instead of a fresh one per NaN.
+            scope = _encoded_key_arrays(groups_nw, self.parent_scope_cols)
+            group_bids = groups_nw.get_column("_bucket_id").to_numpy()
+            group_bids = group_bids.astype(np.int64)
+            group_pids = self._bucket_to_parent_id.lookup(group_bids)
+            known = group_pids >= 0
+            row_by_bid = np.empty(group_bids.max() + 1, dtype=np.int64)
+            row_by_bid[group_bids] = np.arange(group_bids.size)
+            new_rows = row_by_bid[bids[new]]
+            new_scope = [col[new_rows] for col in scope]
+            scope_index = _KeyIndex([col[known] for col in scope], group_pids[known])
+            new_pids = scope_index.lookup(new_scope)
+            unseen = np.flatnonzero(new_pids < 0)
+            if unseen.size:
+                unseen_scope = [col[unseen] for col in new_scope]
+                rows = np.arange(unseen.size)
+                # first row of the scope of every row
+                same_scope = _KeyIndex(unseen_scope, rows).lookup(unseen_scope)
+                first = np.full(unseen.size, unseen.size)
+                np.minimum.at(first, same_scope, rows)
+                firsts, rank = np.unique(first[same_scope], return_inverse=True)
+                new_pids[unseen] = self._parent_time_grids.add_parent(
+                    firsts.size
+                ) + rank.ravel()
+            pids[new] = new_pids
+        self._bucket_to_parent_id.assign(bids[new], pids[new])
+        return pids
 
     def _advance_parent_calendars(self, new_ts_val):
         """Advance all parent calendars and sync sibling bucket ordinals.
@@ -924,18 +1609,29 @@ class PooledState:
         each parent update their ``next_time_index_by_bucket`` to the
         new parent grid length.
         """
-        if self._parent_time_grids is None or self._parent_to_buckets is None:
+        if self._parent_time_grids is None or self._bucket_to_parent_id is None:
             return
-        for pid, grid in self._parent_time_grids.items():
-            if len(grid) == 0 or new_ts_val > grid[-1]:
-                self._parent_time_grids[pid] = np.append(grid, new_ts_val)
-            else:
-                pos = np.searchsorted(grid, new_ts_val)
-                if pos >= len(grid) or grid[pos] != new_ts_val:
-                    self._parent_time_grids[pid] = np.insert(grid, pos, new_ts_val)
-            new_len = len(self._parent_time_grids[pid])
-            for bid in self._parent_to_buckets.get(pid, []):
-                self.next_time_index_by_bucket[bid] = new_len
+        self._parent_time_grids.insert_time(new_ts_val)
+        parent_ids = self._bucket_to_parent_id.parent_ids
+        bids = np.flatnonzero(parent_ids >= 0)
+        new_lens = self._parent_time_grids.lengths[parent_ids[bids]]
+        self.next_time_index_by_bucket.assign(bids, new_lens)
+
+    def _extend_flat_arrays(self, new_ts, new_y, new_bid, new_ord) -> None:
+        for name, new_vals in (
+            ("time", new_ts),
+            ("y", new_y),
+            ("bucket_id", new_bid),
+            ("time_index", new_ord),
+        ):
+            setattr(
+                self,
+                name,
+                _extend_buffer(self._buffers, name, getattr(self, name), new_vals),
+            )
+
+    def _extend_ts_aggs(self, new_bid, new_ord, new_y) -> None:
+        self._ts_aggs.extend(*_segment_aggregates(new_bid, new_ord, new_y))
 
     def append_predictions(self, curr_dates, predictions, n_series):
         new_arr = np.asarray(predictions)
@@ -943,71 +1639,30 @@ class PooledState:
         # produce object arrays in np.full/np.append, silently degrading
         # self.time and the parent calendars from datetime64 to object
         new_ts_val = np.asarray(curr_dates)[:1].astype(self.time.dtype, copy=False)[0]
+        new_ts = np.full(n_series, new_ts_val, dtype=self.time.dtype)
         if self.groups is None:
-            new_ts = np.full(n_series, new_ts_val, dtype=self.time.dtype)
             new_bid = np.zeros(n_series, dtype=np.int64)
             next_ord = self.next_time_index_by_bucket[0]
             new_ord = np.full(n_series, next_ord, dtype=np.int64)
             new_y = new_arr.astype(float)
-            self.time = np.concatenate([self.time, new_ts])
-            self.y = np.concatenate([self.y, new_y])
-            self.bucket_id = np.concatenate([self.bucket_id, new_bid])
-            self.time_index = np.concatenate([self.time_index, new_ord])
+            self._extend_flat_arrays(new_ts, new_y, new_bid, new_ord)
             self.next_time_index_by_bucket[0] = next_ord + 1
-            if 0 in self._ts_aggs:
-                agg = self._ts_aggs[0]
-                valid = ~np.isnan(new_y)
-                agg.unique_times = np.append(agg.unique_times, next_ord)
-                agg.sums = np.append(agg.sums, np.sum(np.where(valid, new_y, 0.0)))
-                agg.counts = np.append(agg.counts, np.sum(valid))
-                agg.sum_sq = np.append(
-                    agg.sum_sq, np.sum(np.where(valid, new_y**2, 0.0))
-                )
-                valid_vals = new_y[valid]
-                agg.mins = np.append(
-                    agg.mins, np.min(valid_vals) if len(valid_vals) > 0 else np.nan
-                )
-                agg.maxs = np.append(
-                    agg.maxs, np.max(valid_vals) if len(valid_vals) > 0 else np.nan
-                )
         else:
             sort_order = np.argsort(self.series_bucket_id, kind="stable")
-            sorted_bids = self.series_bucket_id[sort_order]
-            new_ts = np.full(n_series, new_ts_val, dtype=self.time.dtype)
-            self.time = np.concatenate([self.time, new_ts[sort_order]])
-            self.y = np.concatenate([self.y, new_arr[sort_order].astype(float)])
-            self.bucket_id = np.concatenate([self.bucket_id, sorted_bids])
-            new_ords = np.array(
-                [self.next_time_index_by_bucket[int(gid)] for gid in sorted_bids],
-                dtype=np.int64,
-            )
-            self.time_index = np.concatenate([self.time_index, new_ords])
-            for bid in np.unique(sorted_bids):
-                bid_int = int(bid)
-                new_ord = self.next_time_index_by_bucket[bid_int]
-                if bid_int in self._ts_aggs:
-                    agg = self._ts_aggs[bid_int]
-                    bid_mask = sorted_bids == bid
-                    y_bid = new_arr[sort_order][bid_mask].astype(float)
-                    valid = ~np.isnan(y_bid)
-                    agg.unique_times = np.append(agg.unique_times, new_ord)
-                    agg.sums = np.append(agg.sums, np.sum(np.where(valid, y_bid, 0.0)))
-                    agg.counts = np.append(agg.counts, np.sum(valid))
-                    agg.sum_sq = np.append(
-                        agg.sum_sq, np.sum(np.where(valid, y_bid**2, 0.0))
-                    )
-                    valid_vals = y_bid[valid]
-                    agg.mins = np.append(
-                        agg.mins, np.min(valid_vals) if len(valid_vals) > 0 else np.nan
-                    )
-                    agg.maxs = np.append(
-                        agg.maxs, np.max(valid_vals) if len(valid_vals) > 0 else np.nan
-                    )
+            new_bid = self.series_bucket_id[sort_order]
+            new_y = new_arr[sort_order].astype(float)
+            new_ord = self.next_time_index_by_bucket.lookup(new_bid)
+            self._extend_flat_arrays(new_ts, new_y, new_bid, new_ord)
+        if self._ts_aggs:
+            self._extend_ts_aggs(new_bid, new_ord, new_y)
+        if self.groups is not None:
             if self._parent_time_grids is not None:
                 self._advance_parent_calendars(new_ts_val)
             else:
-                for bid in np.unique(sorted_bids):
-                    self.next_time_index_by_bucket[int(bid)] += 1
+                uniq_bid = np.unique(new_bid)
+                self.next_time_index_by_bucket.assign(
+                    uniq_bid, self.next_time_index_by_bucket.lookup(uniq_bid) + 1
+                )
 
     def append_observations(
         self,
@@ -1075,37 +1730,16 @@ class PooledState:
             if (
                 self._parent_time_grids is not None
                 and self._bucket_to_parent_id is not None
-                and self._parent_to_buckets is not None
             ):
-                groups_nw = nw.from_native(self.groups)
-                for bid in np.unique(new_bid):
-                    bid_int = int(bid)
-                    if bid_int not in self._bucket_to_parent_id:
-                        self._resolve_parent_for_bucket(bid_int, groups_nw=groups_nw)
-                affected_parents: set[int] = set()
-                for bid in np.unique(new_bid):
-                    pid = self._bucket_to_parent_id.get(int(bid))
-                    if pid is not None:
-                        affected_parents.add(pid)
-                for pid in affected_parents:
-                    sibling_bids = self._parent_to_buckets.get(pid, [])
-                    all_new_for_parent = []
-                    for sbid in sibling_bids:
-                        mask = new_bid == sbid
-                        if mask.any():
-                            all_new_for_parent.append(new_ts[mask])
-                    if all_new_for_parent:
-                        combined_new = np.concatenate(all_new_for_parent)
-                        grid = self._parent_time_grids[pid]
-                        self._parent_time_grids[pid] = np.unique(
-                            np.concatenate([grid, combined_new])
-                        )
-                per_bucket_grids = {
-                    bid: self._parent_time_grids[self._bucket_to_parent_id[bid]]
-                    for bid in self._bucket_to_parent_id
-                }
+                uniq_bid, inv = np.unique(new_bid, return_inverse=True)
+                uniq_pid = self._resolve_parents(uniq_bid)
+                new_pid = uniq_pid[inv.ravel()]
+                has_parent = new_pid >= 0
+                self._parent_time_grids.merge(
+                    new_pid[has_parent], new_ts[has_parent]
+                )
                 new_ord_arr, new_next = _compute_time_index_from_parent(
-                    all_bid, all_ts, per_bucket_grids
+                    all_bid, all_ts, self._parent_time_grids, self._bucket_to_parent_id
                 )
             else:
                 new_ord_arr, new_next = _compute_time_index(all_bid, all_ts)
@@ -1134,44 +1768,37 @@ class PooledState:
                         static_features, groups, lookup_cols
                     ).astype(np.int64, copy=False)
 
-    def build_query_arrays(self, _curr_dates, n_series):
+    def build_query_arrays(self, _curr_dates, n_series, window: Optional[int] = None):
+        """History rows followed by one NaN query row per series at the next ordinal.
+
+        When ``window`` is given only the history rows within the last ``window``
+        ordinals of their bucket's calendar are included (the same retention as
+        ``trim_to_last``), so the cost of evaluating finite-window transforms on
+        the query doesn't grow with the length of the history."""
         if self.groups is None:
-            next_ord = self.next_time_index_by_bucket[0]
-            tmp_y = np.concatenate(
-                [
-                    self.y,
-                    np.full(n_series, np.nan),
-                ]
+            new_bids = np.zeros(n_series, dtype=np.int64)
+            new_ords = np.full(
+                n_series, self.next_time_index_by_bucket[0], dtype=np.int64
             )
-            tmp_bid = np.concatenate(
-                [
-                    self.bucket_id,
-                    np.zeros(n_series, dtype=np.int64),
-                ]
-            )
-            tmp_ord = np.concatenate(
-                [
-                    self.time_index,
-                    np.full(n_series, next_ord, dtype=np.int64),
-                ]
-            )
-            return tmp_bid, tmp_ord, tmp_y
         else:
             sort_order = np.argsort(self.series_bucket_id, kind="stable")
             new_bids = self.series_bucket_id[sort_order]
-            new_ords = np.array(
-                [self.next_time_index_by_bucket[int(gid)] for gid in new_bids],
-                dtype=np.int64,
-            )
-            tmp_y = np.concatenate(
-                [
-                    self.y,
-                    np.full(n_series, np.nan),
-                ]
+            new_ords = self.next_time_index_by_bucket.lookup(new_bids)
+        hist_bid = self.bucket_id
+        hist_ord = self.time_index
+        hist_y = self.y
+        if window is not None and hist_bid.size:
+            next_by_bid = self.next_time_index_by_bucket.lookup(
+                np.arange(int(hist_bid.max()) + 1)
             )
-            tmp_bid = np.concatenate([self.bucket_id, new_bids])
-            tmp_ord = np.concatenate([self.time_index, new_ords])
-            return tmp_bid, tmp_ord, tmp_y
+            keep = hist_ord >= next_by_bid[hist_bid] - window
+            hist_bid = hist_bid[keep]
+            hist_ord = hist_ord[keep]
+            hist_y = hist_y[keep]
+        tmp_bid = np.concatenate([hist_bid, new_bids])
+        tmp_ord = np.concatenate([hist_ord, new_ords])
+        tmp_y = np.concatenate([hist_y, np.full(n_series, np.nan)])
+        return tmp_bid, tmp_ord, tmp_y
 
     def trim_to_last(self, n_ordinals: int) -> None:
         """Drop history so each calendar keeps only its last ``n_ordinals`` ordinals.
@@ -1207,9 +1834,7 @@ class PooledState:
         # ``uniq``; the cutoff is uniform within a bucket, so a gather assigns
         # it per row.
         uniq, inv = np.unique(bid_arr, return_inverse=True)
-        next_vals = np.array(
-            [self.next_time_index_by_bucket[int(b)] for b in uniq], dtype=np.int64
-        )
+        next_vals = self.next_time_index_by_bucket.lookup(uniq)
         cutoff_by_uniq = np.maximum(next_vals - n_ordinals, 0)
         cutoff = cutoff_by_uniq[inv]
         keep = self.time_index >= cutoff
@@ -1225,13 +1850,12 @@ class PooledState:
         # boolean mask trims it consistently.
         self.bucket_df = ufp.filter_with_mask(self.bucket_df, keep)
         if self._parent_time_grids is not None:
-            for pid, grid in self._parent_time_grids.items():
-                self._parent_time_grids[pid] = grid[max(len(grid) - n_ordinals, 0) :]
+            self._parent_time_grids.trim_to_last(n_ordinals)
         # A trim drops a whole prefix of ordinals per bucket (``keep`` is
         # ``ord >= cutoff``, uniform within a bucket), so every surviving
         # timestamp group is untouched: its sums/counts/sum_sq/min/max are
         # byte-identical to before and only the ordinal shifts down by
-        # ``cutoff``. So slice each aggregate to its surviving suffix rather
+        # ``cutoff``. So keep the surviving suffix of each aggregate rather
         # than re-aggregating from raw ``y`` -- the dominant cost of a trim on
         # large panels. Buckets whose suffix is empty lost all their rows and
         # are dropped, matching ``_build_ts_aggs`` on the filtered rows.
@@ -1239,30 +1863,18 @@ class PooledState:
         # fills it for all buckets); a cleared cache (slow-path ``_transform``)
         # has no suffixes to slice, so rebuild it from the trimmed arrays.
         if self._ts_aggs:
-            new_aggs: Dict[int, _TimestampAggregates] = {}
-            for pos, b in enumerate(uniq):
-                cut = int(cutoff_by_uniq[pos])
-                bid_int = int(b)
-                agg = self._ts_aggs[bid_int]
-                if cut == 0:
-                    new_aggs[bid_int] = agg
-                    continue
-                m = agg.unique_times >= cut
-                if not m.any():
-                    continue
-                new_aggs[bid_int] = _TimestampAggregates(
-                    unique_times=agg.unique_times[m] - cut,
-                    sums=agg.sums[m],
-                    counts=agg.counts[m],
-                    sum_sq=agg.sum_sq[m],
-                    mins=agg.mins[m],
-                    maxs=agg.maxs[m],
-                )
-            self._ts_aggs = new_aggs
+            aggs = _BucketAggregates.from_aggs(self._ts_aggs)
+            # buckets without rows are dropped as well
+            cutoff_by_bid = np.full(aggs.lens.size, np.iinfo(np.int64).max)
+            in_aggs = uniq < cutoff_by_bid.size
+            cutoff_by_bid[uniq[in_aggs]] = cutoff_by_uniq[in_aggs]
+            self._ts_aggs = aggs.trimmed(cutoff_by_bid)
         else:
             self._ts_aggs = _build_ts_aggs(self.bucket_id, self.time_index, self.y)
-        for bid_int, cal_len in self.next_time_index_by_bucket.items():
-            self.next_time_index_by_bucket[bid_int] = min(cal_len, n_ordinals)
+        ords = self.next_time_index_by_bucket.ords
+        self.next_time_index_by_bucket = _BucketOrdinals(
+            np.where(ords >= 0, np.minimum(ords, n_ordinals), -1)
+        )
         if self._idsorted_to_bucket_pos is not None:
             id_col, time_col = self.join_cols
             self._idsorted_to_bucket_pos = _compute_idsorted_to_bucket_pos(
@@ -1316,11 +1928,27 @@ def _extend_groups(bucket_df, groups, group_cols_list):
     return bucket_df, groups
 
 
+def _compute_bucket_feature(tfm, bid_arr, idx_arr, y_arr, ts_aggs) -> np.ndarray:
+    computed = tfm._compute_bucket_feature(bid_arr, idx_arr, y_arr, _ts_aggs=ts_aggs)
+    if computed is None:
+        raise NotImplementedError(
+            f"Transform {type(tfm).__name__!r} does not support pooled "
+            f"(global/groupby/partition_by) computation. Implement "
+            f"_compute_bucket_feature to use it with global_, groupby, "
+            f"or partition_by."
+        )
+    return computed
+
+
 def compute_pooled_features(
     state: PooledState,
     transforms: Dict[str, _BaseLagTransform],
     query_arrays=None,
+    num_threads: int = 1,
 ) -> Dict[str, np.ndarray]:
+    """Values of the ``transforms`` for every row of the bucket arrays.
+
+    If ``num_threads > 1`` the transforms are computed using multithreading."""
     if query_arrays is not None:
         bid_arr, idx_arr, y_arr = query_arrays
         ts_aggs = _build_ts_aggs(bid_arr, idx_arr, y_arr)
@@ -1329,20 +1957,21 @@ def compute_pooled_features(
         idx_arr = state.time_index
         y_arr = state.y
         ts_aggs = state._ts_aggs
-    bucket_vals: Dict[str, np.ndarray] = {}
-    for name, tfm in transforms.items():
-        computed = tfm._compute_bucket_feature(
-            bid_arr,
-            idx_arr,
-            y_arr,
-            _ts_aggs=ts_aggs,
-        )
-        if computed is None:
-            raise NotImplementedError(
-                f"Transform {type(tfm).__name__!r} does not support pooled "
-                f"(global/groupby/partition_by) computation. Implement "
-                f"_compute_bucket_feature to use it with global_, groupby, "
-                f"or partition_by."
-            )
-        bucket_vals[name] = computed
-    return bucket_vals
+    args = (bid_arr, idx_arr, y_arr, ts_aggs)
+    if num_threads == 1 or len(transforms) == 1:
+        return {
+            name: _compute_bucket_feature(tfm, *args)
+            for name, tfm in transforms.items()
+        }
+    # reuse the thread pool of the caller (see `_pooled_executor`) if it has one
+    setting = _POOLED_EXECUTOR.get()
+    if setting is not None:
+        pool = contextlib.nullcontext(setting[0])
+    else:
+        pool = concurrent.futures.ThreadPoolExecutor(num_threads)
+    with pool as executor:
+        futures = {
+            name: executor.submit(_compute_bucket_feature, tfm, *args)
+            for name, tfm in transforms.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
@@ -147,9 +147,10 @@ def test_weighted_conformal_method_validation():
 def test_weighted_conformal_features_stored(weighted_conformal_setup):
     """After fitting with weighted_conformal method, _cs_df should contain feature columns."""
     fcst, _, _, _ = weighted_conformal_setup
-    non_feat_cols = {fcst.ts.id_col, fcst.ts.time_col, "cutoff"} | set(fcst.models.keys())
-    feat_cols = [c for c in fcst._cs_df.columns if c not in non_feat_cols]
-    assert len(feat_cols) > 0, "_cs_df must contain feature columns for DRE"
+    cs_df = fcst._cs_df
+    assert len(cs_df.feature_names) > 0, "_cs_df must contain feature columns for DRE"
+    assert cs_df.features.dtype == np.float32
+    assert cs_df.features.shape == (len(cs_df), len(cs_df.feature_names))
 
 
 def test_weighted_conformal_uniform_weights_matches_standard(weighted_conformal_setup):
@@ -221,6 +222,28 @@ def test_estimate_density_ratio_gradient_boosting():
     assert (weights > 0).all()
 
 
+@pytest.mark.parametrize("method", ["conformal_error", "conformal_distribution"])
+def test_prediction_intervals_levels_grid_matches_exact(method):
+    """Levels in the grid and off it give the same intervals as without a grid."""
+    from sklearn.linear_model import LinearRegression
+
+    series = generate_daily_series(5, min_length=50, max_length=50)
+
+    def fit_predict(levels):
+        fcst = MLForecast(models=[LinearRegression()], freq="D", lags=[1, 7])
+        fcst.fit(
+            series,
+            prediction_intervals=PredictionIntervals(
+                n_windows=5, h=5, method=method, levels=levels
+            ),
+        )
+        # 80 is between the levels of the grid, the others are in it
+        return fcst.predict(5, level=[80]), fcst.predict(5, level=[50, 95])
+
+    for res, expected in zip(fit_predict([50, 95]), fit_predict(None)):
+        pd.testing.assert_frame_equal(res, expected)
+
+
 # ---------------------------------------------------------------------------
 # Scale-aligned conformal prediction tests
 # ---------------------------------------------------------------------------
@@ -11,6 +11,7 @@ import numpy as np
 import pandas as pd
 import polars as pl
 import pytest
+import utilsforecast.processing as ufp
 
 import tests._conformal_reference as ref
 from mlforecast import conformal_prediction as cp
@@ -147,6 +148,25 @@ def test_weighted_quantiles_matches_scalar_reference():
     np.testing.assert_array_equal(got, expected)
 
 
+def test_batched_weighted_quantiles_match_rows():
+    rng = np.random.default_rng(4)
+    values = rng.normal(size=(6, 150))
+    values[:, ::5] = values[:, :1]  # ties
+    weights = rng.uniform(0.1, 3.0, size=(6, 150))
+    alphas = np.array([0.025, 0.1, 0.5, 0.9, 0.975])
+    # the callers pass transposed (column-major) views
+    got = cp._batched_weighted_quantiles(
+        np.asfortranarray(values), weights, alphas, w_test=0.8
+    )
+    assert got.shape == (alphas.size, values.shape[0])
+    for i in range(values.shape[0]):
+        expected = [
+            ref._weighted_quantile(values[i], weights[i], a, w_test=0.8)
+            for a in alphas
+        ]
+        np.testing.assert_array_equal(got[:, i], expected)
+
+
 def test_weighted_quantile_wrapper_unchanged():
     rng = np.random.default_rng(7)
     values = rng.normal(size=50)
@@ -241,8 +261,6 @@ def test_unweighted_interval_equiv(backend, fn_name, is_transfer, horizon):
 
 @pytest.mark.parametrize("backend", ["pandas", "polars"])
 def test_rescale_interval_columns_equiv(backend):
-    import utilsforecast.processing as ufp
-
     rng = np.random.default_rng(5)
     models = ["m1", "m2"]
     level = [80, 95]
@@ -271,3 +289,159 @@ def test_rescale_interval_columns_equiv(backend):
         np.testing.assert_allclose(
             actual[col].to_numpy(), expected[col].to_numpy(), rtol=RTOL, err_msg=col
         )
+
+
+# ---------------------------------------------------------------------------
+# 6. quantile tables precomputed at fit time
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+@pytest.mark.parametrize("method", ["conformal_error", "conformal_distribution"])
+@pytest.mark.parametrize("horizon", [5, 6])
+def test_quantile_table_intervals_equiv(backend, method, horizon):
+    n_windows, n_series, cs_h = 3, 8, 6
+    models = ["m1", "m2"]
+    level = [50, 80, 95]
+    cs_df = make_cs_df(n_windows, n_series, cs_h, models, backend=backend)
+    fcst_df = make_fcst_df(n_series, horizon, models, backend=backend)
+    table = cp._QuantileTable.from_scores(cs_df, models, level, method, n_windows, cs_h)
+    expected = getattr(ref, f"_add_{method}_intervals")(
+        fcst_df,
+        cs_df,
+        model_names=models,
+        level=level,
+        cs_n_windows=n_windows,
+        cs_h=cs_h,
+        n_series=n_series,
+        horizon=horizon,
+    )
+    actual = cp._add_table_intervals(fcst_df, table, models, level, horizon)
+    assert_frames_close(actual, expected)
+
+    # only the levels in the table are served from it
+    assert table.covers([80]) and table.covers([95, 50])
+    assert not table.covers([65]) and not table.covers([50, 99])
+    subset = cp._add_table_intervals(fcst_df, table, models, [80], horizon)
+    for m in models:
+        for col in (f"{m}-lo-80", f"{m}-hi-80"):
+            np.testing.assert_allclose(
+                subset[col].to_numpy(), actual[col].to_numpy(), rtol=RTOL
+            )
+
+
+# ---------------------------------------------------------------------------
+# 7. compact float32 score store
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+@pytest.mark.parametrize(
+    "fn_name", ["_add_conformal_error_intervals", "_add_conformal_distribution_intervals"]
+)
+def test_score_store_intervals_equiv(backend, fn_name):
+    n_windows, n_series, cs_h = 3, 8, 6
+    models = ["m1", "m2"]
+    cs_df = make_cs_df(n_windows, n_series, cs_h, models, backend=backend)
+    fcst_df = make_fcst_df(n_series, cs_h, models, backend=backend)
+    store = cp._ScoreStore.from_frame(cs_df, models, "unique_id", n_windows, cs_h)
+    assert store.scores.dtype == np.float32
+    assert store.scores.shape == (len(models), n_windows, n_series, cs_h)
+    assert len(store) == len(cs_df)
+
+    frame = store.to_frame()
+    assert type(frame) is type(cs_df)
+    np.testing.assert_array_equal(
+        frame["unique_id"].to_numpy(), cs_df["unique_id"].to_numpy()
+    )
+    kwargs = dict(
+        model_names=models,
+        level=[80, 95],
+        cs_n_windows=n_windows,
+        cs_h=cs_h,
+        n_series=n_series,
+        horizon=cs_h,
+    )
+    expected = getattr(ref, fn_name)(fcst_df, cs_df, **kwargs)
+    actual = getattr(cp, fn_name)(fcst_df, store, **kwargs)
+    # the scores are stored in single precision
+    for col in expected.columns[2:]:
+        np.testing.assert_allclose(
+            actual[col].to_numpy(), expected[col].to_numpy(), atol=1e-6, err_msg=col
+        )
+
+    subset = store.take(["id_001", "id_005"])
+    assert subset.n_series == 2
+    np.testing.assert_array_equal(
+        subset.model_scores("m2"), store.model_scores("m2")[:, [1, 5]]
+    )
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_score_store_transfer_inputs_equiv(backend):
+    """The transfer methods read the store like the frame it replaces."""
+    n_windows, n_series, cs_h = 3, 8, 6
+    models = ["m1", "m2"]
+    cs_df = make_cs_df(n_windows, n_series, cs_h, models, backend=backend)
+    feats = np.random.default_rng(0).normal(size=(len(cs_df), 2))
+    cs_df = ufp.assign_columns(cs_df, ["f1", "f2"], feats)
+    store = cp._ScoreStore.from_frame(
+        cs_df, models, "unique_id", n_windows, cs_h, feature_cols=["f1", "f2"]
+    )
+    frame = store.to_frame()
+
+    names, values = cp._score_features(store, set())
+    assert names == ["f1", "f2"] and values.dtype == np.float32
+    expected_names, expected = cp._score_features(frame, {"unique_id", *models})
+    assert expected_names == names
+    np.testing.assert_array_equal(values, expected)
+    subset = store.take(["id_001", "id_005"])
+    mask = np.asarray(ufp.is_in(frame["unique_id"], ["id_001", "id_005"]))
+    np.testing.assert_array_equal(subset.features, values[mask])
+
+    scales = {f"id_{s:03d}": 1.0 + s for s in range(n_series)}
+    aligned = cp._apply_scale_alignment(store, models, "unique_id", scales)
+    expected = cp._apply_scale_alignment(frame, models, "unique_id", scales)
+    for m in models:
+        np.testing.assert_allclose(
+            aligned.flat_scores(m), expected[m].to_numpy(), rtol=RTOL
+        )
+
+    backtest = ufp.assign_columns(
+        make_cs_df(2, n_series, cs_h, models, seed=5, backend=backend),
+        "y",
+        np.zeros(2 * n_series * cs_h),
+    )
+    kwargs = dict(
+        new_df=None,
+        prediction_intervals=None,
+        tc=None,
+        model_names=models,
+        target_col="y",
+        backtest_results=backtest,
+    )
+    scaled = cp._error_scaled_transfer(source_cs_df=store, **kwargs).cs_df
+    expected = cp._error_scaled_transfer(source_cs_df=frame, **kwargs).cs_df
+    assert isinstance(scaled, cp._ScoreStore)
+    for m in models:
+        np.testing.assert_allclose(
+            scaled.flat_scores(m), expected[m].to_numpy(), rtol=RTOL
+        )
+
+
+# ---------------------------------------------------------------------------
+# 8. symmetric order statistics
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("n", [1, 2, 5, 40])
+def test_symmetric_quantiles_match_np_quantile(n):
+    rng = np.random.default_rng(n)
+    scores = rng.normal(size=(n, 7, 3))
+    cuts = np.sort(np.append(rng.uniform(size=20), [0.0, 0.5, 1.0]))
+    expected = np.quantile(np.concatenate([-scores, scores]), cuts, axis=0)
+    np.testing.assert_allclose(
+        cp._symmetric_quantiles(scores, cuts), expected, rtol=RTOL, atol=1e-12
+    )
+    scores[0, 2, 1] = np.nan
+    expected = np.quantile(np.concatenate([-scores, scores]), cuts, axis=0)
+    np.testing.assert_array_equal(
+        np.isnan(cp._symmetric_quantiles(scores, cuts)), np.isnan(expected)
+    )
@@ -12,6 +12,7 @@ import utilsforecast.processing as ufp
 
 from mlforecast.callbacks import SaveFeatures
 from mlforecast.core import (
+    _MMAP_MIN_BYTES,
     TimeSeries,
     _build_function_transform_name,
     _build_lag_transform_name,
@@ -505,6 +506,43 @@ def test_ts_with_diff_conf(flow_config2, series):
     )
 
 
+class ScaledLagModel:
+    def __init__(self, scale):
+        self.scale = scale
+
+    def predict(self, X):
+        return self.scale * np.asarray(X["lag1"]) + 0.1 * np.asarray(X["day"])
+
+
+@pytest.mark.parametrize("engine", ["pandas", "polars"])
+def test_predict_recursive_lockstep_matches_sequential(engine):
+    series = generate_daily_series(
+        5, min_length=30, max_length=50, equal_ends=False, engine=engine
+    )
+    freq = "1d" if engine == "polars" else "D"
+    ts = TimeSeries(
+        freq=freq,
+        lags=[1, 2],
+        lag_transforms={1: [ExpandingMean(), RollingMean(3), (_rolling_mean, 2)]},
+        date_features=["day"],
+    )
+    ts.fit_transform(series, id_col="unique_id", time_col="ds", target_col="y")
+    models = {"a": ScaledLagModel(0.9), "b": ScaledLagModel(1.1), "c": NaiveModel()}
+    assert ts._can_predict_lockstep(models, before_predict_callback=None)
+    preds = ts.predict(models, horizon=6)
+    for name, model in models.items():
+        expected = ts.predict({name: model}, horizon=6)
+        np.testing.assert_allclose(np.asarray(preds[name]), np.asarray(expected[name]))
+        np.testing.assert_array_equal(
+            np.asarray(preds["ds"]), np.asarray(expected["ds"])
+        )
+    # the stored state isn't modified by the lockstep rollout
+    np.testing.assert_allclose(
+        np.asarray(ts.predict(models, horizon=6)["a"]), np.asarray(preds["a"])
+    )
+    assert not ts._can_predict_lockstep(models, before_predict_callback=SaveFeatures())
+
+
 class PredictPrice:
     def predict(self, X):
         return X["price"]
@@ -2123,6 +2161,30 @@ def test_save_and_load():
     pd.testing.assert_frame_equal(preds, preds2)
 
 
+def test_save_and_load_mmap_arrays():
+    series = generate_daily_series(100, min_length=150, equal_ends=True)
+    ts = TimeSeries(
+        freq="D",
+        lags=[1, 100],
+        lag_transforms={1: [RollingMean(7), RollingMean(2, global_=True)]},
+    )
+    ts.fit_transform(series, "unique_id", "ds", "y")
+    assert ts.ga.data.nbytes >= _MMAP_MIN_BYTES
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "ts"
+        ts.save(path, mmap_arrays=True)
+        assert list((path / "arrays").glob("*.npy"))
+        ts2 = TimeSeries.load(path)
+        assert isinstance(ts2.ga.data.base, np.memmap)
+        preds = ts.predict({"model": NaiveModel()}, 10)
+        preds2 = ts2.predict({"model": NaiveModel()}, 10)
+        pd.testing.assert_frame_equal(preds, preds2)
+        # copy-on-write, so the files aren't modified
+        ts2.ga.data[:] = 0
+        ts3 = TimeSeries.load(path)
+        np.testing.assert_equal(ts3.ga.data, ts.ga.data)
+
+
 # automatically set keep_last_n for built-in lag transforms
 def test_keep_last_n_for_built_in_lag_transforms(series):
     ts = TimeSeries(
@@ -613,6 +613,134 @@ def test_cv_no_refit(setup_forecast_data):
     )
 
 
+@pytest.mark.parametrize("engine", ["pandas", "polars"])
+def test_cv_no_refit_fitted_values_reuse_features(monkeypatch, engine):
+    series = generate_daily_series(8, min_length=40, max_length=80)
+    freq = "D"
+    if engine == "polars":
+        series = pl.from_pandas(series.astype({"unique_id": str}))
+        freq = "1d"
+    fcst = MLForecast(
+        models=[LinearRegression()],
+        freq=freq,
+        lags=[1, 7],
+        lag_transforms={1: [RollingMean(7), ExpandingMean()]},
+        date_features=["day"],
+    )
+    assert fcst._can_reuse_cv_features(None, None, None)
+    cv_kwargs = dict(n_windows=4, h=5, refit=False, fitted=True)
+    res = fcst.cross_validation(series, **cv_kwargs)
+    fitted = fcst.cross_validation_fitted_values()
+    monkeypatch.setattr(MLForecast, "_can_reuse_cv_features", lambda *_, **__: False)
+    expected_res = fcst.cross_validation(series, **cv_kwargs)
+    expected_fitted = fcst.cross_validation_fitted_values()
+    if engine == "polars":
+        res, expected_res = res.to_pandas(), expected_res.to_pandas()
+        fitted, expected_fitted = fitted.to_pandas(), expected_fitted.to_pandas()
+    pd.testing.assert_frame_equal(res, expected_res)
+    pd.testing.assert_frame_equal(fitted, expected_fitted)
+    assert fitted["fold"].nunique() == 4
+
+
+@pytest.mark.parametrize("refit", [True, 2])
+@pytest.mark.parametrize("target_transforms", [None, [LocalStandardScaler()]])
+def test_cv_shared_features(refit, target_transforms):
+    series = generate_daily_series(8, min_length=40, max_length=80)
+    fcst = MLForecast(
+        models=[LinearRegression()],
+        freq="D",
+        lags=[1, 7],
+        lag_transforms={1: [RollingMean(7), ExpandingMean()]},
+        date_features=["day"],
+        target_transforms=target_transforms,
+    )
+    cv_kwargs = dict(n_windows=4, h=5, refit=refit, fitted=True)
+    expected = fcst.cross_validation(series, **cv_kwargs)
+    expected_fitted = fcst.cross_validation_fitted_values()
+    res = fcst.cross_validation(series, shared_features=True, **cv_kwargs)
+    pd.testing.assert_frame_equal(res, expected)
+    pd.testing.assert_frame_equal(
+        fcst.cross_validation_fitted_values(), expected_fitted
+    )
+
+
+def test_cv_shared_features_leaves_fit_state():
+    series = generate_daily_series(8, min_length=40, max_length=80)
+    cv_kwargs = dict(n_windows=3, h=5, refit=True, fitted=True)
+    fcsts = []
+    for shared_features in [False, True]:
+        fcst = MLForecast(
+            models=[LinearRegression()],
+            freq="D",
+            lags=[1, 7],
+            lag_transforms={1: [RollingMean(7)]},
+        )
+        # state of a previous fit that the windows must replace
+        fcst.fit(series, fitted=True)
+        fcst._dre_cache.entries["previous"] = (np.ones(1), np.ones(1))
+        fcst.cross_validation(series, shared_features=shared_features, **cv_kwargs)
+        fcsts.append(fcst)
+    expected, shared = fcsts
+    assert not shared._dre_cache.entries
+    assert shared._cs_df is None and shared._cs_table is None
+    pd.testing.assert_frame_equal(
+        shared.fcst_fitted_values_, expected.fcst_fitted_values_
+    )
+    pd.testing.assert_frame_equal(shared._fitted_train_df_, expected._fitted_train_df_)
+    assert len(shared._fitted_train_df_) < len(series)
+
+
+def test_cv_n_jobs():
+    series = generate_daily_series(8, min_length=40, max_length=80)
+
+    def make_fcst():
+        return MLForecast(
+            models=[LinearRegression()],
+            freq="D",
+            lags=[1, 7],
+            lag_transforms={1: [RollingMean(7)]},
+            date_features=["day"],
+            target_transforms=[LocalStandardScaler()],
+        )
+
+    fcst = make_fcst()
+    cv_kwargs = dict(n_windows=3, h=5, refit=True, fitted=True)
+    expected = fcst.cross_validation(series, **cv_kwargs)
+    expected_fitted = fcst.cross_validation_fitted_values()
+    res = fcst.cross_validation(series, n_jobs=2, **cv_kwargs)
+    pd.testing.assert_frame_equal(res, expected)
+    pd.testing.assert_frame_equal(
+        fcst.cross_validation_fitted_values(), expected_fitted
+    )
+    assert len(fcst.cv_models_) == cv_kwargs["n_windows"]
+    with pytest.warns(UserWarning, match="only used with `refit=True`"):
+        fcst.cross_validation(series, n_windows=2, h=5, refit=False, n_jobs=2)
+    with pytest.warns(UserWarning, match="`shared_features` isn't used"):
+        fcst.cross_validation(series, n_windows=2, h=5, shared_features=True, n_jobs=2)
+
+    # the forecast object keeps the state of the last window's fit
+    cv_kwargs = dict(
+        n_windows=3,
+        h=5,
+        prediction_intervals=PredictionIntervals(n_windows=2, h=5, levels=[80, 95]),
+        level=[80],
+    )
+    expected = fcst.cross_validation(series, **cv_kwargs)
+    expected_state = (fcst._cs_df, fcst._cs_table, fcst.prediction_intervals)
+    expected_ga = fcst.ts.ga
+    fcst = make_fcst()
+    res = fcst.cross_validation(series, n_jobs=2, **cv_kwargs)
+    pd.testing.assert_frame_equal(res, expected)
+    cs_df, cs_table, pi = expected_state
+    np.testing.assert_array_equal(fcst._cs_df.scores, cs_df.scores)
+    pd.testing.assert_series_equal(fcst._cs_df.uids, cs_df.uids)
+    for model, widths in cs_table.widths.items():
+        np.testing.assert_array_equal(fcst._cs_table.widths[model], widths)
+    assert repr(fcst.prediction_intervals) == repr(pi)
+    np.testing.assert_array_equal(fcst.ts.ga.data, expected_ga.data)
+    np.testing.assert_array_equal(fcst.ts.ga.indptr, expected_ga.indptr)
+
+
 @pytest.mark.parametrize("refit", [True, False])
 def test_cv_weight_col(refit):
     """Test that cross_validation works with weight_col and weights are used.
@@ -1114,7 +1242,8 @@ def test_transforms_inverted_when_series_dropped():
 
 
 # save & load
-def test_save_load():
+@pytest.mark.parametrize("mmap_arrays", [False, True])
+def test_save_load(mmap_arrays):
     """Test saving and loading MLForecast objects."""
     series = generate_daily_series(10)
     fcst = MLForecast(
@@ -1128,7 +1257,7 @@ def test_save_load():
     with tempfile.TemporaryDirectory() as tmpdir:
         savedir = Path(tmpdir) / "fcst"
         savedir.mkdir()
-        fcst.save(savedir)
+        fcst.save(savedir, mmap_arrays=mmap_arrays)
         fcst2 = MLForecast.load(savedir)
     preds2 = fcst2.predict(10)
     pd.testing.assert_frame_equal(preds, preds2)
@@ -1667,6 +1796,80 @@ def test_horizons_backward_compatibility():
     assert preds1.shape[0] == n_series * 5
 
 
+@pytest.mark.parametrize("max_horizon", [None, 3])
+def test_fit_n_jobs(max_horizon):
+    df = generate_daily_series(10, min_length=50, max_length=100)
+    models = [
+        LinearRegression(),
+        lgb.LGBMRegressor(n_estimators=10, verbosity=-1, random_state=0),
+    ]
+    fcst1 = MLForecast(models=models, freq="D", lags=[1, 7])
+    fcst1.fit(df, max_horizon=max_horizon)
+    fcst2 = MLForecast(models=models, freq="D", lags=[1, 7])
+    fcst2.fit(df, max_horizon=max_horizon, n_jobs=3, threads_per_model=2)
+    pd.testing.assert_frame_equal(fcst1.predict(h=3), fcst2.predict(h=3))
+    lgb_models = fcst2.models_["LGBMRegressor"]
+    if max_horizon is not None:
+        assert list(lgb_models) == [0, 1, 2]
+        lgb_models = list(lgb_models.values())
+    else:
+        lgb_models = [lgb_models]
+    # trained with the limited threads, predict with the user's value
+    assert all(model.booster_.params["num_threads"] == 2 for model in lgb_models)
+    assert all(model.n_jobs is None for model in lgb_models)
+    # the user's models are left untouched
+    assert models[1].n_jobs is None
+
+
+def test_preprocess_chunks():
+    df = generate_daily_series(10, min_length=50, max_length=100, n_static_features=1)
+
+    def make_fcst(lag_transforms=None, freq="D", date_features=("dayofweek",)):
+        return MLForecast(
+            models=LinearRegression(),
+            freq=freq,
+            lags=[1, 7],
+            lag_transforms=lag_transforms or {1: [RollingMean(7)]},
+            date_features=list(date_features),
+            target_transforms=[Differences([1])],
+        )
+
+    expected = make_fcst().preprocess(df)
+    chunks = list(make_fcst().preprocess_chunks(df, series_per_chunk=3))
+    assert len(chunks) == 4
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks).reset_index(drop=True), expected.reset_index(drop=True)
+    )
+
+    fcst = make_fcst()
+    Xs, ys = zip(*fcst.preprocess_chunks(df, series_per_chunk=4, return_X_y=True))
+    fcst.fit_models(pd.concat(Xs), np.concatenate(ys))
+    pd.testing.assert_frame_equal(fcst.predict(5), make_fcst().fit(df).predict(5))
+
+    # unsorted input is taken through its sort indices
+    shuffled = df.sample(frac=1.0, random_state=0)
+    chunks = list(make_fcst().preprocess_chunks(shuffled, series_per_chunk=3))
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks).reset_index(drop=True), expected.reset_index(drop=True)
+    )
+    pl_expected = make_fcst(freq="1d", date_features=["weekday"]).preprocess(
+        pl.from_pandas(df)
+    )
+    pl_chunks = make_fcst(freq="1d", date_features=["weekday"]).preprocess_chunks(
+        pl.from_pandas(shuffled), series_per_chunk=3
+    )
+    pd.testing.assert_frame_equal(
+        pl.concat(list(pl_chunks)).to_pandas(), pl_expected.to_pandas()
+    )
+
+    with pytest.raises(ValueError, match="Pooled lag transforms"):
+        next(
+            make_fcst({1: [RollingMean(7, global_=True)]}).preprocess_chunks(
+                df, series_per_chunk=3
+            )
+        )
+
+
 def test_horizons_with_exogenous():
     """Test horizons with exogenous features."""
     df = generate_daily_series(5, min_length=50, max_length=60)
@@ -94,3 +94,66 @@ def test_grouped_array_iter():
     ga_copy.data[0] = 900
     assert ga.data[0] == 10
     assert ga.indptr is ga_copy.indptr
+
+
+def test_grouped_array_reserve():
+    from coreforecast.grouped_array import GroupedArray as CoreGroupedArray
+
+    from mlforecast.lag_transforms import RollingMax, RollingMean
+
+    data = np.arange(10, dtype=np.float32)
+    indptr = np.array([0, 2, 10])
+    ga = GroupedArray(data, indptr)
+    reserved = ga.reserve(2)
+    # the unused room shows up as leading nulls of the following group
+    np.testing.assert_equal(reserved[1], np.append([np.nan, np.nan], ga[1]))
+    expected = ga
+    tfms = [RollingMean(3)._set_core_tfm(1), RollingMax(8)._set_core_tfm(2)]
+    for new in ([-1, -2], [-3, -4], [-5, -6]):
+        new = np.array(new, dtype=np.float32)
+        expected = expected.append(new)
+        reserved = reserved.append(new)
+        np.testing.assert_equal(reserved[0], expected[0])
+        np.testing.assert_equal(reserved[1][~np.isnan(reserved[1])], expected[1])
+        for tfm in tfms:
+            np.testing.assert_allclose(
+                tfm.update(CoreGroupedArray(reserved.data, reserved.indptr)),
+                tfm.update(CoreGroupedArray(expected.data, expected.indptr)),
+            )
+    # the original array is left untouched
+    np.testing.assert_equal(ga.data, data)
+    assert_raises_with_message(
+        lambda: ga.reserve(1).append(np.array([1.0, 2.0, 3.0])),
+        "`new_data` must be of size 2",
+    )
+
+
+def test_grouped_array_expand_target():
+    data = np.arange(10, dtype=np.float32)
+    indptr = np.array([0, 1, 4, 4, 10])
+    ga = GroupedArray(data, indptr)
+    expected = np.full((10, 3), np.nan, dtype=np.float32)
+    for i in range(ga.n_groups):
+        group = ga[i]
+        for j in range(min(3, group.size)):
+            expected[indptr[i] : indptr[i + 1] - j, j] = group[j:]
+    expanded = ga.expand_target(3)
+    np.testing.assert_equal(expanded, expected)
+    assert expanded.dtype == np.float32
+    assert expanded.flags.f_contiguous
+    for j, col in enumerate(ga.iter_target_horizons(3)):
+        np.testing.assert_equal(col, expected[:, j])
+
+
+def test_grouped_array_append_several_new_first_group():
+    data = np.arange(4, dtype=np.float32)
+    indptr = np.array([0, 1, 4], dtype=np.int32)
+    new_ga = GroupedArray(data, indptr).append_several(
+        new_sizes=np.array([2, 0, 1], dtype=np.int32),
+        new_values=np.array([10.0, 11.0, 12.0]),
+        new_groups=np.array([True, False, False]),
+    )
+    np.testing.assert_equal(new_ga.data, np.array([10, 11, 0, 1, 2, 3, 12]))
+    np.testing.assert_equal(new_ga.indptr, np.array([0, 2, 3, 7]))
+    assert new_ga.data.dtype == np.float32
+    assert new_ga.indptr.dtype == np.int32
@@ -1,3 +1,4 @@
+import copy
 import warnings
 
 import numpy as np
@@ -311,6 +312,54 @@ def test_categorical_groupby_update_with_new_group(engine, lag):
     np.testing.assert_allclose(features[col].to_numpy(), expected, equal_nan=True)
 
 
+def test_append_predictions_grows_buffers_in_place():
+    """Appended predictions reuse the buffers and keep snapshots intact."""
+    import pickle
+
+    from mlforecast.pooled import _build_ts_aggs
+
+    df = pd.DataFrame(
+        {
+            "unique_id": ["a", "a", "b", "b", "c", "c"],
+            "ds": [1, 2, 1, 2, 1, 2],
+            "y": [1.0, 2.0, 10.0, 20.0, 5.0, 6.0],
+            "brand": ["x", "x", "x", "x", "y", "y"],
+        }
+    )
+    ts = TimeSeries(freq=1, lag_transforms={1: [RollingMean(2, groupby=["brand"])]})
+    ts.fit_transform(
+        df,
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+        dropna=False,
+        static_features=["brand"],
+    )
+    state = ts._pooled_states[("groupby", ("brand",), ())]
+    snap = state.snapshot()
+    orig = {f: getattr(state, f).copy() for f in ("time", "y", "time_index")}
+    for step in range(5):
+        preds = np.array([1.0, np.nan, 3.0]) + step
+        state.append_predictions(np.array([3 + step]), preds, 3)
+        if step:
+            assert state.y.base is state._buffers["y"]
+    expected = _build_ts_aggs(state.bucket_id, state.time_index, state.y)
+    assert set(state._ts_aggs) == set(expected)
+    for bid, agg in expected.items():
+        for f in ("unique_times", "sums", "counts", "sum_sq", "mins", "maxs"):
+            np.testing.assert_allclose(
+                getattr(state._ts_aggs[bid], f), getattr(agg, f), equal_nan=True
+            )
+    state.restore(snap)
+    for f, arr in orig.items():
+        np.testing.assert_array_equal(getattr(state, f), arr)
+    state.append_predictions(np.array([3]), np.full(3, 7.0), 3)
+    np.testing.assert_array_equal(state.y[-3:], 7.0)
+    restored = pickle.loads(pickle.dumps(state))
+    assert restored._buffers == {}
+    np.testing.assert_array_equal(restored.y, state.y)
+
+
 def test_compute_pooled_features_raises_for_unsupported():
     """Transforms returning None from _compute_bucket_feature raise NotImplementedError."""
     from mlforecast.pooled import PooledState, compute_pooled_features
@@ -1410,7 +1459,7 @@ def test_global_partition_unseen_bucket_predict(engine):
 def test_global_partition_new_bucket_inherits_parent_calendar(engine):
     """Regression test for Bug 2: global+partition new bucket gets ordinal 0.
 
-    When parent_scope_cols is None, _resolve_parent_for_bucket must still
+    When parent_scope_cols is None, _resolve_parents must still
     find the global parent (scope_key=()) and inherit its calendar length.
     """
     df = _make_df(
@@ -1488,7 +1537,7 @@ def test_partition_datetime_update_new_bucket(engine):
         dropna=False,
         static_features=[],
     )
-    # Update with a new partition value — this triggers _resolve_parent_for_bucket
+    # Update with a new partition value — this triggers _resolve_parents
     # which creates a new parent grid. With the dtype fix, the grid dtype
     # matches the existing datetime64 dtype.
     update_df = _make_df(
@@ -2229,7 +2278,7 @@ def test_fast_vs_slow_equivalence(tfm_factory, lag):
     """Fast path (aggregate-based) matches slow path (row-level) at every lag.
 
     Exercises all three code paths: fit (_compute_from_aggregates via
-    compute_pooled_features), preprocess (_compute_ts_level_from_aggs),
+    compute_pooled_features), preprocess (_compute_feature_from_aggs),
     and predict (_compute_latest_from_aggs).
     """
     from mlforecast.pooled import compute_pooled_features
@@ -2271,7 +2320,7 @@ def test_fast_vs_slow_equivalence(tfm_factory, lag):
         err_msg=f"fit fast vs slow mismatch for {col}",
     )
 
-    # --- preprocess path: global _compute_ts_level_from_aggs ---
+    # --- preprocess path: global _compute_feature_from_aggs ---
     result_fast = ts.fit_transform(
         df,
         id_col="unique_id",
@@ -2304,7 +2353,7 @@ def test_fast_vs_slow_equivalence(tfm_factory, lag):
         err_msg=f"preprocess global fast vs slow for {col}",
     )
 
-    # --- preprocess path: groupby _compute_ts_level_from_aggs ---
+    # --- preprocess path: groupby _compute_feature_from_aggs ---
     tfm_grp = tfm_factory({"groupby": ["grp"]})
     ts_grp = TimeSeries(freq=1, lag_transforms={lag: [tfm_grp]})
     result_grp = ts_grp.fit_transform(
@@ -2639,7 +2688,7 @@ def test_groupby_partition_null_scope_resolves_at_predict(engine):
     """A new (null-group, unseen-promo) bucket created at predict time must resolve
     to the SAME parent calendar as the existing null-group buckets. The group key is
     a genuinely numeric field (``discount``) with NaN, so the lookup exercises the
-    sentinel encoding in ``_resolve_parent_for_bucket`` — raw NaN != NaN would
+    sentinel encoding in ``_resolve_parents`` — raw NaN != NaN would
     otherwise spawn a fresh parent per NaN."""
     import narwhals as nw
 
@@ -3523,6 +3572,51 @@ def _range_quantile_oracle(
     return float(np.quantile(vals, p))
 
 
+@pytest.mark.parametrize("groupby", [None, ["brand"]])
+def test_build_query_arrays_window_matches_full_history(groupby):
+    """Slow-path transforms give the same query values on the history tail."""
+    from mlforecast.lag_transforms import RollingQuantile, SeasonalRollingMean
+    from mlforecast.pooled import compute_pooled_features
+
+    rng = np.random.default_rng(0)
+    n_series, n_times = 4, 30
+    df = pd.DataFrame(
+        {
+            "unique_id": np.repeat(np.arange(n_series), n_times),
+            "ds": np.tile(np.arange(n_times), n_series),
+            "y": rng.standard_normal(n_series * n_times),
+            "brand": np.repeat(["a", "b", "b", "c"], n_times),
+        }
+    )
+    pooling = {"groupby": groupby} if groupby else {"global_": True}
+    tfms = {
+        "q": RollingQuantile(0.5, 3, min_samples=1, **pooling),
+        "s": SeasonalRollingMean(season_length=7, window_size=2, **pooling),
+    }
+    ts = TimeSeries(freq=1, lag_transforms={1: list(tfms.values())})
+    ts.fit_transform(
+        df,
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+        dropna=False,
+        static_features=["brand"],
+        keep_last_n=n_times,
+    )
+    state = next(iter(ts._pooled_states.values()))
+    named = {name: ts.transforms[name] for name in ts.transforms}
+    window = max(tfm.update_samples for tfm in named.values())
+    full = state.build_query_arrays(None, n_series)
+    tail = state.build_query_arrays(None, n_series, window=window)
+    assert len(tail[0]) < len(full[0])
+    full_vals = compute_pooled_features(state, named, query_arrays=full)
+    tail_vals = compute_pooled_features(state, named, query_arrays=tail)
+    for name in named:
+        np.testing.assert_allclose(
+            tail_vals[name][-n_series:], full_vals[name][-n_series:], equal_nan=True
+        )
+
+
 @pytest.mark.parametrize("engine", ["pandas", "polars"])
 @pytest.mark.parametrize("mode", ["local", "global"])
 def test_slow_path_quantile_with_partition_by(engine, mode):
@@ -3710,6 +3804,98 @@ def test_reaggregate_ts_aggs_does_not_mutate_input():
         np.testing.assert_allclose(getattr(aggs[0], f), arr, equal_nan=True)
 
 
+@pytest.mark.parametrize("window_size", [5, 40])
+@pytest.mark.parametrize("contiguous", [True, False])
+def test_pooled_rolling_min_max_match_window_reference(contiguous, window_size):
+    """The sliding-window kernel matches a brute force, with and without gaps."""
+    from mlforecast.lag_transforms import (
+        _BucketWindows,
+        _jitted_sliding_extremes,
+        _jitted_timestamp_stats,
+        _sliding_extremes,
+        _timestamp_stats,
+    )
+
+    rng = np.random.default_rng(0)
+    n = 60
+    ordv = np.arange(n) if contiguous else np.sort(rng.choice(150, n, replace=False))
+    y = rng.standard_normal(n)
+    y[rng.random(n) < 0.3] = np.nan
+    bid = np.zeros(n, dtype=np.int64)
+    aggs = _build_ts_aggs(bid, ordv, y)
+    lag, min_samples = 2, 2
+    for tfm, reduce in ((RollingMin, np.min), (RollingMax, np.max)):
+        expected = np.full(n, np.nan)
+        for i, t in enumerate(ordv):
+            in_window = (ordv <= t - lag) & (ordv > t - lag - window_size)
+            vals = y[in_window][~np.isnan(y[in_window])]
+            if vals.size >= min_samples:
+                expected[i] = reduce(vals)
+        tfm = tfm(window_size, min_samples=min_samples, global_=True)._set_core_tfm(lag)
+        np.testing.assert_array_equal(
+            tfm._compute_feature_from_aggs(aggs, bid, ordv), expected
+        )
+
+    # the queries in reverse order, split in ranges that start mid-bucket
+    perm = np.arange(n)[::-1]
+    windows = _BucketWindows(aggs, bid[perm], ordv[perm])
+    hi = windows.count_before(lag)
+    lo = windows.count_before(lag + window_size)
+    expected = [np.fmin.reduce(y[a:b]) if b > a else np.nan for a, b in zip(lo, hi)]
+    fields = windows.aggs.fields
+    arrays = [fields[k] for k in ("sums", "counts", "sum_sq", "mins", "maxs")]
+    for kernel, stats in (
+        (_sliding_extremes, _timestamp_stats),
+        (_jitted_sliding_extremes, _jitted_timestamp_stats),
+    ):
+        out = np.empty(n)
+        for start, end in ((0, 17), (17, 18), (18, n)):
+            kernel(
+                stats,
+                0,
+                *arrays,
+                windows.aggs.starts,
+                bid,
+                lo,
+                hi,
+                np.lexsort((lo, hi, bid)),
+                window_size,
+                False,
+                out,
+                start,
+                end,
+            )
+        np.testing.assert_array_equal(out, expected)
+
+
+def test_build_ts_aggs_matches_per_bucket_reference():
+    """Single-pass aggregates over unsorted rows equal a per-bucket computation."""
+    rng = np.random.default_rng(0)
+    n = 500
+    bid = rng.integers(0, 40, n)
+    ordv = rng.integers(0, 15, n)
+    y = rng.standard_normal(n)
+    y[rng.random(n) < 0.3] = np.nan
+    aggs = _build_ts_aggs(bid, ordv, y)
+    assert sorted(aggs) == np.unique(bid).tolist()
+    for b, agg in aggs.items():
+        ord_b = ordv[bid == b]
+        y_b = y[bid == b]
+        np.testing.assert_array_equal(agg.unique_times, np.unique(ord_b))
+        for i, t in enumerate(agg.unique_times):
+            vals = y_b[ord_b == t]
+            vals = vals[~np.isnan(vals)]
+            assert agg.counts[i] == vals.size
+            np.testing.assert_allclose(agg.sums[i], vals.sum())
+            np.testing.assert_allclose(agg.sum_sq[i], (vals**2).sum())
+            if vals.size:
+                assert agg.mins[i] == vals.min()
+                assert agg.maxs[i] == vals.max()
+            else:
+                assert np.isnan(agg.mins[i]) and np.isnan(agg.maxs[i])
+    assert _build_ts_aggs(bid[:0], ordv[:0], y[:0]) == {}
+
+
 @pytest.mark.parametrize("time_agg", ["sum", "count", "mean", "min", "max"])
 def test_collapse_matches_reaggregate(time_agg):
     """_build_ts_aggs(collapse(rows)) == _reaggregate_ts_aggs(_build_ts_aggs(rows))."""
@@ -4440,6 +4626,25 @@ def test_lookup_lag_predict_various_lags(engine, lag):
     np.testing.assert_allclose(captured[0][0], float(n - lag))
 
 
+def test_compute_latest_from_aggs_dense_by_bucket_id():
+    """The fast predict path returns an array indexed by bucket id."""
+    from mlforecast.pooled import _build_ts_aggs, _gather_bucket_values
+
+    # bucket 1 has no aggregates
+    bid = np.array([0, 0, 2, 2, 2])
+    ordv = np.array([0, 1, 0, 1, 2])
+    y = np.array([1.0, 3.0, 2.0, 4.0, 6.0])
+    aggs = _build_ts_aggs(bid, ordv, y)
+    tfm = RollingMean(window_size=2, groupby=["g"])
+    tfm._set_core_tfm(1)
+    result = tfm._compute_latest_from_aggs(aggs, {0: 2, 2: 3})
+    np.testing.assert_allclose(result, [2.0, np.nan, 5.0])
+    series_bid = np.array([2, 0, 1, 3])
+    np.testing.assert_allclose(
+        _gather_bucket_values(result, series_bid), [5.0, 2.0, np.nan, np.nan]
+    )
+
+
 def test_lookup_lag_compute_latest_from_aggs_nan_and_empty():
     """Fast predict path (_compute_latest_from_aggs): NaN when a bucket has
     fewer than `lag` occurrences or the looked-up occurrence has no valid
@@ -4463,3 +4668,276 @@ def test_lookup_lag_compute_latest_from_aggs_nan_and_empty():
 
     # No aggregates -> None (falls through to the slow path in core.py).
     assert tfm._compute_latest_from_aggs({}, {}) is None
+
+
+@pytest.mark.parametrize("time_agg", [None, "sum", "count", "mean", "min", "max"])
+@pytest.mark.parametrize(
+    "tfm_factory",
+    [
+        lambda m: RollingMean(window_size=3, min_samples=2, **m),
+        lambda m: RollingStd(window_size=4, **m),
+        lambda m: RollingMin(window_size=3, **m),
+        lambda m: RollingMax(window_size=5, min_samples=1, **m),
+        lambda m: ExpandingMean(**m),
+        lambda m: ExpandingStd(**m),
+        lambda m: ExpandingMin(**m),
+        lambda m: ExpandingMax(**m),
+        lambda m: ExponentiallyWeightedMean(alpha=0.3, **m),
+    ],
+)
+def test_compute_latest_from_aggs_matches_rows_after_extends(tfm_factory, time_agg):
+    """The latest values gathered over the flat aggregates match the row-level
+    path while the aggregates grow, and copies keep their own values."""
+    from mlforecast.pooled import _build_ts_aggs, _segment_aggregates
+
+    try:
+        tfm = tfm_factory({"groupby": ["g"], "time_agg": time_agg})
+    except ValueError:
+        pytest.skip("time_agg not accepted by this transform")
+    tfm._set_core_tfm(2)
+    rng = np.random.default_rng(0)
+    n_buckets = 6
+    # bucket 4 has no rows and bucket 5 only NaNs; ordinals have gaps
+    bid = rng.integers(0, 4, 200)
+    ordv = rng.choice(np.arange(0, 60, 2), 200)
+    bid = np.append(bid, [5, 5])
+    ordv = np.append(ordv, [0, 3])
+    y = rng.normal(size=bid.size)
+    y[rng.random(bid.size) < 0.2] = np.nan
+    y[-2:] = np.nan
+    aggs = _build_ts_aggs(bid, ordv, y)
+
+    def check(aggs, bid, ordv, y):
+        target_ords = {b: int(ordv[bid == b].max()) + 1 for b in np.unique(bid)}
+        result = tfm._compute_latest_from_aggs(aggs, target_ords)
+        query_bid = np.array(list(target_ords))
+        query_ord = np.array(list(target_ords.values()))
+        rows = tfm._compute_bucket_feature(
+            np.append(bid, query_bid),
+            np.append(ordv, query_ord),
+            np.append(y, np.full(query_bid.size, np.nan)),
+        )
+        np.testing.assert_allclose(
+            result[query_bid], rows[bid.size :], atol=1e-10, equal_nan=True
+        )
+        assert n_buckets - 2 not in aggs
+
+    check(aggs, bid, ordv, y)
+    snapshots = []
+    for step in range(4):
+        snapshots.append((copy.copy(aggs), bid, ordv, y))
+        new_bid = np.repeat(np.arange(4), step + 1)
+        new_ord = np.full(new_bid.size, 60 + step)
+        new_y = rng.normal(size=new_bid.size)
+        new_y[rng.random(new_bid.size) < 0.2] = np.nan
+        aggs.extend(*_segment_aggregates(new_bid, new_ord, new_y))
+        bid = np.append(bid, new_bid)
+        ordv = np.append(ordv, new_ord)
+        y = np.append(y, new_y)
+        check(aggs, bid, ordv, y)
+    for snapshot in snapshots:
+        check(*snapshot)
+
+
+def test_parent_calendars_match_per_parent_grids():
+    from mlforecast.pooled import _ParentCalendars
+
+    rng = np.random.default_rng(0)
+    n_parents = 5
+    pids = rng.integers(0, n_parents - 1, 200)  # last parent has no times
+    times = rng.integers(0, 30, 200)
+    pairs = np.unique(np.column_stack([pids, times]), axis=0)
+    cal = _ParentCalendars.from_pairs(pairs[:, 0], pairs[:, 1], n_parents)
+    expected = {pid: np.unique(times[pids == pid]) for pid in range(n_parents)}
+
+    def check():
+        assert list(cal) == list(expected)
+        for pid, grid in expected.items():
+            np.testing.assert_array_equal(cal[pid], grid)
+
+    check()
+    query_pids = rng.integers(0, n_parents, 50)
+    query_times = rng.integers(-5, 35, 50)
+    np.testing.assert_array_equal(
+        cal.positions(query_pids, query_times),
+        [np.searchsorted(expected[p], t) for p, t in zip(query_pids, query_times)],
+    )
+
+    snap = copy.copy(cal)
+    cal.insert_time(15)
+    for pid, grid in expected.items():
+        expected[pid] = np.union1d(grid, [15])
+    check()
+    np.testing.assert_array_equal(snap[0], np.unique(times[pids == 0]))
+
+    new_pids = np.array([4, 4, 1, 2])
+    new_times = np.array([40, 3, 41, 15])
+    cal.merge(new_pids, new_times)
+    for pid, t in zip(new_pids, new_times):
+        expected[pid] = np.union1d(expected[pid], [t])
+    check()
+
+    assert cal.add_parent() == n_parents
+    expected[n_parents] = np.array([], dtype=times.dtype)
+    check()
+
+    cal.trim_to_last(4)
+    for pid, grid in expected.items():
+        expected[pid] = grid[-4:]
+    check()
+
+
+def test_bucket_parents_mapping():
+    from mlforecast.pooled import _BucketParents
+
+    parents = _BucketParents.from_arrays(np.array([3, 0, 1]), np.array([1, 0, 1]))
+    assert dict(parents) == {0: 0, 1: 1, 3: 1}
+    assert 2 not in parents
+    np.testing.assert_array_equal(
+        parents.lookup(np.array([0, 2, 3, 7])), [0, -1, 1, -1]
+    )
+    snap = copy.copy(parents)
+    parents.assign(np.array([2, 5]), np.array([0, 2]))
+    assert dict(parents) == {0: 0, 1: 1, 2: 0, 3: 1, 5: 2}
+    assert dict(snap) == {0: 0, 1: 1, 3: 1}
+
+
+def test_key_index_lookup():
+    from mlforecast.pooled import _KeyIndex
+
+    a = np.array(["x", "y", "x", "z"])
+    b = np.array(["1", "1", "2", "1"])
+    index = _KeyIndex([a, b], np.array([10, 11, 12, 13]))
+    got = index.lookup(
+        [np.array(["x", "z", "y", "w", "x"]), np.array(["2", "1", "2", "1", "1"])]
+    )
+    np.testing.assert_array_equal(got, [12, 13, -1, -1, 10])
+    empty = _KeyIndex([a[:0]], np.array([], dtype=np.int64))
+    np.testing.assert_array_equal(empty.lookup([a]), [-1, -1, -1, -1])
+
+
+def test_pooled_features_multithreaded_match_sequential():
+    rng = np.random.default_rng(0)
+    n_series, n_times = 6, 20
+    df = pd.DataFrame(
+        {
+            "unique_id": np.repeat(np.arange(n_series), n_times),
+            "ds": np.tile(np.arange(n_times), n_series),
+            "y": rng.random(n_series * n_times),
+            "brand": np.repeat(["x", "y", "x", "z", "y", "x"], n_times),
+        }
+    )
+    lag_transforms = {
+        1: [
+            RollingMean(3, global_=True),
+            RollingStd(3, groupby=["brand"]),
+            RollingMin(4, groupby=["brand"]),
+            ExpandingMean(groupby=["brand"]),
+        ],
+        2: [RollingMax(2, global_=True)],
+    }
+    results = []
+    for num_threads in (1, 4):
+        ts = TimeSeries(freq=1, lag_transforms=lag_transforms, num_threads=num_threads)
+        prep = ts.fit_transform(
+            df,
+            id_col="unique_id",
+            time_col="ds",
+            target_col="y",
+            dropna=False,
+            static_features=["brand"],
+        )
+        ts._predict_setup()
+        results.append((prep, ts._update_features()))
+    pd.testing.assert_frame_equal(results[0][0], results[1][0])
+    pd.testing.assert_frame_equal(results[0][1], results[1][1])
+
+
+def test_pooled_kernels_split_ranges_across_threads(monkeypatch):
+    """A single pooled key splits the ranges of its queries across the threads,
+    so the rows of one bucket are computed concurrently."""
+    import threading
+
+    from mlforecast import lag_transforms as lt
+
+    rng = np.random.default_rng(0)
+    n_series, n_times = 4, 50
+    df = pd.DataFrame(
+        {
+            "unique_id": np.repeat(np.arange(n_series), n_times),
+            "ds": np.tile(np.arange(n_times), n_series),
+            "y": rng.random(n_series * n_times),
+            "brand": "x",
+        }
+    )
+    lag_transforms = {1: [RollingMean(3, groupby=["brand"])]}
+    kwargs = dict(
+        id_col="unique_id",
+        time_col="ds",
+        target_col="y",
+        dropna=False,
+        static_features=["brand"],
+    )
+    expected = TimeSeries(freq=1, lag_transforms=lag_transforms).fit_transform(
+        df, **kwargs
+    )
+
+    monkeypatch.setattr(lt, "_MIN_RANGE_SIZE", 8)
+    count_at_or_before = lt._count_at_or_before
+    # only passes when two ranges run at the same time
+    barrier = threading.Barrier(2, timeout=30)
+    threads = set()
+
+    def spy(times, starts, lens, bucket_ids, bounds, out, start, end):
+        if end - start < bucket_ids.size:
+            threads.add(threading.get_ident())
+            barrier.wait()
+        count_at_or_before(times, starts, lens, bucket_ids, bounds, out, start, end)
+
+    monkeypatch.setattr(lt, "_count_at_or_before", spy)
+    monkeypatch.setattr(lt, "_jitted_count_at_or_before", spy)
+    ts = TimeSeries(freq=1, lag_transforms=lag_transforms, num_threads=2)
+    pd.testing.assert_frame_equal(ts.fit_transform(df, **kwargs), expected)
+    assert len(threads) == 2
+
+
+def test_predict_reuses_one_thread_pool(monkeypatch):
+    """Every step of a predict call computes the pooled features on one pool."""
+    import concurrent.futures
+
+    from sklearn.linear_model import LinearRegression
+
+    from mlforecast import MLForecast
+
+    rng = np.random.default_rng(0)
+    n_series, n_times = 6, 20
+    df = pd.DataFrame(
+        {
+            "unique_id": np.repeat(np.arange(n_series), n_times),
+            "ds": np.tile(np.arange(n_times), n_series),
+            "y": rng.random(n_series * n_times),
+            "brand": np.repeat(["x", "y", "x", "z", "y", "x"], n_times),
+        }
+    )
+    fcst = MLForecast(
+        models=[LinearRegression()],
+        freq=1,
+        lags=[1],
+        lag_transforms={
+            1: [RollingMean(3, global_=True), RollingStd(3, groupby=["brand"])]
+        },
+        num_threads=2,
+    )
+    fcst.fit(df, static_features=["brand"])
+    expected = fcst.predict(5)
+    pools = []
+
+    class CountingPool(concurrent.futures.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", CountingPool)
+    pd.testing.assert_frame_equal(fcst.predict(5), expected)
+    assert len(pools) == 1
+    assert fcst.ts._pooled_pool is None
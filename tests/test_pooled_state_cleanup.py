@@ -102,6 +102,20 @@ def _agg_arrays(agg):
     return [agg.unique_times, agg.sums, agg.counts, agg.sum_sq, agg.mins, agg.maxs]
 
 
+def _assert_key_indexes_equal(got, ref):
+    """The key indexes cached for the current ``groups`` match fresh ones."""
+    for cache_key, (frame, index) in got._key_indexes.items():
+        if frame is not got.groups:
+            # stale entries are rebuilt on their next use
+            continue
+        ref_index = ref._key_index(*cache_key)
+        np.testing.assert_array_equal(index.ids, ref_index.ids)
+        for got_arr, ref_arr in zip(
+            index.levels + index.combos, ref_index.levels + ref_index.combos
+        ):
+            np.testing.assert_array_equal(got_arr, ref_arr)
+
+
 def _assert_state_equal(got, ref):
     """Field-by-field equality of two PooledStates (mutable fields)."""
     for f in ("series_bucket_id", "bucket_id", "time", "time_index", "y"):
@@ -112,10 +126,16 @@ def _assert_state_equal(got, ref):
         np.testing.assert_array_equal(
             got._idsorted_to_bucket_pos, ref._idsorted_to_bucket_pos
         )
-    assert got.next_time_index_by_bucket == ref.next_time_index_by_bucket
-    assert got._bucket_to_parent_id == ref._bucket_to_parent_id
-    assert got._parent_to_buckets == ref._parent_to_buckets
-    assert got._scope_key_to_parent_id == ref._scope_key_to_parent_id
+    np.testing.assert_array_equal(
+        got.next_time_index_by_bucket.ords, ref.next_time_index_by_bucket.ords
+    )
+    if ref._bucket_to_parent_id is None:
+        assert got._bucket_to_parent_id is None
+    else:
+        np.testing.assert_array_equal(
+            got._bucket_to_parent_id.parent_ids, ref._bucket_to_parent_id.parent_ids
+        )
+    _assert_key_indexes_equal(got, ref)
     # bucket_df / groups grow on append / new buckets; a missed restore would
     # change their length.
     assert len(got.bucket_df) == len(ref.bucket_df)
@@ -352,6 +352,46 @@ def test_ess_no_warning_identical_distributions(transfer_cp_setup):
     assert len(ess_warnings) == 0, f"Unexpected ESS warnings: {ess_warnings}"
 
 
+def test_weighted_conformal_reuses_density_ratio(transfer_cp_setup, monkeypatch):
+    """Repeated predictions against the same target fit the density ratio once."""
+    import mlforecast.conformal_prediction as cp
+
+    mlf, target_train, _ = transfer_cp_setup
+    calls = []
+    original = cp.estimate_density_ratio
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(cp, "estimate_density_ratio", counting)
+    mlf.clear_transfer_cache()
+    tc = TransferConformal(method="weighted_conformal")
+    first = mlf.predict(
+        h=HORIZON, level=[80], new_df=target_train, transfer_conformal=tc
+    )
+    second = mlf.predict(
+        h=HORIZON, level=[80, 95], new_df=target_train, transfer_conformal=tc
+    )
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second[first.columns])
+
+    # another target or other estimator settings are estimated separately
+    other_target = target_train.groupby("unique_id", observed=True).head(300)
+    mlf.predict(h=HORIZON, level=[80], new_df=other_target, transfer_conformal=tc)
+    mlf.predict(
+        h=HORIZON,
+        level=[80],
+        new_df=target_train,
+        transfer_conformal=TransferConformal(method="weighted_conformal", cv=3),
+    )
+    assert len(calls) == 3
+
+    mlf.clear_transfer_cache()
+    mlf.predict(h=HORIZON, level=[80], new_df=target_train, transfer_conformal=tc)
+    assert len(calls) == 4
+
+
 # ---------------------------------------------------------------------------
 # Task 2: _frozen_backtest
 # ---------------------------------------------------------------------------